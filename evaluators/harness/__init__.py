@@ -0,0 +1,23 @@
+"""Shared test harness for the Python evaluators.
+
+Evaluators put evaluators/ on sys.path and import from here:
+
+    from harness import Suite
+
+    suite = Suite('task_01_caesar_cipher')
+
+    def main():
+        sol = suite.load_solution('caesar.py')
+        suite.check("encode lowercase", lambda: sol.encode("hello", 3), "khoor")
+        suite.finish()
+"""
+from .artifacts import ARTIFACT_DIR_ENV, artifact_dir, artifact_path, prune_artifacts
+from .calibration import SPEED_FACTOR_ENV, speed_factor
+from .complexity import COMPLEXITY_CLASSES, fit_complexity, measure_scaling
+from .core import (ISOLATE_ENV, NEAR_LIMIT_FACTOR, TIMING_MARKER, Failure, Suite, Test,
+                   TimingFailure, call_in_child, call_with_timeout, measure_peak,
+                   timing_failure)
+from .fixtures import Fixture
+from .opcount import count_ops
+from .profiling import PROFILE_DIR_ENV
+from .toolchain import TOOLCHAIN_ENV, find_binary, runner_toolchain
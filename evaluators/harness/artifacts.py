@@ -0,0 +1,65 @@
+"""Files evaluators keep between runs: compiled classes, build output, datasets.
+
+Each task gets its own directory under $BENCH_ARTIFACT_DIR, or under
+.bench_cache/artifacts/ by default.  Entries keyed on a content hash (a
+directory named by a sha256 hex digest) pile up as solutions change, so they
+are pruned least recently used first:
+
+    out_dir = artifact_path(ARTIFACT_DIR, artifact_key(sources, javac))
+    if not os.path.isdir(out_dir):
+        compile_into(out_dir)
+        prune_artifacts(ARTIFACT_DIR)
+
+Anything else in the directory, such as a shared project directory or a
+versioned data snapshot, is left alone.
+"""
+import os
+import re
+import shutil
+import time
+
+ARTIFACT_DIR_ENV = 'BENCH_ARTIFACT_DIR'
+
+# Hash-keyed entries kept per task, and how long an unused one survives.
+# An entry is a few hundred KB, so a task's directory stays in the tens of MB
+# however many submissions are graded.
+MAX_ARTIFACTS = 64
+MAX_ARTIFACT_AGE = 7 * 24 * 3600  # seconds
+
+_KEY_RE = re.compile(r'[0-9a-f]{64}')
+
+
+def artifact_dir(task_name):
+    """The directory task_name's artifacts go in; it is not created here."""
+    root = os.environ.get(ARTIFACT_DIR_ENV) or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), '..', '..', '.bench_cache', 'artifacts')
+    return os.path.join(root, task_name)
+
+
+def artifact_path(directory, key):
+    """Path of the entry for key in directory, marked as used if it exists."""
+    path = os.path.join(directory, key)
+    try:
+        os.utime(path)
+    except OSError:
+        pass  # not built yet
+    return path
+
+
+def prune_artifacts(directory, keep=MAX_ARTIFACTS, max_age=MAX_ARTIFACT_AGE):
+    """Remove the hash-keyed entries past the keep most recently used ones,
+    and any not used for max_age seconds."""
+    entries = []
+    for name in os.listdir(directory):
+        if not _KEY_RE.fullmatch(name):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            entries.append((os.stat(path).st_mtime, path))
+        except OSError:
+            pass  # removed by a concurrent prune
+    entries.sort(reverse=True)
+    cutoff = time.time() - max_age
+    for i, (mtime, path) in enumerate(entries):
+        if i >= keep or mtime < cutoff:
+            shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,122 @@
+"""Host speed calibration for performance thresholds.
+
+Perf limits in the evaluators are seconds on the reference machine.  A fixed
+pure-Python workload is timed once per host; its time divided by
+REFERENCE_SECONDS is the host's speed factor, which scales every limit and
+turns raw timings into normalised (reference-machine) ones.
+
+This module imports nothing from the rest of the harness so that
+run_benchmarks.py can load it by path and calibrate before any evaluator
+starts, then hand the factor down in $BENCH_SPEED_FACTOR.
+"""
+import json
+import math
+import os
+import platform
+import socket
+import sys
+import time
+
+SPEED_FACTOR_ENV = 'BENCH_SPEED_FACTOR'
+
+# Best-of-REPEATS time of reference_workload() on the reference machine.
+# Changing the workload means re-measuring this and bumping WORKLOAD_VERSION.
+REFERENCE_SECONDS = 0.035
+WORKLOAD_VERSION = 1
+REPEATS = 7
+
+# Factors are rounded to the nearest power of FACTOR_STEP.  Calibrations of
+# one host differ by a few percent; rounded, they nearly always agree, so
+# re-measuring leaves perf limits and the runner's cached results alone.
+FACTOR_STEP = 1.1
+
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          '..', '..', '.bench_cache', 'calibration.json')
+
+
+def reference_workload():
+    """Interpreter-bound mix of loops, integer arithmetic, dict and str work."""
+    counts = {}
+    total = 0
+    for i in range(200_000):
+        key = i % 1009
+        counts[key] = counts.get(key, 0) + i
+        total += i * i % 7
+    words = [str(v) for v in sorted(counts.values())]
+    return total + len(" ".join(words))
+
+
+def measure(repeats=REPEATS):
+    """Best-of-repeats wall time of reference_workload(), in seconds.
+
+    The minimum is the run least disturbed by other load, which is the
+    closest thing to the host's actual speed.
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        reference_workload()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def factor_for(seconds):
+    """The speed factor for a workload time: its ratio to the reference, rounded."""
+    steps = round(math.log(seconds / REFERENCE_SECONDS) / math.log(FACTOR_STEP))
+    return round(FACTOR_STEP ** steps, 2)
+
+
+def host_key():
+    """What a calibration is valid for: this host, CPU and interpreter."""
+    return "|".join([
+        f"workload={WORKLOAD_VERSION}", socket.gethostname(), platform.machine(),
+        platform.processor(), str(os.cpu_count()), sys.executable, sys.version,
+    ])
+
+
+def calibrate(cache_file=CACHE_FILE, use_cache=True):
+    """Return {'seconds': ..., 'factor': ...}, measuring only on a cache miss.
+
+    With use_cache=False the workload is re-timed, but this host's previous
+    factor is kept unless the new one is more than one step away from it, so
+    timings straddling a step boundary cannot flip it back and forth.
+    """
+    key = host_key()
+    try:
+        with open(cache_file) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    previous = data.get('factor') if data.get('key') == key else None
+    if use_cache and previous is not None:
+        return {'seconds': data['seconds'], 'factor': previous}
+    seconds = measure()
+    factor = factor_for(seconds)
+    if previous and abs(math.log(factor / previous)) < 1.5 * math.log(FACTOR_STEP):
+        factor = previous
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump({'key': key, 'seconds': seconds, 'factor': factor}, f)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass  # a read-only checkout just re-measures next time
+    return {'seconds': seconds, 'factor': factor}
+
+
+def speed_factor():
+    """The factor from $BENCH_SPEED_FACTOR, or from calibrating this host."""
+    value = os.environ.get(SPEED_FACTOR_ENV)
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return calibrate()['factor']
+
+
+if __name__ == '__main__':
+    result = calibrate(use_cache='--force' not in sys.argv)
+    print(f"reference workload {result['seconds'] * 1000:.1f}ms, "
+          f"speed factor {result['factor']:.2f}")
@@ -0,0 +1,148 @@
+"""Empirical complexity classes: time a function over growing inputs and fit.
+
+A single perf check at one input size cannot tell a fast O(n^2) solution
+from a slow O(n) one.  measure_scaling() times fn over a geometric series of
+sizes and fit_complexity() picks the class whose curve a + b*f(n) fits the
+timings best (least squares on relative error), so evaluators can assert an
+upper bound:
+
+    suite.check_complexity("has_duplicates scaling", sol.has_duplicates,
+                           lambda n: (list(range(n)),), "O(n log n)")
+"""
+import gc
+import math
+import statistics
+import time
+
+# Simplest first; a class's index is its rank.
+COMPLEXITY_CLASSES = [
+    ("O(1)", lambda n: 1.0),
+    ("O(log n)", lambda n: math.log(n)),
+    ("O(n)", lambda n: float(n)),
+    ("O(n log n)", lambda n: n * math.log(n)),
+    ("O(n^2)", lambda n: float(n) ** 2),
+]
+CLASS_NAMES = [name for name, _ in COMPLEXITY_CLASSES]
+
+# 1k .. 64k: wide enough to separate n log n from n^2, small enough that a
+# linear solution in pure Python finishes each call in milliseconds.
+DEFAULT_SIZES = [1000 * 2 ** k for k in range(7)]
+MIN_POINTS = 4
+
+# A simpler class wins unless a more complex one fits clearly better: its mean
+# squared relative error must be within TIE_TOLERANCE times the best plus
+# RELATIVE_NOISE squared.  Over a 64x range O(n) and O(n log n) are hard to
+# tell apart, and the benefit of the doubt belongs to the solution.
+TIE_TOLERANCE = 1.25
+RELATIVE_NOISE = 0.05
+
+# A bound is only failed when a class above it fits clearly better than every
+# class within it: FAIL_MARGIN times lower error, plus FAIL_NOISE squared.
+# A solution near its bound that the tie rule above would class one step up
+# is given the benefit of the doubt rather than a noise-driven failure.
+FAIL_MARGIN = 4.0
+FAIL_NOISE = 0.10
+
+# Timings below this are mostly timer and scheduler noise; errors on them are
+# measured relative to the floor rather than to the timing itself.
+NOISE_FLOOR_S = 20e-6
+
+
+def rank(name):
+    """Position of a class name in COMPLEXITY_CLASSES; ValueError if unknown."""
+    try:
+        return CLASS_NAMES.index(name)
+    except ValueError:
+        raise ValueError(f"unknown complexity class {name!r} "
+                         f"(expected one of {', '.join(CLASS_NAMES)})") from None
+
+
+def measure_scaling(fn, make_args, sizes=DEFAULT_SIZES, budget_s=2.0, repeats=5):
+    """Return [(n, seconds)] for fn(*make_args(n)) over increasing sizes.
+
+    Each size is timed `repeats` times on fresh arguments (built outside the
+    timed region) with the garbage collector off, as timeit does, and the
+    median call kept: unlike the minimum it is not set by one lucky run, and
+    unlike the mean not by one preempted one.  Measurement stops once the
+    calls have used up budget_s, so an O(n^2) solution yields its first few
+    sizes instead of running for minutes.
+    """
+    points = []
+    spent = 0.0
+    gc_was_enabled = gc.isenabled()
+    try:
+        for n in sizes:
+            times = []
+            for _ in range(repeats):
+                args = make_args(n)
+                gc.disable()
+                t0 = time.perf_counter()
+                fn(*args)
+                elapsed = time.perf_counter() - t0
+                if gc_was_enabled:
+                    gc.enable()
+                times.append(elapsed)
+                spent += elapsed
+                if spent > budget_s:
+                    break
+            points.append((n, statistics.median(times)))
+            if spent > budget_s:
+                break
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return points
+
+
+def _fit(points, f):
+    """Fit a + b*f(n), b >= 0, minimising squared relative error.
+
+    Returns the squared relative error of each point.  Weighting by 1/t^2
+    keeps the largest size, whose timing is also the noisiest in absolute
+    terms, from deciding the fit on its own.
+    """
+    xs = [f(n) for n, _ in points]
+    ys = [t for _, t in points]
+    ws = [1.0 / max(y, NOISE_FLOOR_S) ** 2 for y in ys]
+    sw = sum(ws)
+    x_mean = sum(w * x for w, x in zip(ws, xs)) / sw
+    y_mean = sum(w * y for w, y in zip(ws, ys)) / sw
+    sxx = sum(w * (x - x_mean) ** 2 for w, x in zip(ws, xs))
+    sxy = sum(w * (x - x_mean) * (y - y_mean) for w, x, y in zip(ws, xs, ys))
+    b = max(sxy / sxx, 0.0) if sxx else 0.0
+    a = y_mean - b * x_mean
+    return [w * (a + b * x - y) ** 2 for w, x, y in zip(ws, xs, ys)]
+
+
+def _robust_error(points, f):
+    """Mean squared relative error of the fit, refitted without its worst point.
+
+    A single timing spike (a preemption at one size) then cannot pull the fit
+    towards a steeper class.  With MIN_POINTS or fewer every point is kept.
+    """
+    residuals = _fit(points, f)
+    if len(points) > MIN_POINTS:
+        worst = residuals.index(max(residuals))
+        residuals = _fit(points[:worst] + points[worst + 1:], f)
+    return sum(residuals) / len(residuals)
+
+
+def fit_errors(points):
+    """Robust fit error of every class in COMPLEXITY_CLASSES, in order."""
+    return [_robust_error(points, f) for _, f in COMPLEXITY_CLASSES]
+
+
+def fit_complexity(points):
+    """Name of the simplest class that explains [(n, seconds)] points well."""
+    errors = fit_errors(points)
+    cutoff = min(errors) * TIE_TOLERANCE + RELATIVE_NOISE ** 2
+    return next(name for name, error in zip(CLASS_NAMES, errors) if error <= cutoff)
+
+
+def clearly_exceeds(points, max_class):
+    """Whether a class above max_class fits the points clearly better than any up to it."""
+    errors = fit_errors(points)
+    bound = rank(max_class) + 1
+    if bound >= len(errors):
+        return False
+    return min(errors[:bound]) > min(errors[bound:]) * FAIL_MARGIN + FAIL_NOISE ** 2
@@ -0,0 +1,537 @@
+"""Test registry, checks and [PASS]/[FAIL] reporting."""
+import argparse
+import fnmatch
+import importlib.util
+import os
+import pickle
+import queue
+import select
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from . import complexity, opcount, profiling
+from .calibration import speed_factor
+from .fixtures import Fixture
+
+# Set by run_benchmarks.py --test; the evaluator's own --test flag wins.
+TEST_FILTER_ENV = 'BENCH_TEST_FILTER'
+
+# "1" or "0"; overrides the isolate= argument each evaluator passes to Suite.
+# run_benchmarks.py --isolate sets "1"; "0" is for running an evaluator by
+# hand with its timed checks in threads.
+ISOLATE_ENV = 'BENCH_ISOLATE'
+
+
+# Separates a test's name from its pass detail or failure message on
+# [PASS]/[FAIL] lines, so the runner can key results on the name alone even
+# when the name contains ": " or the detail changes from run to run.
+DETAIL_SEP = '\t'
+
+# Printed by finish() when a failure depended on how fast the host ran; the
+# runner does not cache such results, so a noisy run is not replayed.
+TIMING_MARKER = '[TIMING]'
+
+# A perf failure depends on how fast the host ran only when it came within
+# this factor of its limit; a quieter run could pass it.  Slower results and
+# hard timeouts are clear misses and are cached like any other failure.
+NEAR_LIMIT_FACTOR = 2.0
+
+
+class Failure(Exception):
+    """Raised by a test body to fail the test with the given message."""
+
+
+class TimingFailure(Failure):
+    """A failure judged on wall-clock time that host noise may have decided,
+    such as a perf limit missed by a small margin."""
+
+
+def timing_failure(message, elapsed, limit):
+    """The failure for elapsed over limit: a TimingFailure if it came within
+    NEAR_LIMIT_FACTOR of limit, a plain Failure otherwise."""
+    if elapsed <= limit * NEAR_LIMIT_FACTOR:
+        return TimingFailure(message)
+    return Failure(message)
+
+
+@dataclass
+class Test:
+    """A registered test: body() returns an optional pass detail or raises.
+
+    A test with a timeout is run through Suite.call and fails once it is over.
+    """
+    name: str
+    body: object
+    timeout: float = None
+
+
+def call_with_timeout(fn, timeout):
+    """Run fn() in a daemon thread.
+
+    Returns:
+        ('ok', value)      — fn() returned normally
+        ('err', exception) — fn() raised an exception
+        ('timeout', None)  — fn() did not finish within timeout seconds
+
+    Under --profile fn() runs inline instead, so the profiler sees it, and
+    the timeout is enforced with SIGALRM where available.
+    """
+    if profiling.active():
+        return _call_inline(fn, timeout)
+
+    result_q = queue.Queue()
+
+    def worker():
+        try:
+            result_q.put(('ok', fn()))
+        except Exception as e:
+            result_q.put(('err', e))
+
+    t = threading.Thread(target=worker, daemon=True)
+    t.start()
+    t.join(timeout)
+    if t.is_alive():
+        return 'timeout', None
+    try:
+        return result_q.get_nowait()
+    except queue.Empty:
+        return 'timeout', None
+
+
+def _elapsed(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def measure_peak(fn):
+    """Call fn() under tracemalloc.
+
+    Returns (result, peak) where peak is the most memory, in bytes, that was
+    allocated at any one time during the call beyond what was live before it.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result, peak - before
+
+
+def _fmt_bytes(n):
+    if n < 1024:
+        return f"{n}B"
+    for unit in ('KB', 'MB', 'GB'):
+        n /= 1024
+        if n < 1024 or unit == 'GB':
+            return f"{n:.1f}{unit}"
+
+
+class _AlarmTimeout(BaseException):
+    """Raised into fn() by SIGALRM; a BaseException so `except Exception` in
+    solution code cannot swallow it."""
+
+
+def _call_inline(fn, timeout):
+    """call_with_timeout() on the calling thread."""
+    use_alarm = (hasattr(signal, 'setitimer')
+                 and threading.current_thread() is threading.main_thread())
+    if use_alarm:
+        def on_alarm(signum, frame):
+            raise _AlarmTimeout
+        previous = signal.signal(signal.SIGALRM, on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return 'ok', fn()
+    except _AlarmTimeout:
+        return 'timeout', None
+    except Exception as e:
+        return 'err', e
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+
+def call_in_child(fn, timeout):
+    """Run fn() in a forked child that is SIGKILLed at the deadline.
+
+    Returns the same tuples as call_with_timeout(); the value or exception
+    comes back pickled over a pipe, so it must be picklable (exceptions that
+    are not are sent as a Failure carrying their message).  A timed-out
+    child cannot keep burning CPU, unlike a daemon thread, so the tests that
+    follow are timed on an idle core.  Side effects of fn() stay in the child.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    r, w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(r)
+            try:
+                outcome = ('ok', fn())
+            except Exception as e:
+                outcome = ('err', e)
+            try:
+                data = pickle.dumps(outcome)
+            except Exception as e:
+                kind, value = outcome
+                if kind == 'err':
+                    value = Failure(f"{type(value).__name__}: {value}")
+                else:
+                    value = Failure(f"result could not be sent back: {type(e).__name__}: {e}")
+                data = pickle.dumps(('err', value))
+            with os.fdopen(w, 'wb') as f:
+                f.write(data)
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(0)
+
+    os.close(w)
+    deadline = time.monotonic() + timeout if timeout else None
+    chunks = []
+    try:
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                os.kill(pid, signal.SIGKILL)
+                return 'timeout', None
+            ready, _, _ = select.select([r], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(r, 1 << 16)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(r)
+        _, status = os.waitpid(pid, 0)
+    if not chunks:
+        return 'err', Failure(f"test process died without a result ({_describe_status(status)})")
+    return pickle.loads(b''.join(chunks))
+
+
+def _describe_status(status):
+    if os.WIFSIGNALED(status):
+        sig = os.WTERMSIG(status)
+        try:
+            return f"killed by {signal.Signals(sig).name}"
+        except ValueError:
+            return f"killed by signal {sig}"
+    return f"exit code {os.WEXITSTATUS(status)}"
+
+
+class Suite:
+    """The tests of one evaluator.
+
+    Tests run as soon as they are registered, in evaluator order, so setup
+    code between checks sees the same state it always did.  Tests whose name
+    does not match the --test pattern are registered but not run, and
+    --list prints the registered names without running anything.
+
+    With isolate=True, timed calls (check_perf and friends, and any test
+    given a timeout) run in a forked child that is killed at its deadline,
+    instead of a daemon thread that outlives it.  timeout is the default for
+    check, validate and check_raises; None means no limit.
+    """
+
+    def __init__(self, task_name, argv=None, isolate=False, timeout=None):
+        tasks_root = os.environ.get('BENCH_TASKS_DIR') or os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), '..', '..', 'tasks')
+        self.task_dir = os.path.join(tasks_root, task_name)
+        parser = argparse.ArgumentParser(description=f"Evaluate {task_name}")
+        parser.add_argument('--test', metavar='PATTERN',
+                            default=os.environ.get(TEST_FILTER_ENV),
+                            help="Run only tests whose name contains PATTERN "
+                                 "(shell wildcards allowed)")
+        parser.add_argument('--list', action='store_true',
+                            help="Print the test names instead of running them")
+        args, _ = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+        self.pattern = args.test
+        self.listing = args.list
+        self.tests = []
+        self.passed = []
+        self.failed = []
+        self.timing_failed = []
+        self._speed_factor = None
+        self.timeout = timeout
+        self.isolate = isolate
+        if os.environ.get(ISOLATE_ENV) in ('0', '1'):
+            self.isolate = os.environ[ISOLATE_ENV] == '1'
+        self.isolate = self.isolate and hasattr(os, 'fork')
+        self.profile = None
+        profile_dir = os.environ.get(profiling.PROFILE_DIR_ENV)
+        if profile_dir and not self.listing:
+            self.profile = profiling.start(profile_dir, task_name, self.task_dir)
+
+    # ── Registry ────────────────────────────────────────────────────────────
+
+    def selected(self, name):
+        return not self.pattern or fnmatch.fnmatchcase(name, f"*{self.pattern}*")
+
+    def add(self, name, body, timeout=None):
+        """Register a test and run it unless it is filtered out."""
+        if DETAIL_SEP in name:
+            raise ValueError(f"test name {name!r} contains a tab")
+        test = Test(name, body, timeout)
+        self.tests.append(test)
+        if self.listing:
+            print(name)
+        elif self.selected(name):
+            self.run(test)
+        return test
+
+    def run(self, test):
+        try:
+            if test.timeout is None:
+                detail = test.body()
+            else:
+                kind, detail = self.call(test.body, test.timeout)
+                if kind == 'timeout':
+                    raise Failure(f"timed out after {test.timeout}s")
+                if kind == 'err':
+                    raise detail
+        except Failure as e:
+            self._fail(test.name, str(e), isinstance(e, TimingFailure))
+        except NotImplementedError:
+            self._fail(test.name, "not implemented")
+        except Exception as e:
+            self._fail(test.name, f"{type(e).__name__}: {e}")
+        else:
+            suffix = f"{DETAIL_SEP}({detail})" if detail else ""
+            print(f"[PASS] {test.name}{suffix}")
+            self.passed.append(test.name)
+
+    def _fail(self, name, message, timing=False):
+        print(f"[FAIL] {name}:{DETAIL_SEP}{message}")
+        self.failed.append(name)
+        if timing:
+            self.timing_failed.append(name)
+
+    def finish(self):
+        """Print the results line and exit 0 if every test that ran passed."""
+        if self.listing:
+            sys.exit(0)
+        if self.profile is not None:
+            self.profile.save()
+        total = len(self.passed) + len(self.failed)
+        skipped = len(self.tests) - total
+        note = f" ({skipped} filtered out)" if skipped else ""
+        if self.timing_failed:
+            print(f"{TIMING_MARKER} {len(self.timing_failed)} failure(s) depend on timing")
+        print(f"\nResults: {len(self.passed)}/{total} tests passed{note}")
+        sys.exit(0 if not self.failed else 1)
+
+    def call(self, fn, timeout):
+        """call_with_timeout(), in a killable child process if the suite isolates.
+
+        Under --profile everything stays in this process so the profiler
+        sees it.
+        """
+        if self.isolate and not profiling.active():
+            return call_in_child(fn, timeout)
+        return call_with_timeout(fn, timeout)
+
+    # ── Solutions ───────────────────────────────────────────────────────────
+
+    def load_solution(self, filename, module_name=None):
+        """Import filename from the task directory as a fresh module.
+
+        Exits with a [FAIL] line if the file does not exist.
+        """
+        path = os.path.join(self.task_dir, filename)
+        if not os.path.exists(path):
+            print(f"[FAIL] {filename} not found")
+            sys.exit(1)
+        name = module_name or os.path.splitext(filename)[0]
+        spec = importlib.util.spec_from_file_location(name, path)
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        return mod
+
+    def fixture(self, build=None, copy=None):
+        """Memoise build() for the rest of the run (see fixtures.py).
+
+        copy, if given, is applied to the shared value on every call, so each
+        check gets its own.  Also usable as a decorator, with or without
+        arguments.
+        """
+        if build is None:
+            return lambda build: Fixture(build, copy)
+        return Fixture(build, copy)
+
+    # ── Timing ──────────────────────────────────────────────────────────────
+
+    @property
+    def speed_factor(self):
+        """How much slower this host is than the reference machine (see calibration)."""
+        if self._speed_factor is None:
+            self._speed_factor = speed_factor()
+        return self._speed_factor
+
+    def perf_limit(self, limit_s, scale_down=True):
+        """limit_s, given for the reference machine, in seconds on this host.
+
+        With scale_down=False a host faster than the reference keeps limit_s
+        as is: for work the pure-Python calibration workload does not
+        predict, such as a database engine's C code.
+        """
+        factor = self.speed_factor if scale_down else max(self.speed_factor, 1.0)
+        return limit_s * factor
+
+    def judge_time(self, elapsed, limit_s, scale_down=True):
+        """Fail if elapsed exceeds the host-scaled limit_s; return the pass detail.
+
+        Both the raw and the normalised (reference-machine) time are reported.
+        """
+        normalised = elapsed / self.speed_factor
+        limit = self.perf_limit(limit_s, scale_down)
+        if elapsed > limit:
+            raise timing_failure(f"took {elapsed:.2f}s ({normalised:.2f}s normalised, "
+                                 f"limit {limit_s}s)", elapsed, limit)
+        return f"{elapsed*1000:.1f}ms, {normalised*1000:.1f}ms normalised"
+
+    # ── Checks ──────────────────────────────────────────────────────────────
+
+    def check(self, name, fn, expected, timeout=None):
+        """Pass if fn() == expected."""
+        def body():
+            got = fn()
+            if got != expected:
+                raise Failure(f"expected {expected!r}, got {got!r}")
+        return self.add(name, body, timeout or self.timeout)
+
+    def validate(self, name, fn, validator, timeout=None):
+        """Pass if validator(fn()) returns (True, _); on failure report its message."""
+        def body():
+            got = fn()
+            ok, msg = validator(got)
+            if not ok:
+                raise Failure(f"{msg} (got {got!r})")
+        return self.add(name, body, timeout or self.timeout)
+
+    def check_raises(self, name, fn, exc_type, timeout=None):
+        """Pass if fn() raises exc_type."""
+        def body():
+            try:
+                fn()
+            except exc_type:
+                return None
+            except Exception as e:
+                raise Failure(f"expected {exc_type.__name__}, got {type(e).__name__}: {e}")
+            raise Failure(f"expected {exc_type.__name__}, got no exception")
+        return self.add(name, body, timeout or self.timeout)
+
+    def check_perf(self, name, fn, limit_s):
+        """Time fn() through call(); fail if over limit_s or if it hangs.
+
+        limit_s is for the reference machine and is scaled to this host.
+        """
+        def body():
+            hard_limit = max(self.perf_limit(limit_s) * 5, 5.0)
+            kind, val = self.call(lambda: _elapsed(fn), hard_limit)
+            if kind == 'timeout':
+                raise Failure(f"timed out (limit {limit_s}s)")
+            if kind == 'err':
+                raise val
+            return self.judge_time(val, limit_s)
+        return self.add(name, body)
+
+    def check_memory(self, name, fn, limit_bytes, make_args=None, timeout_s=30.0):
+        """Pass if the peak allocation during fn(*make_args()) stays within limit_bytes.
+
+        make_args builds the inputs before tracing starts, so they do not
+        count towards the peak.  Memory is traced with tracemalloc, which
+        slows the call down, so no timing is reported; timeout_s (scaled to
+        this host) only guards against hangs.  limit_bytes may be a function,
+        called when the check runs, for a limit measured from a reference
+        that should not be built if the check is filtered out.
+        """
+        def body():
+            limit = limit_bytes() if callable(limit_bytes) else limit_bytes
+            args = make_args() if make_args else ()
+            kind, peak = self.call(lambda: measure_peak(lambda: fn(*args))[1],
+                                   self.perf_limit(timeout_s))
+            if kind == 'timeout':
+                raise Failure(f"timed out (limit {timeout_s}s)")
+            if kind == 'err':
+                raise peak
+            if peak > limit:
+                raise Failure(f"peak {_fmt_bytes(peak)} (limit {_fmt_bytes(limit)})")
+            return f"peak {_fmt_bytes(peak)}, limit {_fmt_bytes(limit)}"
+        return self.add(name, body)
+
+    def check_ops(self, name, fn, max_calls=None, max_lines=None, max_loops=None,
+                  make_args=None, timeout_s=30.0):
+        """Pass if fn(*make_args()) stays within deterministic op-count limits.
+
+        Calls, executed lines and loop iterations are counted in the task
+        directory's code only (see opcount.py), so the result does not depend
+        on the host.  Counting stops at the first limit exceeded; timeout_s
+        (scaled to this host) only guards against hangs outside the solution.
+        """
+        budget = {counter: limit for counter, limit in
+                  (('calls', max_calls), ('lines', max_lines), ('loops', max_loops))
+                  if limit is not None}
+        if not budget:
+            raise ValueError("check_ops needs max_calls, max_lines or max_loops")
+
+        def body():
+            args = make_args() if make_args else ()
+            kind, val = self.call(
+                lambda: opcount.count_ops(lambda: fn(*args), self.task_dir, budget),
+                self.perf_limit(timeout_s))
+            if kind == 'timeout':
+                raise Failure(f"timed out (limit {timeout_s}s)")
+            if kind == 'err':
+                raise val
+            counts, exceeded = val
+            if exceeded:
+                raise Failure(f"more than {budget[exceeded]:,} {exceeded} "
+                              "(stopped counting there)")
+            return ", ".join(f"{counts[c]:,} {c} (limit {budget[c]:,})" for c in budget)
+        return self.add(name, body)
+
+    def check_complexity(self, name, fn, make_args, max_class,
+                         sizes=complexity.DEFAULT_SIZES, budget_s=2.0):
+        """Pass if fn's timings over growing inputs fit at most max_class.
+
+        make_args(n) builds the argument tuple for input size n; budget_s
+        (scaled to this host) caps the total time spent in fn.
+        """
+        max_rank = complexity.rank(max_class)
+
+        def body():
+            budget = self.perf_limit(budget_s)
+            kind, val = self.call(
+                lambda: complexity.measure_scaling(fn, make_args, sizes, budget),
+                max(budget * 5, 10.0))
+            if kind == 'timeout':
+                raise Failure(f"timed out (budget {budget_s}s)")
+            if kind == 'err':
+                raise val
+            points = val
+            if len(points) < complexity.MIN_POINTS:
+                n, t = points[-1]
+                raise Failure(f"too slow to measure scaling: n={n} took {t:.2f}s "
+                              f"(budget {budget_s}s)")
+            fitted = complexity.fit_complexity(points)
+            if complexity.rank(fitted) > max_rank and complexity.clearly_exceeds(points, max_class):
+                timings = ", ".join(f"n={n}: {t*1000:.1f}ms" for n, t in points)
+                raise Failure(f"fitted {fitted}, expected at most {max_class} ({timings})")
+            if complexity.rank(fitted) > max_rank:
+                return f"fitted {fitted}, too close to {max_class} to fail"
+            return f"fitted {fitted}"
+        return self.add(name, body)
@@ -0,0 +1,41 @@
+"""Session fixtures: expensive test inputs built once per evaluator run.
+
+Parsing a data file or importing the solution again for every check costs
+more than the checks themselves.  A Fixture builds its value on first use
+and hands out the same object (or a cheap copy of it) from then on:
+
+    rows = suite.fixture(lambda: sol.load_data(CSV_PATH),
+                         copy=lambda rows: [dict(r) for r in rows])
+    check("top 1 customer", lambda: sol.top_customers(rows(), 1), ['C002'])
+
+Without copy= every check gets the shared object and must treat it as
+read-only; with it, a solution that mutates its input cannot affect later
+checks.  Because the value is built inside the first check that asks for
+it, a build error fails that check as before, and is retried by the next
+one rather than cached.
+
+The memo lives in the evaluator process.  A forked child (Suite(isolate=
+True)) inherits whatever was built before the fork, but values it builds
+itself are lost with it, so call a fixture once before the timed checks
+that share it.
+"""
+
+_UNBUILT = object()
+
+
+class Fixture:
+    """A value from build(), built on the first call and reused afterwards."""
+
+    def __init__(self, build, copy=None):
+        self.build = build
+        self.copy = copy
+        self._value = _UNBUILT
+
+    def __call__(self):
+        if self._value is _UNBUILT:
+            self._value = self.build()
+        return self._value if self.copy is None else self.copy(self._value)
+
+    def reset(self):
+        """Forget the built value; the next call builds it again."""
+        self._value = _UNBUILT
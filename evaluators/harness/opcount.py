@@ -0,0 +1,162 @@
+"""Deterministic cost counters: calls, lines and loop iterations in the solution.
+
+Wall-clock limits move with the host and whatever else it is running.
+count_ops() runs a function with instrumentation switched on for the task
+directory's code only and counts
+
+    calls  Python function calls (generators count once, not per resume)
+    lines  executed line events
+    loops  loop iterations, i.e. backward jumps
+
+The counts do not depend on the machine or its load, so evaluators can bound
+them exactly and a naive fibonacci(40) fails on its call count, not on a
+timing:
+
+    suite.check_ops("fibonacci(40) call count", lambda: sol.fibonacci(40),
+                    max_calls=1000)
+
+On Python 3.12+ the counters are sys.monitoring callbacks enabled per code
+object; older interpreters fall back to sys.settrace, which is slower and
+may count lines slightly differently, so limits should leave headroom.
+Either way the instrumentation is installed only for the duration of a
+count_ops() call: evaluators that make no op checks run untraced.
+"""
+import dis
+import os
+import sys
+
+COUNTERS = ('calls', 'lines', 'loops')
+
+# 0-2 and 5 are reserved for debuggers, coverage, profilers and optimizers.
+_TOOL_IDS = (3, 4)
+_TOOL_NAME = 'bench-opcount'
+
+# RESUME with oparg 0 marks the start of a function (3.11+); later resumes
+# of a generator or coroutine have a non-zero oparg.
+_RESUME = dis.opmap.get('RESUME')
+
+
+class BudgetExceeded(BaseException):
+    """Raised inside the measured code once a counter passes its budget.
+
+    A BaseException so `except Exception` in solution code cannot swallow it.
+    """
+
+    def __init__(self, counter):
+        super().__init__(counter)
+        self.counter = counter
+
+
+def count_ops(fn, scope_dir, budget=None):
+    """Call fn(), counting the ops of code under scope_dir.
+
+    budget maps counter names to maximums; counting stops at the first one
+    exceeded, so a runaway solution fails at once instead of at its timeout.
+    Returns (counts, exceeded) where exceeded is the name of that counter or
+    None.  fn's return value is discarded.
+    """
+    budget = budget or {}
+    unknown = set(budget) - set(COUNTERS)
+    if unknown:
+        raise ValueError(f"unknown counter(s) {', '.join(sorted(unknown))} "
+                         f"(expected {', '.join(COUNTERS)})")
+    scope = os.path.realpath(scope_dir) + os.sep
+    known = {}
+
+    def in_scope(filename):
+        if filename not in known:
+            known[filename] = os.path.realpath(filename).startswith(scope)
+        return known[filename]
+
+    counts = dict.fromkeys(COUNTERS, 0)
+    limits = {name: budget.get(name, float('inf')) for name in COUNTERS}
+    counter = _count_monitoring if hasattr(sys, 'monitoring') else _count_settrace
+    try:
+        counter(fn, in_scope, counts, limits)
+    except BudgetExceeded as e:
+        return counts, e.counter
+    return counts, None
+
+
+def _bump(counts, limits, name):
+    counts[name] += 1
+    if counts[name] > limits[name]:
+        raise BudgetExceeded(name)
+
+
+def _count_monitoring(fn, in_scope, counts, limits):
+    mon = sys.monitoring
+    events = mon.events
+    tool = next((i for i in _TOOL_IDS if mon.get_tool(i) is None), None)
+    if tool is None:
+        raise RuntimeError("no free sys.monitoring tool id for op counting")
+    instrumented = set()
+
+    def on_start(code, offset):
+        if not in_scope(code.co_filename):
+            return mon.DISABLE
+        if code not in instrumented:
+            instrumented.add(code)
+            mon.set_local_events(tool, code, events.LINE | events.JUMP)
+        _bump(counts, limits, 'calls')
+
+    def on_line(code, line):
+        _bump(counts, limits, 'lines')
+
+    def on_jump(code, offset, destination):
+        if destination > offset:
+            return mon.DISABLE  # a forward jump never turns into a backward one
+        _bump(counts, limits, 'loops')
+
+    mon.use_tool_id(tool, _TOOL_NAME)
+    try:
+        mon.register_callback(tool, events.PY_START, on_start)
+        mon.register_callback(tool, events.LINE, on_line)
+        mon.register_callback(tool, events.JUMP, on_jump)
+        mon.set_events(tool, events.PY_START)
+        fn()
+    finally:
+        mon.set_events(tool, 0)
+        for code in instrumented:
+            mon.set_local_events(tool, code, 0)
+        for event in (events.PY_START, events.LINE, events.JUMP):
+            mon.register_callback(tool, event, None)
+        mon.free_tool_id(tool)
+        mon.restart_events()
+
+
+def _is_start(frame):
+    """Whether a 'call' trace event is a real call rather than a generator resume."""
+    if frame.f_lasti < 0:
+        return True  # before 3.11 a fresh frame has not executed anything yet
+    code = frame.f_code.co_code
+    return code[frame.f_lasti] != _RESUME or code[frame.f_lasti + 1] == 0
+
+
+def _count_settrace(fn, in_scope, counts, limits):
+    def trace_call(frame, event, arg):
+        if not in_scope(frame.f_code.co_filename):
+            return None
+        if _is_start(frame):
+            _bump(counts, limits, 'calls')
+            last_line = -1
+        else:
+            last_line = frame.f_lineno  # resumed at a yield; going back from it is a loop
+
+        def trace_line(frame, event, arg):
+            nonlocal last_line
+            if event == 'line':
+                _bump(counts, limits, 'lines')
+                # Line events come in order except where a loop jumps back.
+                if frame.f_lineno <= last_line:
+                    _bump(counts, limits, 'loops')
+                last_line = frame.f_lineno
+            return trace_line
+        return trace_line
+
+    previous = sys.gettrace()
+    sys.settrace(trace_call)
+    try:
+        fn()
+    finally:
+        sys.settrace(previous)
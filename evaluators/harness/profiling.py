@@ -0,0 +1,125 @@
+"""cProfile an evaluator run and write per-task profile files.
+
+Enabled by run_benchmarks.py --profile, which sets $BENCH_PROFILE_DIR.  The
+Suite starts a Session when it is created and saves it in finish():
+
+    <dir>/<task>.pstats     full cProfile data (pstats, snakeviz, ...)
+    <dir>/<task>.collapsed  "frame;frame;frame <microseconds>" lines for
+                            flamegraph.pl, speedscope or inferno
+
+The collapsed stacks are rebuilt from the cProfile call graph, splitting the
+run into a [solution] root (stacks from the first frame in the task
+directory down) and an [evaluator] root (everything else), so the flame
+graph shows at a glance whether time went into the solution or the setup.
+"""
+import cProfile
+import os
+import pstats
+
+PROFILE_DIR_ENV = 'BENCH_PROFILE_DIR'
+
+# Paths worth less than this are dropped while rebuilding stacks; it keeps the
+# walk over import machinery and other wide call graphs from exploding.
+MIN_PATH_SECONDS = 1e-6
+
+_session = None
+
+
+class Session:
+    """One cProfile.Profile covering the whole evaluator run.
+
+    cProfile keeps a single call stack per profiler and cannot follow code
+    across threads, so while a session is active call_with_timeout() runs
+    its function inline; the runner's per-evaluator timeout still applies.
+    """
+
+    def __init__(self, out_dir, task_name, scope_dir):
+        self.out_dir = out_dir
+        self.task_name = task_name
+        self.scope_dir = os.path.realpath(scope_dir) + os.sep
+        self.profile = cProfile.Profile()
+        self._in_scope = {}
+
+    def start(self):
+        self.profile.enable()
+
+    def save(self):
+        """Stop profiling and write the .pstats and .collapsed files."""
+        self.profile.disable()
+        os.makedirs(self.out_dir, exist_ok=True)
+        base = os.path.join(self.out_dir, self.task_name)
+        self.profile.dump_stats(base + '.pstats')
+        stats = pstats.Stats(self.profile).stats
+        with open(base + '.collapsed', 'w') as f:
+            for stack, micros in sorted(collapse(stats, self.in_scope).items()):
+                if micros:
+                    f.write(f"{';'.join(stack)} {micros}\n")
+
+    def in_scope(self, func):
+        """Whether a pstats function key belongs to the solution's code."""
+        filename = func[0]
+        if filename not in self._in_scope:
+            self._in_scope[filename] = os.path.realpath(filename).startswith(self.scope_dir)
+        return self._in_scope[filename]
+
+
+def start(out_dir, task_name, scope_dir):
+    """Begin profiling this process; returns the Session."""
+    global _session
+    _session = Session(out_dir, task_name, scope_dir)
+    _session.start()
+    return _session
+
+
+def active():
+    return _session is not None
+
+
+def frame_label(func):
+    """'name (file.py:line)' for a pstats function key, or the builtin's name."""
+    filename, lineno, name = func
+    if filename == '~':
+        return name
+    return f"{name} ({os.path.basename(filename)}:{lineno})"
+
+
+def collapse(stats, in_scope):
+    """Rebuild call stacks from pstats data as {stack tuple: self microseconds}.
+
+    cProfile records caller->callee edges rather than whole stacks, so each
+    function's time on a path is its time on the incoming edge, scaled by the
+    share of the caller's time that belongs to that path (the approach of
+    flameprof and similar tools).  Recursive calls are folded into the
+    outermost frame.
+    """
+    callees = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge))
+    out = {}
+
+    def walk(func, path, tt, ct):
+        if ct < MIN_PATH_SECONDS:
+            return
+        path = path + (func,)
+        add(path, tt)
+        total_ct = stats[func][3]
+        share = ct / total_ct if total_ct else 0.0
+        for callee, (_, _, edge_tt, edge_ct) in callees.get(func, ()):
+            if callee in path:
+                continue
+            walk(callee, path, edge_tt * share, edge_ct * share)
+
+    def add(path, seconds):
+        for i, func in enumerate(path):
+            if in_scope(func):
+                stack = ('[solution]',) + tuple(frame_label(f) for f in path[i:])
+                break
+        else:
+            stack = ('[evaluator]',) + tuple(frame_label(f) for f in path)
+        out[stack] = out.get(stack, 0) + round(seconds * 1e6)
+
+    for func, (_, _, tt, ct, callers) in stats.items():
+        if not callers:
+            walk(func, (), tt, ct)
+    return out
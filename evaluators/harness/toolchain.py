@@ -0,0 +1,29 @@
+"""Locating the external runtimes (node, javac, dotnet...) evaluators shell out to.
+
+run_benchmarks.py finds them once per run and passes the result to every
+evaluator as JSON in $BENCH_TOOLCHAIN (see probe_toolchain() there):
+
+    {"binaries": {"javac": "/usr/bin/javac", "dotnet": null, ...},
+     "dotnet_sdks": ["8.0.100", ...]}
+
+Run by hand, an evaluator searches PATH itself.
+"""
+import json
+import os
+import shutil
+
+TOOLCHAIN_ENV = 'BENCH_TOOLCHAIN'
+
+
+def runner_toolchain():
+    """The runner's toolchain description, or None when run by hand."""
+    toolchain = os.environ.get(TOOLCHAIN_ENV)
+    return json.loads(toolchain) if toolchain else None
+
+
+def find_binary(name):
+    """Path of a toolchain binary, from the runner's $BENCH_TOOLCHAIN if set."""
+    toolchain = runner_toolchain()
+    if toolchain:
+        return toolchain['binaries'].get(name)
+    return shutil.which(name)
@@ -2,46 +2,17 @@
 """Evaluator for Task 01: Caesar Cipher"""
 import sys
 import os
-import importlib.util
 
-TASK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                        '..', '..', 'tasks', 'task_01_caesar_cipher')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from harness import Suite  # noqa: E402
 
+suite = Suite('task_01_caesar_cipher')
 
-def load_solution():
-    path = os.path.join(TASK_DIR, 'caesar.py')
-    if not os.path.exists(path):
-        print("[FAIL] caesar.py not found")
-        sys.exit(1)
-    spec = importlib.util.spec_from_file_location("caesar", path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
-
-
-passed = failed = 0
-
-
-def check(name, fn, expected):
-    global passed, failed
-    try:
-        got = fn()
-        if got == expected:
-            print(f"[PASS] {name}")
-            passed += 1
-        else:
-            print(f"[FAIL] {name}: expected {expected!r}, got {got!r}")
-            failed += 1
-    except NotImplementedError:
-        print(f"[FAIL] {name}: not implemented")
-        failed += 1
-    except Exception as e:
-        print(f"[FAIL] {name}: {type(e).__name__}: {e}")
-        failed += 1
+check = suite.check
 
 
 def main():
-    sol = load_solution()
+    sol = suite.load_solution('caesar.py')
 
     check("encode lowercase",        lambda: sol.encode("hello", 3),                    "khoor")
     check("encode mixed case",       lambda: sol.encode("Hello, World!", 3),            "Khoor, Zruog!")
@@ -59,8 +30,7 @@ def main():
     check("decode round-trip",       lambda: sol.decode(sol.encode("Hi there!", 7), 7), "Hi there!")
     check("decode rot13 round-trip", lambda: sol.decode(sol.encode("Python 3!", 13), 13), "Python 3!")
 
-    print(f"\nResults: {passed}/{passed + failed} tests passed")
-    sys.exit(0 if failed == 0 else 1)
+    suite.finish()
 
 
 if __name__ == "__main__":
@@ -6,10 +6,12 @@
 
 const path = require('path');
 
+const TASKS_ROOT = process.env.BENCH_TASKS_DIR || path.join(__dirname, '..', '..', 'tasks');
+
 let LRUCache;
 try {
   ({ LRUCache } = require(
-    path.join(__dirname, '..', '..', 'tasks', 'task_02_lru_cache', 'lru_cache.js')
+    path.join(TASKS_ROOT, 'task_02_lru_cache', 'lru_cache.js')
   ));
 } catch (e) {
   console.log(`[FAIL] Could not load lru_cache.js: ${e.message}`);
@@ -2,46 +2,17 @@
 """Evaluator for Task 03: Binary Search Tree"""
 import sys
 import os
-import importlib.util
 
-TASK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                        '..', '..', 'tasks', 'task_03_binary_search_tree')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from harness import Suite  # noqa: E402
 
+suite = Suite('task_03_binary_search_tree')
 
-def load_solution():
-    path = os.path.join(TASK_DIR, 'bst.py')
-    if not os.path.exists(path):
-        print("[FAIL] bst.py not found")
-        sys.exit(1)
-    spec = importlib.util.spec_from_file_location("bst", path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
-
-
-passed = failed = 0
-
-
-def check(name, fn, expected):
-    global passed, failed
-    try:
-        got = fn()
-        if got == expected:
-            print(f"[PASS] {name}")
-            passed += 1
-        else:
-            print(f"[FAIL] {name}: expected {expected!r}, got {got!r}")
-            failed += 1
-    except NotImplementedError:
-        print(f"[FAIL] {name}: not implemented")
-        failed += 1
-    except Exception as e:
-        print(f"[FAIL] {name}: {type(e).__name__}: {e}")
-        failed += 1
+check = suite.check
 
 
 def main():
-    sol = load_solution()
+    sol = suite.load_solution('bst.py')
     BST = sol.BinarySearchTree
 
     # ── Search & insert ──────────────────────────────────────────────────────
@@ -131,8 +102,7 @@ def main():
 
     check("delete nonexistent does nothing", t_delete_nonexistent, [5])
 
-    print(f"\nResults: {passed}/{passed + failed} tests passed")
-    sys.exit(0 if failed == 0 else 1)
+    suite.finish()
 
 
 if __name__ == "__main__":
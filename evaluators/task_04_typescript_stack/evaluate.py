@@ -8,10 +8,15 @@ Exits with code 2 if TypeScript tooling is not available.
 import subprocess
 import sys
 import os
+import tempfile
 
 EVAL_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(EVAL_DIR, '..'))
+from harness import find_binary  # noqa: E402
+
 TEST_FILE = os.path.join(EVAL_DIR, 'test_stack.ts')
-TASK_DIR = os.path.join(EVAL_DIR, '..', '..', 'tasks', 'task_04_typescript_stack')
+TASKS_ROOT = os.environ.get('BENCH_TASKS_DIR') or os.path.join(EVAL_DIR, '..', '..', 'tasks')
+TASK_DIR = os.path.join(TASKS_ROOT, 'task_04_typescript_stack')
 SOLUTION_FILE = os.path.join(TASK_DIR, 'stack.ts')
 
 
@@ -22,6 +27,25 @@ def solution_exists():
     return True
 
 
+def test_file_for_task_dir():
+    """Return (path, is_temporary) of a test file importing the solution in TASK_DIR.
+
+    test_stack.ts imports the stack from the default tasks/ tree; when
+    BENCH_TASKS_DIR points elsewhere a copy with the import rewritten is
+    written to a temporary file.
+    """
+    if not os.environ.get('BENCH_TASKS_DIR'):
+        return TEST_FILE, False
+    with open(TEST_FILE) as f:
+        source = f.read()
+    target = os.path.splitext(os.path.abspath(SOLUTION_FILE))[0].replace(os.sep, '/')
+    source = source.replace("'../../tasks/task_04_typescript_stack/stack'", repr(target))
+    fd, path = tempfile.mkstemp(prefix='test_stack_', suffix='.ts')
+    with os.fdopen(fd, 'w') as f:
+        f.write(source)
+    return path, True
+
+
 def try_run(cmd):
     """Run cmd and return CompletedProcess, or None if the binary is missing."""
     try:
@@ -39,19 +63,25 @@ def main():
         sys.exit(1)
 
     result = None
-
-    # 1. Try local ts-node (project node_modules)
-    local_tsnode = os.path.join(EVAL_DIR, '..', '..', 'node_modules', '.bin', 'ts-node')
-    if os.path.exists(local_tsnode):
-        result = try_run([local_tsnode, TEST_FILE])
-
-    # 2. Try global ts-node
-    if result is None:
-        result = try_run(['ts-node', TEST_FILE])
-
-    # 3. Try via npx (downloads if missing, slower)
-    if result is None:
-        result = try_run(['npx', '--yes', 'ts-node', TEST_FILE])
+    test_file, is_temporary = test_file_for_task_dir()
+    try:
+        # 1. Try local ts-node (project node_modules)
+        local_tsnode = os.path.join(EVAL_DIR, '..', '..', 'node_modules', '.bin', 'ts-node')
+        if os.path.exists(local_tsnode):
+            result = try_run([local_tsnode, test_file])
+
+        # 2. Try global ts-node
+        ts_node = find_binary('ts-node')
+        if result is None and ts_node:
+            result = try_run([ts_node, test_file])
+
+        # 3. Try via npx (downloads if missing, slower)
+        npx = find_binary('npx')
+        if result is None and npx:
+            result = try_run([npx, '--yes', 'ts-node', test_file])
+    finally:
+        if is_temporary:
+            os.remove(test_file)
 
     if result is None:
         print("[SKIP] ts-node not found. Install with:  npm install -g ts-node typescript")
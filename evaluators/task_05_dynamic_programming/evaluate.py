@@ -2,47 +2,19 @@
 """Evaluator for Task 05: Dynamic Programming"""
 import sys
 import os
-import importlib.util
+import random
 import time
 
-TASK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                        '..', '..', 'tasks', 'task_05_dynamic_programming')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from harness import Failure, Suite  # noqa: E402
 
+suite = Suite('task_05_dynamic_programming', isolate=True)
 
-def load_solution():
-    path = os.path.join(TASK_DIR, 'dp.py')
-    if not os.path.exists(path):
-        print("[FAIL] dp.py not found")
-        sys.exit(1)
-    spec = importlib.util.spec_from_file_location("dp", path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
-
-
-passed = failed = 0
-
-
-def check(name, fn, expected):
-    global passed, failed
-    try:
-        got = fn()
-        if got == expected:
-            print(f"[PASS] {name}")
-            passed += 1
-        else:
-            print(f"[FAIL] {name}: expected {expected!r}, got {got!r}")
-            failed += 1
-    except NotImplementedError:
-        print(f"[FAIL] {name}: not implemented")
-        failed += 1
-    except Exception as e:
-        print(f"[FAIL] {name}: {type(e).__name__}: {e}")
-        failed += 1
+check = suite.check
 
 
 def main():
-    sol = load_solution()
+    sol = suite.load_solution('dp.py')
 
     # ── fibonacci ────────────────────────────────────────────────────────────
     check("fib(0)",  lambda: sol.fibonacci(0),  0)
@@ -53,29 +25,19 @@ def main():
     check("fib(20)", lambda: sol.fibonacci(20), 6765)
 
     # Performance: fib(1000) must finish quickly
-    try:
-        t0 = time.time()
+    def fib_1000():
+        t0 = time.perf_counter()
         result = sol.fibonacci(1000)
-        elapsed = time.time() - t0
+        elapsed = time.perf_counter() - t0
         # Known value: fib(1000) is a 209-digit number
         expected_mod = 849228950
-        if elapsed > 2.0:
-            print(f"[FAIL] fib(1000) performance: took {elapsed:.2f}s (must be < 2s)")
-            global failed
-            failed += 1
-        elif result % (10 ** 9) != expected_mod:
-            print(f"[FAIL] fib(1000) value: last 9 digits should be {expected_mod}, got {result % (10**9)}")
-            failed += 1
-        else:
-            print(f"[PASS] fib(1000) correct and fast ({elapsed*1000:.1f}ms)")
-            global passed
-            passed += 1
-    except NotImplementedError:
-        print("[FAIL] fib(1000): not implemented")
-        failed += 1
-    except Exception as e:
-        print(f"[FAIL] fib(1000): {type(e).__name__}: {e}")
-        failed += 1
+        detail = suite.judge_time(elapsed, 2.0)
+        if result % (10 ** 9) != expected_mod:
+            raise Failure(f"last 9 digits should be {expected_mod}, got {result % (10**9)}")
+        return detail
+
+    # Naive recursion never finishes fib(1000); kill it rather than wait for the runner.
+    suite.add("fib(1000) correct and fast", fib_1000, timeout=10)
 
     # ── longest_common_subsequence ───────────────────────────────────────────
     lcs = sol.longest_common_subsequence
@@ -87,6 +49,12 @@ def main():
     check("lcs AGGTAB/GXTXAYB", lambda: lcs("AGGTAB", "GXTXAYB"), 4)
     check("lcs subsequence",     lambda: lcs("ABCBDAB", "BDCAB"), 4)
 
+    # Memory: two rows of the table suffice; a full 1000x1000 table is ~11MB.
+    rng = random.Random(5)
+    dna1 = "".join(rng.choice("ACGT") for _ in range(1000))
+    dna2 = "".join(rng.choice("ACGT") for _ in range(1000))
+    suite.check_memory("lcs 1000x1000 peak memory", lambda: lcs(dna1, dna2), 2 * 2**20)
+
     # ── coin_change ──────────────────────────────────────────────────────────
     cc = sol.coin_change
     check("coin_change amount 0",       lambda: cc([1, 5], 0),           0)
@@ -96,8 +64,7 @@ def main():
     check("coin_change greedy wrong",   lambda: cc([1, 3, 4], 6),        2)   # 3+3, not 4+1+1
     check("coin_change us coins",       lambda: cc([1, 5, 10, 25], 36),  3)   # 25+10+1
 
-    print(f"\nResults: {passed}/{passed + failed} tests passed")
-    sys.exit(0 if failed == 0 else 1)
+    suite.finish()
 
 
 if __name__ == "__main__":
@@ -6,10 +6,12 @@
 
 const path = require('path');
 
+const TASKS_ROOT = process.env.BENCH_TASKS_DIR || path.join(__dirname, '..', '..', 'tasks');
+
 let EventEmitter;
 try {
   ({ EventEmitter } = require(
-    path.join(__dirname, '..', '..', 'tasks', 'task_06_event_emitter', 'event_emitter.js')
+    path.join(TASKS_ROOT, 'task_06_event_emitter', 'event_emitter.js')
   ));
 } catch (e) {
   console.log(`[FAIL] Could not load event_emitter.js: ${e.message}`);
@@ -1,71 +1,165 @@
 #!/usr/bin/env python3
 """Evaluator for Task 07: CSV Data Analysis"""
+import atexit
+import csv
 import sys
 import os
-import importlib.util
+import tempfile
+import time
+from collections import defaultdict
 
-TASK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                        '..', '..', 'tasks', 'task_07_csv_analysis')
-CSV_PATH = os.path.join(TASK_DIR, 'sales_data.csv')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from harness import Failure, Suite, measure_peak, timing_failure  # noqa: E402
 
+suite = Suite('task_07_csv_analysis')
 
-def load_solution():
-    path = os.path.join(TASK_DIR, 'processor.py')
-    if not os.path.exists(path):
-        print("[FAIL] processor.py not found")
-        sys.exit(1)
-    spec = importlib.util.spec_from_file_location("processor", path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
+check = suite.validate
+
+CSV_PATH = os.path.join(suite.task_dir, 'sales_data.csv')
+
+# Wall-clock limit for the columnar speed check, not scaled to the host: it
+# must stay well inside the runner's 60s limit for the whole evaluator.  The
+# check compares two timings taken here, so the host's speed does not matter
+# to the verdict.
+COLUMNAR_TIMEOUT = 20.0
 
 
 def approx_eq(a, b, tol=0.02):
     return abs(a - b) <= tol
 
 
-passed = failed = 0
+def write_scaled_csv(path, copies):
+    """Write sales_data.csv's rows `copies` times over, renumbering order_id.
+
+    Returns path, so a fixture can build the file on first use.
+    """
+    with open(CSV_PATH, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = list(reader)
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for i in range(copies):
+            for row in rows:
+                writer.writerow([str(i * len(rows) + int(row[0]))] + row[1:])
+    return path
+
+
+def reference_load(path):
+    """A single-pass load_data(): the baseline for the memory check."""
+    with open(path, newline='') as f:
+        return [{**row, 'quantity': int(row['quantity']), 'unit_price': float(row['unit_price'])}
+                for row in csv.DictReader(f)]
+
+
+def reference_stream(path):
+    """A constant-memory iter_rows(): the baseline for the streaming checks."""
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            row['quantity'] = int(row['quantity'])
+            row['unit_price'] = float(row['unit_price'])
+            yield row
+
+
+def reference_aggregates(rows):
+    """The four reports over a list of dicts, one pass each: the baseline for
+    the columnar speed check."""
+    by_category = defaultdict(float)
+    for row in rows:
+        by_category[row['category']] += row['quantity'] * row['unit_price']
+    by_customer = defaultdict(float)
+    for row in rows:
+        by_customer[row['customer_id']] += row['quantity'] * row['unit_price']
+    by_month = defaultdict(float)
+    for row in rows:
+        by_month[row['order_date'][:7]] += row['quantity'] * row['unit_price']
+    total = 0.0
+    for row in rows:
+        total += row['quantity'] * row['unit_price']
+    return (dict(by_category), sorted(by_customer, key=by_customer.get, reverse=True)[:3],
+            dict(sorted(by_month.items())), round(total / len(rows), 2))
+
+
+def best_time(fn, repeats=3):
+    """Best-of-repeats wall time of fn(), in seconds."""
+    best = float('inf')
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def columns_match(cols, rows):
+    """Whether a SalesColumns table decodes to the same values as rows."""
+    return (len(cols.quantity) == len(rows) and all(
+        cols.quantity[i] == row['quantity']
+        and cols.unit_price[i] == row['unit_price']
+        and cols.categories[cols.category[i]] == row['category']
+        and cols.customer_ids[cols.customer_id[i]] == row['customer_id']
+        and cols.months[cols.month[i]] == row['order_date'][:7]
+        for i, row in enumerate(rows)))
+
 
+class OnePass:
+    """Rows that can be iterated only once, like a stream read from disk."""
 
-def check(name, fn, validator):
-    global passed, failed
-    try:
-        got = fn()
-        ok, msg = validator(got)
-        if ok:
-            print(f"[PASS] {name}")
-            passed += 1
-        else:
-            print(f"[FAIL] {name}: {msg} (got {got!r})")
-            failed += 1
-    except NotImplementedError:
-        print(f"[FAIL] {name}: not implemented")
-        failed += 1
-    except Exception as e:
-        print(f"[FAIL] {name}: {type(e).__name__}: {e}")
-        failed += 1
+    def __init__(self, rows):
+        self.rows = rows
+        self.used = False
+
+    def __iter__(self):
+        if self.used:
+            raise Failure("iterated the rows more than once")
+        self.used = True
+        return iter(self.rows)
 
 
 def main():
-    sol = load_solution()
+    sol = suite.load_solution('processor.py')
+    # Parsed once; every check gets its own copy of the rows, so a solution
+    # that mutates its input cannot change what later checks see.
+    sales = suite.fixture(lambda: sol.load_data(CSV_PATH),
+                          copy=lambda rows: [dict(row) for row in rows])
+
+    # The scaled files and reference peaks are built by the first check that
+    # needs them, so filtering those checks out with --test skips the work.
+    # Each is built before the check's child is forked (as a limit or in
+    # make_args), so it is memoised and does not count towards the peak.
+    tmp = tempfile.TemporaryDirectory()
+    atexit.register(tmp.cleanup)
+    csv_20k = suite.fixture(
+        lambda: write_scaled_csv(os.path.join(tmp.name, 'sales_20k.csv'), 800))
+    csv_200k = suite.fixture(
+        lambda: write_scaled_csv(os.path.join(tmp.name, 'sales_200k.csv'), 8000))
+    load_peak = suite.fixture(
+        lambda: measure_peak(lambda: reference_load(csv_20k()))[1])
+    stream_peak = suite.fixture(
+        lambda: measure_peak(lambda: sum(1 for _ in reference_stream(csv_20k())))[1])
 
     # ── load_data ────────────────────────────────────────────────────────────
     check(
         "load_data row count",
-        lambda: len(sol.load_data(CSV_PATH)),
+        lambda: len(sales()),
         lambda v: (v == 25, f"expected 25 rows, got {v}")
     )
     check(
         "load_data quantity is int",
-        lambda: type(sol.load_data(CSV_PATH)[0]['quantity']),
+        lambda: type(sales()[0]['quantity']),
         lambda v: (v is int, f"expected int, got {v}")
     )
     check(
         "load_data unit_price is float",
-        lambda: type(sol.load_data(CSV_PATH)[0]['unit_price']),
+        lambda: type(sales()[0]['unit_price']),
         lambda v: (v is float, f"expected float, got {v}")
     )
 
+    # Memory: the loaded rows are the bulk of the peak; holding the file text,
+    # raw rows and converted rows all at once roughly doubles it.
+    suite.check_memory("load_data 20k rows peak memory", sol.load_data,
+                       lambda: int(load_peak() * 1.5), make_args=lambda: (csv_20k(),))
+
     # ── total_revenue_by_category ────────────────────────────────────────────
     # Pre-compute expected values from the CSV
     # Electronics rows and their revenues:
@@ -81,8 +175,7 @@ def main():
     furn = 449.99 + 2*299.99 + 449.99 + 299.99 + 449.99 + 299.99
 
     def get_rev():
-        data = sol.load_data(CSV_PATH)
-        return sol.total_revenue_by_category(data)
+        return sol.total_revenue_by_category(sales())
 
     check(
         "revenue by category has 3 keys",
@@ -115,8 +208,7 @@ def main():
     # Sorted desc: C002, C003, C001, C005, C006, C004
 
     def get_top(n):
-        data = sol.load_data(CSV_PATH)
-        return sol.top_customers(data, n)
+        return sol.top_customers(sales(), n)
 
     check(
         "top 1 customer",
@@ -136,8 +228,7 @@ def main():
 
     # ── monthly_sales_trend ──────────────────────────────────────────────────
     def get_monthly():
-        data = sol.load_data(CSV_PATH)
-        return sol.monthly_sales_trend(data)
+        return sol.monthly_sales_trend(sales())
 
     check(
         "monthly trend has 7 months",
@@ -164,12 +255,137 @@ def main():
 
     check(
         "average_order_value",
-        lambda: sol.average_order_value(sol.load_data(CSV_PATH)),
+        lambda: sol.average_order_value(sales()),
         lambda v: (approx_eq(v, expected_avg), f"expected ~{expected_avg}, got {v}")
     )
 
-    print(f"\nResults: {passed}/{passed + failed} tests passed")
-    sys.exit(0 if failed == 0 else 1)
+    # ── Streaming ────────────────────────────────────────────────────────────
+    check(
+        "iter_rows returns an iterator",
+        lambda: sol.iter_rows(CSV_PATH),
+        lambda v: (iter(v) is v, f"expected an iterator, got {type(v).__name__}")
+    )
+    check(
+        "iter_rows matches load_data",
+        lambda: list(sol.iter_rows(CSV_PATH)) == sales(),
+        lambda v: (v, "rows differ from load_data()")
+    )
+    check(
+        "revenue by category in one pass",
+        lambda: sol.total_revenue_by_category(OnePass(sales())),
+        lambda v: (all(approx_eq(v.get(k, 0), exp) for k, exp in
+                       (('Electronics', elec), ('Books', books), ('Furniture', furn))),
+                   f"got {v}")
+    )
+    check(
+        "top 3 customers in one pass",
+        lambda: sol.top_customers(OnePass(sales()), 3),
+        lambda v: (v == ['C002', 'C003', 'C001'], f"expected ['C002','C003','C001'], got {v}")
+    )
+    check(
+        "january 2023 revenue in one pass",
+        lambda: sol.monthly_sales_trend(OnePass(sales())).get('2023-01', 0),
+        lambda v: (approx_eq(v, jan), f"expected ~{jan:.2f}, got {v:.2f}")
+    )
+    check(
+        "average_order_value in one pass",
+        lambda: sol.average_order_value(OnePass(sales())),
+        lambda v: (approx_eq(v, expected_avg), f"expected ~{expected_avg}, got {v}")
+    )
+
+    # Memory: streamed, the peak is one row plus the running totals whatever
+    # the file size; anything that collects the rows grows with the file
+    # (about 12MB at 20k rows).
+    for name, fn in (
+        ("total_revenue_by_category", sol.total_revenue_by_category),
+        ("top_customers", lambda rows: sol.top_customers(rows, 3)),
+        ("monthly_sales_trend", sol.monthly_sales_trend),
+        ("average_order_value", sol.average_order_value),
+    ):
+        suite.check_memory(f"{name} streamed over 20k rows peak memory",
+                           lambda path, fn=fn: fn(sol.iter_rows(path)),
+                           lambda: int(stream_peak() * 4), make_args=lambda: (csv_20k(),))
+
+    # ── Columnar ─────────────────────────────────────────────────────────────
+    columns = suite.fixture(lambda: sol.load_columns(CSV_PATH))
+
+    def typecodes(cols):
+        return {name: getattr(cols, name).typecode
+                for name in ('quantity', 'unit_price', 'category', 'customer_id', 'month')}
+
+    check(
+        "load_columns uses typed arrays",
+        lambda: typecodes(columns()),
+        lambda v: (v['quantity'] == 'q' and v['unit_price'] == 'd'
+                   and all(v[k] in 'bBhHiIlLqQ' for k in ('category', 'customer_id', 'month')),
+                   "expected quantity 'q', unit_price 'd' and integer codes")
+    )
+    check(
+        "load_columns decodes to load_data",
+        lambda: columns_match(columns(), sales()),
+        lambda v: (v, "columns differ from load_data() rows")
+    )
+    check(
+        "revenue by category over columns",
+        lambda: sol.total_revenue_by_category(columns()),
+        lambda v: (all(approx_eq(v.get(k, 0), exp) for k, exp in
+                       (('Electronics', elec), ('Books', books), ('Furniture', furn))),
+                   f"got {v}")
+    )
+    check(
+        "top 3 customers over columns",
+        lambda: sol.top_customers(columns(), 3),
+        lambda v: (v == ['C002', 'C003', 'C001'], f"expected ['C002','C003','C001'], got {v}")
+    )
+    check(
+        "monthly trend over columns",
+        lambda: sol.monthly_sales_trend(columns()),
+        lambda v: (len(v) == 7 and list(v) == sorted(v) and approx_eq(v.get('2023-01', 0), jan),
+                   f"expected 7 sorted months with 2023-01 ~{jan:.2f}")
+    )
+    check(
+        "average_order_value over columns",
+        lambda: sol.average_order_value(columns()),
+        lambda v: (approx_eq(v, expected_avg), f"expected ~{expected_avg}, got {v}")
+    )
+
+    # A dict per row costs several hundred bytes; a columnar row is two
+    # 8-byte numbers and three small codes, so 5x is a loose bound.  The
+    # speed check times the same four reports over dicts in this process,
+    # so the ratio holds on any host; 200k rows stands in for the multi-GB
+    # exports, as both paths scale linearly.
+    suite.check_memory("load_columns 20k rows peak memory", sol.load_columns,
+                       lambda: load_peak() // 5, make_args=lambda: (csv_20k(),))
+
+    def compare(big_csv):
+        rows, cols = reference_load(big_csv), sol.load_columns(big_csv)
+        dict_s = best_time(lambda: reference_aggregates(rows))
+        del rows
+        cols_s = best_time(lambda: (sol.total_revenue_by_category(cols),
+                                    sol.top_customers(cols, 3),
+                                    sol.monthly_sales_trend(cols),
+                                    sol.average_order_value(cols)))
+        # Columnar time first: the runner records a leading "Nms" as the timing.
+        detail = (f"{cols_s*1000:.1f}ms over columns, {dict_s*1000:.1f}ms over dicts, "
+                  f"{dict_s / cols_s:.1f}x")
+        if cols_s * 1.5 > dict_s:
+            raise timing_failure(detail + ", expected at least 1.5x", cols_s * 1.5, dict_s)
+        return detail
+
+    def faster_than_dicts():
+        # The file is built before the timed call, like the 20k one.
+        big_csv = csv_200k()
+        kind, val = suite.call(lambda: compare(big_csv), COLUMNAR_TIMEOUT)
+        if kind == 'timeout':
+            raise Failure(f"timed out (limit {COLUMNAR_TIMEOUT}s)")
+        if kind == 'err':
+            raise val
+        return val
+
+    suite.add("four reports over 200k columnar rows at least 1.5x faster than dicts",
+              faster_than_dicts)
+
+    suite.finish()
 
 
 if __name__ == "__main__":
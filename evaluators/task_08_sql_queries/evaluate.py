@@ -4,17 +4,32 @@ Evaluator for Task 08: SQL Analytics Queries.
 
 Creates an in-memory SQLite database, populates it with test data,
 parses each labelled query from queries.sql, runs it, and checks results.
+Each query's plan is then checked for per-row scans of the large tables, and
+the query is timed against a large generated dataset.
 """
 import sys
 import os
 import re
 import sqlite3
+import tempfile
+import time
 
-TASK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                        '..', '..', 'tasks', 'task_08_sql_queries')
-QUERIES_FILE = os.path.join(TASK_DIR, 'queries.sql')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from harness import Failure, Suite, TimingFailure, artifact_dir  # noqa: E402
 
-passed = failed = 0
+suite = Suite('task_08_sql_queries')
+QUERIES_FILE = os.path.join(suite.task_dir, 'queries.sql')
+# Optional CREATE INDEX statements from the submission; the plan checks report
+# which findings they would remove.
+INDEXES_FILE = os.path.join(suite.task_dir, 'indexes.sql')
+
+SCHEMA_SQL = """
+    CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT, email TEXT, joined_date TEXT);
+    CREATE TABLE products  (id INTEGER PRIMARY KEY, name TEXT, category TEXT, price REAL);
+    CREATE TABLE orders    (id INTEGER PRIMARY KEY, customer_id INTEGER, order_date TEXT, status TEXT);
+    CREATE TABLE order_items (order_id INTEGER, product_id INTEGER, quantity INTEGER, unit_price REAL,
+                              PRIMARY KEY(order_id, product_id));
+"""
 
 # ── Test data ─────────────────────────────────────────────────────────────────
 SEED_SQL = """
@@ -82,17 +97,139 @@ INSERT INTO order_items VALUES
 def build_db():
     con = sqlite3.connect(':memory:')
     con.row_factory = sqlite3.Row
-    con.executescript("""
-        CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT, email TEXT, joined_date TEXT);
-        CREATE TABLE products  (id INTEGER PRIMARY KEY, name TEXT, category TEXT, price REAL);
-        CREATE TABLE orders    (id INTEGER PRIMARY KEY, customer_id INTEGER, order_date TEXT, status TEXT);
-        CREATE TABLE order_items (order_id INTEGER, product_id INTEGER, quantity INTEGER, unit_price REAL,
-                                  PRIMARY KEY(order_id, product_id));
-    """)
+    con.executescript(SCHEMA_SQL)
     con.executescript(SEED_SQL)
     return con
 
 
+# ── Large dataset ─────────────────────────────────────────────────────────────
+# Queries that are fine on eight orders can still fall over at scale, e.g. a
+# correlated subquery per customer with no index to serve it.  A seeded
+# generator fills the same schema with LARGE_ORDERS orders of 1-4 line items
+# each.  It runs inside SQLite, so a build takes seconds; the result is kept
+# as a snapshot file that later runs copy into memory with the backup API.
+LARGE_SEED = 8
+LARGE_CUSTOMERS = 50_000  # only the first 90% ever order
+LARGE_PRODUCTS = 1_000
+LARGE_ORDERS = 500_000
+CATEGORIES = ['Electronics', 'Books', 'Furniture', 'Toys', 'Garden', 'Sports',
+              'Clothing', 'Grocery']
+SNAPSHOT_VERSION = 1  # bump whenever the generator changes
+SNAPSHOT_DIR = artifact_dir('task_08_sql_queries')
+
+# Time limit per query on the large dataset, in reference-machine seconds.
+# Slower hosts get proportionally more; faster ones are not cut below these,
+# as the calibration workload is pure Python and SQLite is not.  A join-based
+# solution needs about a fifth of each, leaving room for a loaded host; a
+# per-row plan needs hours.
+QUERY_BUDGETS = {1: 6.0, 2: 5.0, 3: 4.0, 4: 2.0, 5: 10.0}
+
+# Wall-clock seconds the timing checks may take together, loading the large
+# dataset included, however slow the host.  The runner kills an evaluator
+# after 60s (EVALUATOR_TIMEOUT in run_benchmarks.py) and then loses every
+# result, so scaled per-query limits alone must not be able to reach it.
+TIMING_SECTION_BUDGET = 30.0
+
+
+def mix(expr, salt):
+    """SQL for a seeded pseudo-random integer in [0, 2^32) derived from expr."""
+    return f"((({expr}) * 2654435761 + {LARGE_SEED * 7919 + salt * 104729}) % 4294967291)"
+
+
+def generate_large_db(con):
+    """Fill an empty database with the large dataset; same seed, same rows."""
+    category = ("CASE " + mix('x', 1) + f" % {len(CATEGORIES)} "
+                + " ".join(f"WHEN {i} THEN '{c}'" for i, c in enumerate(CATEGORIES))
+                + " END")
+    con.executescript(SCHEMA_SQL + f"""
+        WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < {LARGE_CUSTOMERS})
+        INSERT INTO customers
+        SELECT x, 'Customer ' || x, 'customer' || x || '@example.com',
+               date('2020-01-01', '+' || ({mix('x', 2)} % 1096) || ' days')
+        FROM n;
+
+        WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < {LARGE_PRODUCTS})
+        INSERT INTO products
+        SELECT x, 'Product ' || x, {category}, 1 + ({mix('x', 3)} % 100000) / 100.0
+        FROM n;
+
+        WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < {LARGE_ORDERS})
+        INSERT INTO orders
+        SELECT x, 1 + {mix('x', 4)} % {LARGE_CUSTOMERS * 9 // 10},
+               date('2023-01-01', '+' || ({mix('x', 5)} % 730) || ' days'),
+               CASE WHEN {mix('x', 6)} % 20 = 0 THEN 'cancelled' ELSE 'completed' END
+        FROM n;
+
+        -- Item k of an order is product (start + k * stride), so products
+        -- within an order never repeat.
+        WITH RECURSIVE k(j) AS (SELECT 1 UNION ALL SELECT j + 1 FROM k WHERE j < 4)
+        INSERT INTO order_items
+        SELECT o.id, p.id, 1 + {mix('o.id * 4 + k.j', 8)} % 5, p.price
+        FROM orders o
+        JOIN k ON k.j <= 1 + {mix('o.id', 7)} % 4
+        JOIN products p ON p.id = 1 + ({mix('o.id', 9)} + k.j * {LARGE_PRODUCTS // 4 - 1})
+                                      % {LARGE_PRODUCTS};
+    """)
+    con.commit()
+
+
+def snapshot_path():
+    name = f"large_v{SNAPSHOT_VERSION}_seed{LARGE_SEED}_{LARGE_ORDERS}.sqlite"
+    return os.path.join(SNAPSHOT_DIR, name)
+
+
+def build_snapshot(path):
+    """Generate the large dataset into path, publishing the file atomically."""
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=SNAPSHOT_DIR, suffix='.tmp')
+    os.close(fd)
+    try:
+        con = sqlite3.connect(tmp)
+        try:
+            con.executescript("PRAGMA journal_mode = OFF; PRAGMA synchronous = OFF;")
+            generate_large_db(con)
+        finally:
+            con.close()
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def load_large_db():
+    """Return an in-memory copy of the large dataset, building the snapshot if needed."""
+    path = snapshot_path()
+    if not os.path.exists(path):
+        build_snapshot(path)
+    con = sqlite3.connect(':memory:')
+    disk = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        disk.backup(con)
+    finally:
+        disk.close()
+    return con
+
+
+def time_query(con, sql, limit_s):
+    """Run sql to completion and return its wall time, or None once past limit_s.
+
+    A progress handler interrupts the query at the limit, so a query that
+    would take minutes stops there instead of holding up the evaluator.
+    """
+    deadline = time.perf_counter() + limit_s
+    con.set_progress_handler(lambda: time.perf_counter() > deadline, 10_000)
+    t0 = time.perf_counter()
+    try:
+        con.execute(sql).fetchall()
+    except sqlite3.Error as e:
+        if isinstance(e, sqlite3.OperationalError) and 'interrupted' in str(e):
+            return None
+        raise Failure(f"SQL error: {e}") from None
+    finally:
+        con.set_progress_handler(None, 0)
+    return time.perf_counter() - t0
+
+
 def parse_queries(path):
     """Return dict {1: sql_text, 2: sql_text, ...} from the labelled file."""
     if not os.path.exists(path):
@@ -122,22 +259,173 @@ def run_query(con, sql):
 
 
 def check(name, rows, err, validator):
-    global passed, failed
-    if err:
-        print(f"[FAIL] {name}: SQL error: {err}")
-        failed += 1
-        return
-    if rows is None:
-        print(f"[FAIL] {name}: query not found or empty")
-        failed += 1
-        return
-    ok, msg = validator(rows)
-    if ok:
-        print(f"[PASS] {name}")
-        passed += 1
-    else:
-        print(f"[FAIL] {name}: {msg}")
-        failed += 1
+    def body():
+        if err:
+            raise Failure(f"SQL error: {err}")
+        if rows is None:
+            raise Failure("query not found or empty")
+        ok, msg = validator(rows)
+        if not ok:
+            raise Failure(msg)
+
+    suite.add(name, body)
+
+
+# ── Query plans ───────────────────────────────────────────────────────────────
+# EXPLAIN QUERY PLAN needs only the schema: without ANALYZE statistics SQLite
+# plans an empty database exactly as it plans the large one.
+LARGE_TABLES = ('customers', 'orders', 'order_items')
+
+# Words that can follow a table name without being its alias; all but the
+# join words also end the FROM list.
+_JOIN_WORDS = {'join', 'left', 'right', 'inner', 'outer', 'cross', 'natural', 'full'}
+_NOT_ALIASES = _JOIN_WORDS | {'on', 'using', 'where', 'group', 'order', 'limit',
+                              'having', 'union', 'except', 'intersect', 'window',
+                              'select', 'indexed', 'not'}
+
+
+def build_schema_db(indexes_sql=None):
+    """An empty database with the task schema and, optionally, extra indexes."""
+    con = sqlite3.connect(':memory:')
+    con.executescript(SCHEMA_SQL)
+    if indexes_sql:
+        con.executescript(indexes_sql)
+    return con
+
+
+def table_aliases(sql):
+    """Map every table name and alias in sql's FROM lists and JOINs to its table.
+
+    Walks the tokens keeping one FROM list per parenthesis depth, so comma
+    joins (FROM orders o, order_items oi) and subqueries are covered.
+    """
+    tokens = re.findall(r"'(?:[^']|'')*'|\w+|[(),]|[^\s\w]", sql)
+    aliases = {}
+    in_from = [False]  # per parenthesis depth: inside a FROM list
+    expect_table = False
+    for i, token in enumerate(tokens):
+        word = token.lower()
+        if token == '(':
+            in_from.append(False)
+            expect_table = False
+        elif token == ')':
+            if len(in_from) > 1:
+                in_from.pop()
+        elif word in ('from', 'join'):
+            in_from[-1] = expect_table = True
+        elif token == ',' and in_from[-1]:
+            expect_table = True
+        elif word in _NOT_ALIASES:
+            in_from[-1] = in_from[-1] and word in _JOIN_WORDS
+        elif expect_table and re.fullmatch(r'\w+', token):
+            expect_table = False
+            aliases.setdefault(word, word)
+            rest = tokens[i + 1:i + 3]
+            if rest and rest[0].lower() == 'as':
+                rest = rest[1:]
+            if rest and re.fullmatch(r'\w+', rest[0]) and rest[0].lower() not in _NOT_ALIASES:
+                aliases.setdefault(rest[0].lower(), word)
+    return aliases
+
+
+def plan_findings(con, sql):
+    """Return [(per_row, text)] describing where sql's plan spends its time.
+
+    per_row marks a full scan of a large table inside a correlated subquery:
+    it runs once per outer row, so its cost is the product of two tables.
+    Full scans at the top level, per-row subqueries that use an index, temp
+    B-tree sorts and automatic indexes are reported without per_row.
+    """
+    rows = con.execute('EXPLAIN QUERY PLAN ' + sql).fetchall()
+    parents = {node: parent for node, parent, _, _ in rows}
+    details = {node: detail for node, _, _, detail in rows}
+    aliases = table_aliases(sql)
+
+    def correlated(node):
+        while node in details:
+            if details[node].startswith('CORRELATED'):
+                return True
+            node = parents[node]
+        return False
+
+    findings = []
+    for node, parent, _, detail in rows:
+        scan = re.match(r'SCAN (\w+)', detail)
+        if scan:
+            table = aliases.get(scan.group(1).lower(), scan.group(1).lower())
+            if table not in LARGE_TABLES:
+                continue
+            if correlated(parent):
+                finding = (True, f"per-row scan of {table}")
+            else:
+                finding = (False, f"full scan of {table}")
+        elif detail.startswith('CORRELATED'):
+            finding = (False, "correlated subquery per row")
+        elif detail.startswith('USE TEMP B-TREE FOR '):
+            finding = (False, "temp B-tree for " + detail[len('USE TEMP B-TREE FOR '):])
+        elif 'AUTOMATIC' in detail:
+            finding = (False, "automatic index built per run")
+        else:
+            continue
+        if finding not in findings:
+            findings.append(finding)
+    return findings
+
+
+def check_plan(n, queries, plan_db, indexed_db):
+    """Fail query n if its plan scans a large table once per outer row."""
+    def body():
+        sql = queries.get(n, '')
+        if not sql:
+            raise Failure("query not found or empty")
+        try:
+            findings = plan_findings(plan_db, sql)
+            remaining = None
+            if indexed_db is not None:
+                remaining = {text for _, text in plan_findings(indexed_db, sql)}
+        except sqlite3.Error as e:
+            raise Failure(f"SQL error: {e}") from None
+        notes = []
+        for _, text in findings:
+            if remaining is not None and text not in remaining:
+                text += " (removed by indexes.sql)"
+            notes.append(text)
+        report = "; ".join(notes) or "index lookups only"
+        if any(per_row for per_row, _ in findings):
+            raise Failure(report)
+        return report
+
+    return suite.add(f"Q{n} plan has no per-row scans of large tables", body)
+
+
+def check_query_time(n, queries, large_db, deadline):
+    """Time query n against the large dataset within QUERY_BUDGETS[n].
+
+    The limit is also cut to what is left before deadline (a perf_counter()
+    time).
+    """
+    budget = QUERY_BUDGETS[n]
+
+    def body():
+        sql = queries.get(n, '')
+        if not sql:
+            raise Failure("query not found or empty")
+        db = large_db()
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            raise TimingFailure(f"not timed: the {TIMING_SECTION_BUDGET}s budget for "
+                                "all timing checks is used up")
+        limit = min(suite.perf_limit(budget, scale_down=False), remaining)
+        elapsed = time_query(db, sql, limit)
+        if elapsed is None:
+            if limit == remaining:
+                raise TimingFailure(f"stopped after {limit:.2f}s, when the "
+                                    f"{TIMING_SECTION_BUDGET}s budget for all timing "
+                                    f"checks ran out (limit {budget}s)")
+            raise TimingFailure(f"stopped after {limit:.2f}s (limit {budget}s)")
+        return suite.judge_time(elapsed, budget, scale_down=False)
+
+    suite.add(f"Q{n} on {LARGE_ORDERS:,} orders within {budget}s", body)
 
 
 def main():
@@ -235,8 +523,45 @@ def main():
         )
     )
 
-    print(f"\nResults: {passed}/{passed + failed} tests passed")
-    sys.exit(0 if failed == 0 else 1)
+    # ── Query plans ──────────────────────────────────────────────────────────
+    plan_db = build_schema_db()
+    indexed_db = None
+    if os.path.exists(INDEXES_FILE):
+        with open(INDEXES_FILE) as f:
+            indexes_sql = f.read()
+        try:
+            indexed_db = build_schema_db(indexes_sql)
+            indexes_error = None
+        except sqlite3.Error as e:
+            indexes_error = f"SQL error: {e}"
+        else:
+            created = indexed_db.execute(
+                "SELECT count(*) FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+            ).fetchone()[0]
+            if not created:
+                indexed_db, indexes_error = None, "no CREATE INDEX statements"
+
+        def indexes_created():
+            if indexes_error:
+                raise Failure(indexes_error)
+            return f"{created} index(es)"
+
+        suite.add("indexes.sql creates indexes", indexes_created)
+    plan_tests = {n: check_plan(n, queries, plan_db, indexed_db) for n in range(1, 6)}
+
+    # ── Performance at scale ─────────────────────────────────────────────────
+    # Loaded by the first of these checks, outside its timed region, and
+    # not at all when they are filtered out.
+    large_db = suite.fixture(load_large_db)
+    deadline = time.perf_counter() + TIMING_SECTION_BUDGET
+    for n in sorted(QUERY_BUDGETS):
+        # A query that failed its plan check is not timed: a per-row plan
+        # would only use up the time left for the others, and the defect
+        # already counts as one failure.
+        if plan_tests[n].name not in suite.failed:
+            check_query_time(n, queries, large_db, deadline)
+
+    suite.finish()
 
 
 if __name__ == "__main__":
@@ -2,84 +2,36 @@
 """Evaluator for Task 09: Debug & Fix"""
 import sys
 import os
-import importlib.util
-import threading
-import queue
 
-TASK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                        '..', '..', 'tasks', 'task_09_debug_fix')
-TIMEOUT = 2  # seconds per individual test call
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from harness import Failure, Suite  # noqa: E402
 
+# Unfixed bugs loop forever; isolated calls are killed instead of left spinning.
+suite = Suite('task_09_debug_fix', isolate=True)
 
-def _call_with_timeout(fn, timeout):
-    """Run fn() in a daemon thread.
-
-    Returns:
-        ('ok', value)      — fn() returned normally
-        ('err', exception) — fn() raised an exception
-        ('timeout', None)  — fn() did not finish within timeout seconds
-    """
-    result_q = queue.Queue()
-
-    def worker():
-        try:
-            result_q.put(('ok', fn()))
-        except Exception as e:
-            result_q.put(('err', e))
-
-    t = threading.Thread(target=worker, daemon=True)
-    t.start()
-    t.join(timeout)
-    if t.is_alive():
-        return 'timeout', None
-    try:
-        return result_q.get_nowait()
-    except queue.Empty:
-        return 'timeout', None
-
-
-def load_solution():
-    path = os.path.join(TASK_DIR, 'buggy_code.py')
-    if not os.path.exists(path):
-        print("[FAIL] buggy_code.py not found")
-        sys.exit(1)
-    spec = importlib.util.spec_from_file_location("buggy_code", path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
+TIMEOUT = 2  # seconds per individual test call
 
 
 def load_fresh():
     """Load a fresh copy of the module to avoid mutable-default contamination."""
-    path = os.path.join(TASK_DIR, 'buggy_code.py')
-    spec = importlib.util.spec_from_file_location("buggy_fresh", path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
-
-
-passed = failed = 0
+    return suite.load_solution('buggy_code.py', 'buggy_fresh')
 
 
 def check(name, fn, expected):
-    global passed, failed
-    kind, val = _call_with_timeout(fn, TIMEOUT)
-    if kind == 'timeout':
-        print(f"[FAIL] {name}: timed out after {TIMEOUT}s (infinite loop - bug not fixed)")
-        failed += 1
-    elif kind == 'err':
-        print(f"[FAIL] {name}: {type(val).__name__}: {val}")
-        failed += 1
-    elif val == expected:
-        print(f"[PASS] {name}")
-        passed += 1
-    else:
-        print(f"[FAIL] {name}: expected {expected!r}, got {val!r}")
-        failed += 1
+    def body():
+        kind, val = suite.call(fn, TIMEOUT)
+        if kind == 'timeout':
+            raise Failure(f"timed out after {TIMEOUT}s (infinite loop - bug not fixed)")
+        if kind == 'err':
+            raise val
+        if val != expected:
+            raise Failure(f"expected {expected!r}, got {val!r}")
+
+    suite.add(name, body)
 
 
 def main():
-    sol = load_solution()
+    sol = suite.load_solution('buggy_code.py')
 
     # -- binary_search ---------------------------------------------------------
     # Bug: left = mid  should be  left = mid + 1
@@ -127,8 +79,7 @@ def main():
     check("sliding window all same values",
           lambda: sol.max_sliding_window([3, 3, 3, 3], 2),                [3, 3, 3])
 
-    print(f"\nResults: {passed}/{passed + failed} tests passed")
-    sys.exit(0 if failed == 0 else 1)
+    suite.finish()
 
 
 if __name__ == "__main__":
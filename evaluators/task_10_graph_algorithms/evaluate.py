@@ -2,52 +2,22 @@
 """Evaluator for Task 10: Graph Algorithms"""
 import sys
 import os
-import importlib.util
 
-TASK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                        '..', '..', 'tasks', 'task_10_graph_algorithms')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from harness import Suite  # noqa: E402
 
+suite = Suite('task_10_graph_algorithms')
 
-def load_solution():
-    path = os.path.join(TASK_DIR, 'graph.py')
-    if not os.path.exists(path):
-        print("[FAIL] graph.py not found")
-        sys.exit(1)
-    spec = importlib.util.spec_from_file_location("graph", path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
+check = suite.validate
 
 
-passed = failed = 0
-
-
-def check(name, fn, validator):
-    global passed, failed
-    try:
-        got = fn()
-        ok, msg = validator(got)
-        if ok:
-            print(f"[PASS] {name}")
-            passed += 1
-        else:
-            print(f"[FAIL] {name}: {msg} (got {got!r})")
-            failed += 1
-    except NotImplementedError:
-        print(f"[FAIL] {name}: not implemented")
-        failed += 1
-    except Exception as e:
-        print(f"[FAIL] {name}: {type(e).__name__}: {e}")
-        failed += 1
+# graph.py is executed once for the whole run rather than once per graph.
+graph_module = suite.fixture(lambda: suite.load_solution('graph.py', 'graph_fresh'))
 
 
 def fresh_graph(directed=False):
-    """Load a fresh module and return a new Graph instance."""
-    spec = importlib.util.spec_from_file_location(
-        "graph_fresh", os.path.join(TASK_DIR, 'graph.py'))
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod.Graph(directed=directed)
+    """Return a new, empty Graph instance."""
+    return graph_module().Graph(directed=directed)
 
 
 def build_undirected():
@@ -85,8 +55,22 @@ def build_weighted():
     return g
 
 
+def build_broom(handle=1000, bristles=5000):
+    """A path 0..handle-1 whose last vertex fans out to `bristles` leaves.
+
+    BFS reaches every leaf at the same depth, so a search that queues a
+    whole path per vertex holds bristles x handle list entries at once.
+    """
+    g = fresh_graph(directed=False)
+    for v in range(handle - 1):
+        g.add_edge(v, v + 1)
+    for leaf in range(handle, handle + bristles):
+        g.add_edge(handle - 1, leaf)
+    return g
+
+
 def main():
-    sol = load_solution()
+    sol = suite.load_solution('graph.py')
 
     # ── add_edge / basic structure ────────────────────────────────────────────
     check(
@@ -163,6 +147,12 @@ def main():
         lambda: build_directed().shortest_path('C', 'A'),
         lambda v: (v is None, f"expected None for unreachable node, got {v}")
     )
+    # Memory: predecessor links take ~0.5MB here, a queued path per vertex ~40MB.
+    suite.check_memory(
+        "shortest_path 6000-vertex broom peak memory",
+        lambda g: g.shortest_path(0, 5999), 8 * 2**20,
+        make_args=lambda: (build_broom(),)
+    )
 
     # ── dijkstra ──────────────────────────────────────────────────────────────
     check(
@@ -218,8 +208,7 @@ def main():
         lambda v: (v is True, "A->B->C->A should be a cycle")
     )
 
-    print(f"\nResults: {passed}/{passed + failed} tests passed")
-    sys.exit(0 if failed == 0 else 1)
+    suite.finish()
 
 
 if __name__ == "__main__":
@@ -2,77 +2,21 @@
 """Evaluator for Task 11: Performance Optimization"""
 import sys
 import os
-import importlib.util
-import time
-import threading
 
-TASK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                        '..', '..', 'tasks', 'task_11_perf_optimization')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from harness import Suite  # noqa: E402
 
+# A timed-out slow solution must not keep a core busy while later checks are timed.
+suite = Suite('task_11_perf_optimization', isolate=True)
 
-def load_solution():
-    path = os.path.join(TASK_DIR, 'slow_functions.py')
-    if not os.path.exists(path):
-        print("[FAIL] slow_functions.py not found")
-        sys.exit(1)
-    spec = importlib.util.spec_from_file_location("slow_functions", path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
-
-
-passed = failed = 0
-
-
-def check(name, fn, expected):
-    global passed, failed
-    try:
-        got = fn()
-        if got == expected:
-            print(f"[PASS] {name}")
-            passed += 1
-        else:
-            print(f"[FAIL] {name}: expected {expected!r}, got {got!r}")
-            failed += 1
-    except Exception as e:
-        print(f"[FAIL] {name}: {type(e).__name__}: {e}")
-        failed += 1
-
-
-def check_perf(name, fn, limit_s):
-    """Run fn() in a daemon thread; fail if over limit_s or if it hangs."""
-    global passed, failed
-    exc = [None]
-
-    def target():
-        try:
-            fn()
-        except Exception as e:
-            exc[0] = e
-
-    hard_limit = max(limit_s * 5, 5.0)
-    t = threading.Thread(target=target, daemon=True)
-    t0 = time.time()
-    t.start()
-    t.join(timeout=hard_limit)
-    elapsed = time.time() - t0
-
-    if t.is_alive():
-        print(f"[FAIL] {name}: timed out (limit {limit_s}s)")
-        failed += 1
-    elif exc[0] is not None:
-        print(f"[FAIL] {name}: {type(exc[0]).__name__}: {exc[0]}")
-        failed += 1
-    elif elapsed <= limit_s:
-        print(f"[PASS] {name} ({elapsed*1000:.1f}ms)")
-        passed += 1
-    else:
-        print(f"[FAIL] {name}: took {elapsed:.2f}s (limit {limit_s}s)")
-        failed += 1
+check = suite.check
+check_perf = suite.check_perf
+check_complexity = suite.check_complexity
+check_ops = suite.check_ops
 
 
 def main():
-    sol = load_solution()
+    sol = suite.load_solution('slow_functions.py')
 
     # -- has_duplicates correctness --------------------------------------------
     check("has_duplicates empty list",         lambda: sol.has_duplicates([]),         False)
@@ -84,6 +28,12 @@ def main():
     # -- has_duplicates performance --------------------------------------------
     big_list = list(range(100_000))
     check_perf("has_duplicates 100k distinct elements (no dupe)", lambda: sol.has_duplicates(big_list), 0.5)
+    # A fast O(n^2) can still pass at one size; check how time grows with n.
+    check_complexity("has_duplicates scales at most O(n log n)",
+                     sol.has_duplicates, lambda n: (list(range(n)),), "O(n log n)")
+    # Op counts do not depend on the host: at most a few passes over the list.
+    check_ops("has_duplicates 10k loop iterations", sol.has_duplicates, max_loops=100_000,
+              make_args=lambda: (list(range(10_000)),))
 
     # -- fibonacci correctness -------------------------------------------------
     check("fibonacci(0)",  lambda: sol.fibonacci(0),  0)
@@ -94,6 +44,8 @@ def main():
 
     # -- fibonacci performance -------------------------------------------------
     check_perf("fibonacci(40) fast", lambda: sol.fibonacci(40), 1.0)
+    # Memoised or iterative code makes ~40 calls; the naive recursion 331 million.
+    check_ops("fibonacci(40) call count", lambda: sol.fibonacci(40), max_calls=1000)
 
     # -- find_common_elements correctness -------------------------------------
     check("find_common_elements empty",
@@ -111,9 +63,12 @@ def main():
     a = list(range(50_000))
     b = list(range(25_000, 75_000))
     check_perf("find_common_elements 50k x 50k fast", lambda: sol.find_common_elements(a, b), 0.5)
+    # O(n + m) with n = m; O(n) and O(n log n) are not reliably separable by timing.
+    check_complexity("find_common_elements scales at most O(n log n)",
+                     sol.find_common_elements,
+                     lambda n: (list(range(n)), list(range(n // 2, n + n // 2))), "O(n log n)")
 
-    print(f"\nResults: {passed}/{passed + failed} tests passed")
-    sys.exit(0 if failed == 0 else 1)
+    suite.finish()
 
 
 if __name__ == "__main__":
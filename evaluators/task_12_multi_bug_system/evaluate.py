@@ -2,58 +2,18 @@
 """Evaluator for Task 12: Multi-Bug System Debug"""
 import sys
 import os
-import importlib.util
-
-TASK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                        '..', '..', 'tasks', 'task_12_multi_bug_system')
-
-
-def load_solution():
-    path = os.path.join(TASK_DIR, 'order_system.py')
-    if not os.path.exists(path):
-        print("[FAIL] order_system.py not found")
-        sys.exit(1)
-    spec = importlib.util.spec_from_file_location("order_system", path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
-
-
-passed = failed = 0
-
-
-def check(name, fn, expected):
-    global passed, failed
-    try:
-        got = fn()
-        if got == expected:
-            print(f"[PASS] {name}")
-            passed += 1
-        else:
-            print(f"[FAIL] {name}: expected {expected!r}, got {got!r}")
-            failed += 1
-    except Exception as e:
-        print(f"[FAIL] {name}: {type(e).__name__}: {e}")
-        failed += 1
-
-
-def check_raises(name, fn, exc_type):
-    """Pass if fn() raises exc_type, fail otherwise."""
-    global passed, failed
-    try:
-        fn()
-        print(f"[FAIL] {name}: expected {exc_type.__name__}, got no exception")
-        failed += 1
-    except exc_type:
-        print(f"[PASS] {name}")
-        passed += 1
-    except Exception as e:
-        print(f"[FAIL] {name}: expected {exc_type.__name__}, got {type(e).__name__}: {e}")
-        failed += 1
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from harness import Suite  # noqa: E402
+
+suite = Suite('task_12_multi_bug_system')
+
+check = suite.check
+check_raises = suite.check_raises
 
 
 def main():
-    sol = load_solution()
+    sol = suite.load_solution('order_system.py')
     Order = sol.Order
     OrderBook = sol.OrderBook
     Portfolio = sol.Portfolio
@@ -131,8 +91,7 @@ def main():
           integration,
           (2800.0, 7150.0))
 
-    print(f"\nResults: {passed}/{passed + failed} tests passed")
-    sys.exit(0 if failed == 0 else 1)
+    suite.finish()
 
 
 if __name__ == "__main__":
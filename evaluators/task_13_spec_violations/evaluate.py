@@ -2,43 +2,17 @@
 """Evaluator for Task 13: Spec Violations — Token Bucket"""
 import sys
 import os
-import importlib.util
 
-TASK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                        '..', '..', 'tasks', 'task_13_spec_violations')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from harness import Suite  # noqa: E402
 
+suite = Suite('task_13_spec_violations')
 
-def load_solution():
-    path = os.path.join(TASK_DIR, 'token_bucket.py')
-    if not os.path.exists(path):
-        print("[FAIL] token_bucket.py not found")
-        sys.exit(1)
-    spec = importlib.util.spec_from_file_location("token_bucket", path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
-
-
-passed = failed = 0
-
-
-def check(name, fn, expected):
-    global passed, failed
-    try:
-        got = fn()
-        if got == expected:
-            print(f"[PASS] {name}")
-            passed += 1
-        else:
-            print(f"[FAIL] {name}: expected {expected!r}, got {got!r}")
-            failed += 1
-    except Exception as e:
-        print(f"[FAIL] {name}: {type(e).__name__}: {e}")
-        failed += 1
+check = suite.check
 
 
 def main():
-    sol = load_solution()
+    sol = suite.load_solution('token_bucket.py')
     TB = sol.TokenBucket
 
     # -- Violation 1: __init__ starts empty instead of full ------------------
@@ -140,8 +114,7 @@ def main():
           full_scenario,
           True)
 
-    print(f"\nResults: {passed}/{passed + failed} tests passed")
-    sys.exit(0 if failed == 0 else 1)
+    suite.finish()
 
 
 if __name__ == "__main__":
@@ -6,10 +6,12 @@
 
 const path = require('path');
 
+const TASKS_ROOT = process.env.BENCH_TASKS_DIR || path.join(__dirname, '..', '..', 'tasks');
+
 let fetchWithRetry, runParallel, withTimeout;
 try {
   ({ fetchWithRetry, runParallel, withTimeout } = require(
-    path.join(__dirname, '..', '..', 'tasks', 'task_14_async_errors', 'async_utils.js')
+    path.join(TASKS_ROOT, 'task_14_async_errors', 'async_utils.js')
   ));
 } catch (e) {
   console.log(`[FAIL] Could not load async_utils.js: ${e.message}`);
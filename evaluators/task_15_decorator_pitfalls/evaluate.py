@@ -2,57 +2,18 @@
 """Evaluator for Task 15: Decorator Pitfalls"""
 import sys
 import os
-import importlib.util
 
-TASK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                        '..', '..', 'tasks', 'task_15_decorator_pitfalls')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from harness import Suite  # noqa: E402
 
+suite = Suite('task_15_decorator_pitfalls')
 
-def load_solution():
-    path = os.path.join(TASK_DIR, 'decorators.py')
-    if not os.path.exists(path):
-        print("[FAIL] decorators.py not found")
-        sys.exit(1)
-    spec = importlib.util.spec_from_file_location("decorators", path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
-
-
-passed = failed = 0
-
-
-def check(name, fn, expected):
-    global passed, failed
-    try:
-        got = fn()
-        if got == expected:
-            print(f"[PASS] {name}")
-            passed += 1
-        else:
-            print(f"[FAIL] {name}: expected {expected!r}, got {got!r}")
-            failed += 1
-    except Exception as e:
-        print(f"[FAIL] {name}: {type(e).__name__}: {e}")
-        failed += 1
-
-
-def check_raises(name, fn, exc_type):
-    global passed, failed
-    try:
-        fn()
-        print(f"[FAIL] {name}: expected {exc_type.__name__}, got no exception")
-        failed += 1
-    except exc_type:
-        print(f"[PASS] {name}")
-        passed += 1
-    except Exception as e:
-        print(f"[FAIL] {name}: expected {exc_type.__name__}, got {type(e).__name__}: {e}")
-        failed += 1
+check = suite.check
+check_raises = suite.check_raises
 
 
 def main():
-    sol = load_solution()
+    sol = suite.load_solution('decorators.py')
 
     # -- logged: must preserve __name__ and __doc__ --------------------------
     # Bug: missing @functools.wraps(func)
@@ -166,8 +127,7 @@ def main():
           lambda: all(isinstance(t, float) for t in fast_fn.call_times),
           True)
 
-    print(f"\nResults: {passed}/{passed + failed} tests passed")
-    sys.exit(0 if failed == 0 else 1)
+    suite.finish()
 
 
 if __name__ == "__main__":
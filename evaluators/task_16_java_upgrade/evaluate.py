@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 """Evaluator for Task 16: Java Version Upgrade"""
+import hashlib
 import sys
 import os
 import shutil
 import subprocess
 import tempfile
 
-TASK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                        '..', '..', 'tasks', 'task_16_java_upgrade')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from harness import artifact_dir, artifact_path, find_binary, prune_artifacts  # noqa: E402
+
+TASKS_ROOT = os.environ.get('BENCH_TASKS_DIR') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'tasks')
+TASK_DIR = os.path.join(TASKS_ROOT, 'task_16_java_upgrade')
 EVAL_DIR = os.path.dirname(os.path.abspath(__file__))
+# Compiled classes, one directory per hash of the sources and the JDK.
+ARTIFACT_DIR = artifact_dir('task_16_java_upgrade')
 
 ALL_TESTS = [
     "findFirst present",
@@ -27,41 +34,72 @@ ALL_TESTS = [
 ]
 
 
-def main():
-    if not shutil.which('javac'):
-        print("[SKIP] Java runtime not found (javac not on PATH)")
-        sys.exit(2)
+def artifact_key(paths, javac):
+    """Hash of the source files and the identity of the javac binary."""
+    h = hashlib.sha256()
+    real = os.path.realpath(javac)
+    st = os.stat(real)
+    h.update(f"{real}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    for path in paths:
+        with open(path, 'rb') as f:
+            h.update(f.read() + b'\0')
+    return h.hexdigest()
 
-    solution_path = os.path.join(TASK_DIR, 'StringUtils.java')
-    if not os.path.exists(solution_path):
-        print("[FAIL] StringUtils.java not found in task directory")
-        sys.exit(1)
 
-    tmpdir = tempfile.mkdtemp()
+def compile_classes(javac, sources, out_dir):
+    """Compile sources into out_dir, publishing it atomically; return True on success."""
+    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+    tmpdir = tempfile.mkdtemp(dir=ARTIFACT_DIR)
     try:
-        shutil.copy(solution_path, tmpdir)
-        shutil.copy(os.path.join(EVAL_DIR, 'TestStringUtils.java'), tmpdir)
-
+        for path in sources:
+            shutil.copy(path, tmpdir)
         result = subprocess.run(
-            ['javac', 'StringUtils.java', 'TestStringUtils.java'],
+            [javac] + [os.path.basename(p) for p in sources],
             cwd=tmpdir,
             capture_output=True,
             text=True,
         )
-
         if result.returncode != 0:
-            for name in ALL_TESTS:
-                print(f"[FAIL] {name}: compile error")
-            sys.exit(1)
+            return False
+        for path in sources:
+            os.remove(os.path.join(tmpdir, os.path.basename(path)))
+        try:
+            os.rename(tmpdir, out_dir)
+        except OSError:
+            pass  # another evaluator published the same classes first
+        prune_artifacts(ARTIFACT_DIR)
+        return True
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def main():
+    javac, java = find_binary('javac'), find_binary('java')
+    if not javac or not java:
+        print("[SKIP] Java runtime not found (javac or java not on PATH)")
+        sys.exit(2)
+
+    solution_path = os.path.join(TASK_DIR, 'StringUtils.java')
+    if not os.path.exists(solution_path):
+        print("[FAIL] StringUtils.java not found in task directory")
+        sys.exit(1)
 
+    sources = [solution_path, os.path.join(EVAL_DIR, 'TestStringUtils.java')]
+    out_dir = artifact_path(ARTIFACT_DIR, artifact_key(sources, javac))
+    # An unchanged solution goes straight to execution.
+    if not os.path.isdir(out_dir) and not compile_classes(javac, sources, out_dir):
+        for name in ALL_TESTS:
+            print(f"[FAIL] {name}: compile error")
+        sys.exit(1)
+
+    # Run from a scratch directory: files the tests write must not land in
+    # the cached classes that later runs reuse.
+    with tempfile.TemporaryDirectory() as scratch:
         result = subprocess.run(
-            ['java', 'TestStringUtils'],
-            cwd=tmpdir,
+            [java, '-cp', out_dir, 'TestStringUtils'],
+            cwd=scratch,
         )
-        sys.exit(result.returncode)
-
-    finally:
-        shutil.rmtree(tmpdir, ignore_errors=True)
+    sys.exit(result.returncode)
 
 
 if __name__ == "__main__":
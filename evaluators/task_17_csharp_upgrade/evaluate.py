@@ -1,14 +1,29 @@
 #!/usr/bin/env python3
 """Evaluator for Task 17: C# Version Upgrade"""
+import hashlib
 import sys
 import os
 import shutil
 import subprocess
 import tempfile
 
-TASK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                        '..', '..', 'tasks', 'task_17_csharp_upgrade')
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from harness import (artifact_dir, artifact_path, find_binary, prune_artifacts,  # noqa: E402
+                     runner_toolchain)
+
+TASKS_ROOT = os.environ.get('BENCH_TASKS_DIR') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'tasks')
+TASK_DIR = os.path.join(TASKS_ROOT, 'task_17_csharp_upgrade')
 EVAL_DIR = os.path.dirname(os.path.abspath(__file__))
+# Holds one restored project directory per target framework (reused for every
+# build so NuGet restore runs once) and one directory of build output per
+# hash of the sources and the SDKs.
+ARTIFACT_DIR = artifact_dir('task_17_csharp_upgrade')
 
 ALL_TESTS = [
     "GetLengths count",
@@ -35,22 +50,29 @@ CSPROJ_TEMPLATE = """\
 """
 
 
-def detect_target_framework():
-    """Return 'netN.0' for the highest installed .NET SDK >= 6, or None."""
+def list_sdk_versions(dotnet):
+    """Return installed .NET SDK versions ("8.0.100", ...), or None if unknown."""
+    toolchain = runner_toolchain()
+    if toolchain and toolchain.get('dotnet_sdks') is not None:
+        return toolchain['dotnet_sdks']
     try:
         result = subprocess.run(
-            ['dotnet', '--list-sdks'],
+            [dotnet, '--list-sdks'],
             capture_output=True, text=True, timeout=15,
         )
-        if result.returncode != 0:
-            return None
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    # Lines look like: "8.0.100 [/usr/share/dotnet/sdk]"
+    return [line.split()[0] for line in result.stdout.splitlines() if line.strip()]
+
+
+def detect_target_framework(sdks):
+    """Return 'netN.0' for the highest of the SDK versions >= 6, or None."""
+    try:
         highest = 0
-        for line in result.stdout.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            # Lines look like: "8.0.100 [/usr/share/dotnet/sdk]"
-            version_str = line.split()[0]
+        for version_str in sdks or []:
             major = int(version_str.split('.')[0])
             if major >= 6 and major > highest:
                 highest = major
@@ -61,12 +83,80 @@ def detect_target_framework():
         return None
 
 
+def artifact_key(paths, framework, sdks):
+    """Hash of the source files, the target framework and the installed SDKs."""
+    h = hashlib.sha256()
+    h.update(f"{framework}\n{sdks}\n".encode())
+    for path in paths:
+        with open(path, 'rb') as f:
+            h.update(f.read() + b'\0')
+    return h.hexdigest()
+
+
+class ProjectLock:
+    """Exclusive lock on the shared project directory while it is built."""
+
+    def __init__(self, project_dir):
+        self.path = os.path.join(project_dir, '.lock')
+
+    def __enter__(self):
+        self.file = open(self.path, 'w')
+        if fcntl is not None:
+            fcntl.flock(self.file, fcntl.LOCK_EX)
+
+    def __exit__(self, *exc):
+        self.file.close()
+
+
+def build(dotnet, sources, framework, out_dir):
+    """Build sources in the warm project directory and publish the output to out_dir.
+
+    Returns True on success.
+    """
+    project_dir = os.path.join(ARTIFACT_DIR, f"project-{framework}")
+    os.makedirs(project_dir, exist_ok=True)
+    with ProjectLock(project_dir):
+        proj_path = os.path.join(project_dir, "task17.csproj")
+        if not os.path.exists(proj_path):
+            with open(proj_path, 'w') as f:
+                f.write(CSPROJ_TEMPLATE.format(framework=framework))
+        for path in sources:
+            shutil.copy(path, project_dir)
+
+        cmd = [dotnet, 'build', '-v', 'quiet', '--nologo']
+        if os.path.exists(os.path.join(project_dir, 'obj', 'project.assets.json')):
+            cmd.append('--no-restore')
+        result = subprocess.run(
+            cmd,
+            cwd=project_dir,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            return False
+
+        tmpdir = tempfile.mkdtemp(dir=ARTIFACT_DIR)
+        try:
+            shutil.copytree(os.path.join(project_dir, 'bin', 'Debug', framework), tmpdir,
+                            dirs_exist_ok=True)
+            try:
+                os.rename(tmpdir, out_dir)
+            except OSError:
+                pass  # another evaluator published the same build first
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+    prune_artifacts(ARTIFACT_DIR)
+    return True
+
+
 def main():
-    if not shutil.which('dotnet'):
+    dotnet = find_binary('dotnet')
+    if not dotnet:
         print("[SKIP] .NET runtime not found (dotnet not on PATH)")
         sys.exit(2)
 
-    framework = detect_target_framework()
+    sdks = list_sdk_versions(dotnet)
+    framework = detect_target_framework(sdks)
     if framework is None:
         print("[SKIP] No .NET 6+ SDK found")
         sys.exit(2)
@@ -76,35 +166,22 @@ def main():
         print("[FAIL] TextProcessor.cs not found in task directory")
         sys.exit(1)
 
-    tmpdir = tempfile.mkdtemp()
-    try:
-        proj_path = os.path.join(tmpdir, "task17.csproj")
-        with open(proj_path, 'w') as f:
-            f.write(CSPROJ_TEMPLATE.format(framework=framework))
-
-        shutil.copy(solution_path, tmpdir)
-        shutil.copy(os.path.join(EVAL_DIR, 'TestRunner.cs'), tmpdir)
-
-        result = subprocess.run(
-            ['dotnet', 'build', '-v', 'quiet', '--nologo'],
-            cwd=tmpdir,
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode != 0:
-            for name in ALL_TESTS:
-                print(f"[FAIL] {name}: build error")
-            sys.exit(1)
+    sources = [solution_path, os.path.join(EVAL_DIR, 'TestRunner.cs')]
+    out_dir = artifact_path(ARTIFACT_DIR, artifact_key(sources, framework, sdks))
+    # An unchanged solution goes straight to execution.
+    if not os.path.isdir(out_dir) and not build(dotnet, sources, framework, out_dir):
+        for name in ALL_TESTS:
+            print(f"[FAIL] {name}: build error")
+        sys.exit(1)
 
+    # Run from a scratch directory: files the tests write must not land in
+    # the cached build that later runs reuse.
+    with tempfile.TemporaryDirectory() as scratch:
         result = subprocess.run(
-            ['dotnet', 'run', '--no-build', '--nologo'],
-            cwd=tmpdir,
+            [dotnet, os.path.join(out_dir, 'task17.dll')],
+            cwd=scratch,
         )
-        sys.exit(result.returncode)
-
-    finally:
-        shutil.rmtree(tmpdir, ignore_errors=True)
+    sys.exit(result.returncode)
 
 
 if __name__ == "__main__":
@@ -2,71 +2,33 @@
 """Evaluator for Task 18: Misleading Approaches"""
 import sys
 import os
-import importlib.util
 
-TASK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                        '..', '..', 'tasks', 'task_18_misleading_approaches')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from harness import Failure, Suite  # noqa: E402
 
+suite = Suite('task_18_misleading_approaches')
 
-def load_solution():
-    path = os.path.join(TASK_DIR, 'utils.py')
-    if not os.path.exists(path):
-        print("[FAIL] utils.py not found")
-        sys.exit(1)
-    spec = importlib.util.spec_from_file_location("utils", path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
-
-
-passed = failed = 0
-
-
-def check(name, fn, expected):
-    global passed, failed
-    try:
-        got = fn()
-        if got == expected:
-            print(f"[PASS] {name}")
-            passed += 1
-        else:
-            print(f"[FAIL] {name}: expected {expected!r}, got {got!r}")
-            failed += 1
-    except NotImplementedError:
-        print(f"[FAIL] {name}: not implemented")
-        failed += 1
-    except Exception as e:
-        print(f"[FAIL] {name}: {type(e).__name__}: {e}")
-        failed += 1
+check = suite.check
 
 
 def check_deep_copy_independence(name, make_config):
     """Special check: mutate the copy and verify the original is unchanged."""
-    global passed, failed
-    try:
+    def body():
         original = make_config()
-        sol = load_solution()
+        sol = suite.load_solution('utils.py')
         copy = sol.deep_copy_config(original)
 
         # Mutate the nested dict in the copy
         copy["db"]["host"] = "MUTATED"
 
-        if original["db"]["host"] != "MUTATED":
-            print(f"[PASS] {name}")
-            passed += 1
-        else:
-            print(f"[FAIL] {name}: modifying copy changed the original (shallow copy detected)")
-            failed += 1
-    except NotImplementedError:
-        print(f"[FAIL] {name}: not implemented")
-        failed += 1
-    except Exception as e:
-        print(f"[FAIL] {name}: {type(e).__name__}: {e}")
-        failed += 1
+        if original["db"]["host"] == "MUTATED":
+            raise Failure("modifying copy changed the original (shallow copy detected)")
+
+    suite.add(name, body)
 
 
 def main():
-    sol = load_solution()
+    sol = suite.load_solution('utils.py')
 
     # ── deep_copy_config: 5 tests ──────────────────────────────────────
 
@@ -182,8 +144,7 @@ def main():
           lambda: sol.count_overlapping("ababab", "aba"),
           2)
 
-    print(f"\nResults: {passed}/{passed + failed} tests passed")
-    sys.exit(0 if failed == 0 else 1)
+    suite.finish()
 
 
 if __name__ == "__main__":
@@ -5,14 +5,305 @@ Usage:
     python run_benchmarks.py                      # run all tasks
     python run_benchmarks.py --task task_01       # run a specific task (partial name)
     python run_benchmarks.py --verbose            # show every test line
+    python run_benchmarks.py --jobs 4             # run up to 4 evaluators at once
+    python run_benchmarks.py --no-cache           # ignore cached results, re-run everything
+    python run_benchmarks.py --recalibrate        # re-measure this host's speed factor
+    python run_benchmarks.py --max-failures 5     # stop an evaluator after 5 failed tests
+    python run_benchmarks.py report               # timing trends and regressions from past runs
+    python run_benchmarks.py --forkserver         # fork Python evaluators from a warm process
+    python run_benchmarks.py --submissions DIR    # grade every DIR/<name>/ as a tasks/ tree
+    python run_benchmarks.py --limit-memory 1024  # cap each evaluator's address space (MB)
+    python run_benchmarks.py --repeat 5           # pass rates, flaky tests and timing spread
+    python run_benchmarks.py --task task_05 --test "fib(1000)"  # re-run matching tests only
+    python run_benchmarks.py --profile --task task_10  # cProfile + collapsed stacks per task
+    python run_benchmarks.py --serve 8765         # hand evaluators to remote workers...
+    python run_benchmarks.py worker http://coordinator:8765  # ...started like this on each host
 """
 
 import argparse
+import atexit
+import base64
+import functools
+import hashlib
+import importlib.util
+import io
+import json
+import math
+import pstats
+import re
+import shutil
+import signal
+import socket
+import sqlite3
+import statistics
 import subprocess
 import sys
+import tarfile
+import tempfile
 import os
+import select
+import threading
+import time
+import traceback
+import urllib.error
+import urllib.request
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Bump whenever a change to the runner alters what an evaluator run produces,
+# so stale cache entries are never replayed.
+RUNNER_VERSION = "4"
+
+CACHE_DIR_NAME = ".bench_cache"
+HISTORY_FILE_NAME = ".bench_history.sqlite"
+
+# Evaluators load solutions from $BENCH_TASKS_DIR/<task> when it is set, and
+# from the tasks/ directory next to evaluators/ otherwise.
+TASKS_DIR_ENV = "BENCH_TASKS_DIR"
+
+# JSON description of the toolchain (see probe_toolchain()), passed to every
+# evaluator so they need not locate binaries or list SDKs themselves.
+TOOLCHAIN_ENV = "BENCH_TOOLCHAIN"
+
+# Test-name pattern for evaluators built on evaluators/harness; evaluators
+# that do not use the harness ignore it and run every test.
+TEST_FILTER_ENV = "BENCH_TEST_FILTER"
+HARNESS_DIR_NAME = "harness"
+
+# Ends the test name on harness [PASS]/[FAIL] lines; what follows (a pass
+# detail or failure message) is not part of the test's identity.
+TEST_DETAIL_SEP = "\t"
+
+# Line a harness evaluator prints when some failure was a near miss on
+# wall-clock time.  Such results are not cached: the next run may well pass.
+TIMING_MARKER = "[TIMING]"
+
+# Host speed relative to the reference machine, from the harness's calibration
+# workload.  Evaluators scale their perf limits by it (see
+# evaluators/harness/calibration.py).
+SPEED_FACTOR_ENV = "BENCH_SPEED_FACTOR"
+
+# "1" makes every harness-based evaluator run its timed checks in killable
+# child processes, not just those that opt in (see Suite(isolate=...)).
+ISOLATE_ENV = "BENCH_ISOLATE"
+
+# Directory the harness writes <task>.pstats and <task>.collapsed to when set
+# (see evaluators/harness/profiling.py).
+PROFILE_DIR_ENV = "BENCH_PROFILE_DIR"
+DEFAULT_PROFILE_DIR = ".bench_profiles"
+
+# Binaries the evaluators may shell out to.  Their location and mtime are part
+# of every cache key, so upgrading a toolchain invalidates the cached results.
+TOOLCHAIN_BINARIES = ["node", "npx", "ts-node", "javac", "java", "dotnet"]
+
+EVALUATOR_TIMEOUT = 60  # seconds
+
+# Output retention limits.  A solution that prints in a hot loop must not be
+# able to exhaust the runner's memory: past DEFAULT_MAX_OUTPUT lines only
+# [PASS]/[FAIL] lines are kept, past MAX_RESULT_LINES of those they are only
+# counted, and any single line is cut at MAX_LINE_BYTES.
+DEFAULT_MAX_OUTPUT = 2000
+MAX_RESULT_LINES = 10_000
+MAX_LINE_BYTES = 64 * 1024
+
+
+@dataclass
+class EvalResult:
+    """Outcome of a single evaluator run."""
+    stdout: str
+    stderr: str
+    returncode: int
+    duration: float = 0.0
+    passed: list = field(default_factory=list)
+    failed: list = field(default_factory=list)
+    # [PASS]/[FAIL] lines past MAX_RESULT_LINES, counted but not kept.
+    passed_dropped: int = 0
+    failed_dropped: int = 0
+    cached: bool = False
+    stopped_early: bool = False
+    # Resource usage of the evaluator process tree, from wait4().
+    user_time: float = 0.0
+    sys_time: float = 0.0
+    max_rss: int = 0  # bytes
+    # Which ResourceLimits limit the evaluator ran into ("OOM", "CPU"...), if any.
+    limit: str = None
+    # Some failure depended on host speed (the evaluator printed TIMING_MARKER).
+    timing_dependent: bool = False
+
+    @property
+    def n_passed(self):
+        return len(self.passed) + self.passed_dropped
+
+    @property
+    def n_failed(self):
+        return len(self.failed) + self.failed_dropped
+
+
+@dataclass
+class ResourceLimits:
+    """Per-evaluator rlimits, set in the child before it runs; None means unlimited."""
+    cpu: int = None     # CPU seconds
+    memory: int = None  # bytes of address space
+    files: int = None   # open file descriptors
+    procs: int = None   # processes of the user (ignored for root)
+    fsize: int = None   # bytes written to any one file
+
+    def __bool__(self):
+        return any(v is not None for v in asdict(self).values())
+
+    def apply(self):
+        """Lower this process's limits; called in the evaluator child (see _RLIMIT_BOOT)."""
+        for name, which in (("cpu", "RLIMIT_CPU"), ("memory", "RLIMIT_AS"),
+                            ("files", "RLIMIT_NOFILE"), ("procs", "RLIMIT_NPROC"),
+                            ("fsize", "RLIMIT_FSIZE")):
+            value = getattr(self, name)
+            if value is None:
+                continue
+            which = getattr(resource, which)
+            _, hard = resource.getrlimit(which)
+            # A CPU hard limit one second past the soft one turns an evaluator
+            # that ignores SIGXCPU into a SIGKILL.
+            new_hard = value + 1 if name == "cpu" else value
+            if hard != resource.RLIM_INFINITY:
+                value, new_hard = min(value, hard), min(new_hard, hard)
+            resource.setrlimit(which, (value, new_hard))
+
+
+# How each limit shows up when an evaluator exceeds it: a fatal signal, or an
+# error message in stderr or in a [FAIL] line (Python ignores SIGXFSZ, so
+# an oversized write raises "File too large" instead).  A signal that kills
+# one of the harness's forked test children is reported in its [FAIL] line
+# as "killed by SIG...", and the evaluator itself exits 1.  Under a tight
+# memory limit the dynamic loader may fail before the evaluator starts.
+_LIMIT_SIGNALS = {"cpu": "SIGXCPU", "fsize": "SIGXFSZ"}
+_LIMIT_MESSAGES = {
+    "memory": ("MemoryError", "out of memory", "std::bad_alloc", "OutOfMemoryError",
+               "failed to map segment", "Cannot allocate memory"),
+    "cpu": ("killed by SIGXCPU",),
+    "files": ("Too many open files",),
+    "fsize": ("File too large", "killed by SIGXFSZ"),
+    "procs": ("Resource temporarily unavailable",),
+}
+LIMIT_STATUS = {"memory": "OOM", "cpu": "CPU", "files": "FILES", "procs": "PROCS",
+                "fsize": "FSIZE"}
+
+
+def limit_exceeded(limits: ResourceLimits, returncode: int, text: str):
+    """Return the status ("OOM", "CPU"...) of the limit an evaluator ran into, or None.
+
+    Only limits that were actually set are considered, so a test that
+    exercises MemoryError on purpose is not mistaken for an OOM.
+    """
+    for name, status in LIMIT_STATUS.items():
+        if getattr(limits, name) is None:
+            continue
+        sig = getattr(signal, _LIMIT_SIGNALS.get(name, ""), None)
+        if sig is not None and returncode == -sig:
+            return status
+        if returncode != 0 and any(m in text for m in _LIMIT_MESSAGES.get(name, ())):
+            return status
+    return None
+
+
+# Sets the limits and execs the evaluator's command.  Popen's preexec_fn could
+# do the same, but it is not safe once the runner has threads (--jobs, the
+# output readers): the forked child can deadlock on a lock another thread held.
+_RLIMIT_BOOT = (
+    "import json, os, sys; sys.path.insert(0, sys.argv[1]); "
+    "import run_benchmarks; "
+    "run_benchmarks.ResourceLimits(**json.loads(sys.argv[2])).apply(); "
+    "os.execvp(sys.argv[3], sys.argv[3:])"
+)
+
+
+def limited_command(cmd: list, limits: ResourceLimits):
+    """cmd wrapped so that it runs under limits."""
+    return [sys.executable, "-c", _RLIMIT_BOOT, str(Path(__file__).resolve().parent),
+            json.dumps(asdict(limits))] + cmd
+
+
+@dataclass
+class RunOptions:
+    """Settings shared by every evaluator run in one invocation."""
+    use_cache: bool = True
+    store_cache: bool = True
+    max_output: int = DEFAULT_MAX_OUTPUT
+    max_failures: int = None
+    zygote: "Zygote" = None
+    limits: ResourceLimits = field(default_factory=ResourceLimits)
+    toolchain: dict = None
+    test_filter: str = None
+    speed_factor: float = None
+    profile_dir: Path = None
+    isolate: bool = False
+
+
+class Progress:
+    """Live one-line status on stderr; silent unless stderr is a terminal."""
+
+    def __init__(self, total: int, enabled: bool = None):
+        self.total = total
+        self.done = 0
+        self.running = {}
+        self.enabled = sys.stderr.isatty() if enabled is None else enabled
+        self.lock = threading.RLock()
+
+    def update(self, task_name: str, passed: int, failed: int):
+        with self.lock:
+            self.running[task_name] = (passed, failed)
+            self._draw()
+
+    def finish(self, task_name: str):
+        with self.lock:
+            self.running.pop(task_name, None)
+            self.done += 1
+            self._draw()
+
+    def suspended(self):
+        """Context manager that clears the status line while stdout is written."""
+        progress = self
+
+        class _Suspended:
+            def __enter__(self):
+                progress.lock.acquire()
+                progress._clear()
+
+            def __exit__(self, *exc):
+                sys.stdout.flush()
+                progress._draw()
+                progress.lock.release()
+
+        return _Suspended()
+
+    def close(self):
+        with self.lock:
+            self._clear()
+            self.enabled = False
+
+    def _clear(self):
+        if self.enabled:
+            sys.stderr.write("\r\033[K")
+            sys.stderr.flush()
+
+    def _draw(self):
+        if not self.enabled:
+            return
+        parts = [f"{name}: {p} passed, {f} failed"
+                 for name, (p, f) in sorted(self.running.items())]
+        line = f"[{self.done}/{self.total}] " + "; ".join(parts)
+        width = shutil.get_terminal_size().columns - 1
+        sys.stderr.write("\r\033[K" + line[:width])
+        sys.stderr.flush()
+
 
 def find_evaluators(bench_dir: Path, task_filter: str = None):
     """Return list of (task_name, evaluator_path) sorted by task name."""
@@ -35,8 +326,304 @@ def find_evaluators(bench_dir: Path, task_filter: str = None):
     return result
 
 
-def run_evaluator(eval_file: Path):
-    """Run an evaluator script, returning (stdout, stderr, returncode)."""
+def _iter_lines(stream):
+    """Yield decoded lines from a binary stream, truncating overlong lines."""
+    head = None
+    while True:
+        chunk = stream.readline(MAX_LINE_BYTES)
+        if not chunk:
+            if head is not None:
+                yield head.decode("utf-8", "replace")
+            return
+        if head is None:
+            head = chunk
+        if chunk.endswith(b"\n"):
+            yield head.decode("utf-8", "replace").rstrip("\r\n")
+            head = None
+
+
+def _drain(stream, keep: list, max_lines: int):
+    """Read stream to EOF, keeping only the first max_lines lines."""
+    for line in _iter_lines(stream):
+        if len(keep) < max_lines:
+            keep.append(line)
+
+
+def _usage(status: int, ru):
+    """Convert a wait status and rusage into (returncode, user_s, sys_s, max_rss_bytes)."""
+    # ru_maxrss is in kilobytes on Linux but bytes on macOS.
+    rss_unit = 1 if sys.platform == "darwin" else 1024
+    return (os.waitstatus_to_exitcode(status), ru.ru_utime, ru.ru_stime,
+            ru.ru_maxrss * rss_unit)
+
+
+class _PopenChild:
+    """An evaluator started directly with subprocess.Popen."""
+
+    def __init__(self, proc):
+        self.proc = proc
+        self.pid = proc.pid
+        self.stdout = proc.stdout
+        self.stderr = proc.stderr
+
+    def kill(self):
+        """Kill the evaluator and anything it spawned (javac, dotnet, npx...)."""
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(self.pid, signal.SIGKILL)
+            else:
+                self.proc.kill()
+        except OSError:
+            pass
+
+    def wait(self):
+        """Reap the evaluator, returning (returncode, user_s, sys_s, max_rss_bytes).
+
+        Uses os.wait4() where available so CPU time and peak RSS can be
+        attributed to each evaluator; these figures include any children the
+        evaluator itself waited for (javac, dotnet, node...).
+        """
+        proc = self.proc
+        if not hasattr(os, "wait4") or not hasattr(os, "waitstatus_to_exitcode"):
+            return proc.wait(), 0.0, 0.0, 0
+        while True:
+            try:
+                _, status, ru = os.wait4(proc.pid, 0)
+                break
+            except InterruptedError:
+                continue
+            except ChildProcessError:
+                return proc.wait(), 0.0, 0.0, 0
+        usage = _usage(status, ru)
+        proc.returncode = usage[0]
+        return usage
+
+
+# ── Forkserver ───────────────────────────────────────────────────────────────
+#
+# With --forkserver, Python evaluators are not started as fresh interpreters.
+# A single warm "zygote" process imports the modules evaluators commonly use,
+# then forks one child per evaluator.  Each child gets its own address space,
+# its own session (so it can be killed as a group) and the same stdout/stderr
+# pipes and exit-code contract as a subprocess, but skips interpreter startup.
+#
+# The runner and the zygote talk over a Unix datagram socketpair: the runner
+# sends {"id", "path", "cwd", "env", "limits"} along with the write ends of the child's
+# stdout/stderr pipes; the zygote replies {"id", "pid"} once forked and
+# {"id", "status", "rusage"} once the child has been reaped.  Datagram
+# sockets have no end-of-file, so shutdown is an explicit {"exit": true},
+# acknowledged with {"bye": true} once every child has been reaped.
+
+ZYGOTE_PRELOAD = [
+    "importlib.util", "threading", "queue", "sqlite3", "csv", "json", "re",
+    "random", "time", "collections", "functools", "itertools", "copy",
+    "typing", "dataclasses", "runpy", "traceback", "shutil", "tempfile",
+    "subprocess",
+]
+
+_ZYGOTE_BOOT = (
+    "import sys; sys.path.insert(0, sys.argv[2]); "
+    "import run_benchmarks; run_benchmarks.zygote_main(int(sys.argv[1]))"
+)
+
+
+def forkserver_supported():
+    return hasattr(os, "fork") and hasattr(socket, "send_fds") and hasattr(os, "wait4")
+
+
+def _zygote_child(request, fds):
+    """Body of a forked evaluator process; never returns."""
+    import runpy
+    import traceback
+    code = 1
+    try:
+        os.setsid()
+        os.dup2(fds[0], 1)
+        os.dup2(fds[1], 2)
+        for fd in fds:
+            os.close(fd)
+        ResourceLimits(**request["limits"]).apply()
+        path = request["path"]
+        os.environ.update(request["env"])
+        os.chdir(request["cwd"])
+        sys.argv = [path]
+        sys.path[0] = os.path.dirname(path)
+        try:
+            runpy.run_path(path, run_name="__main__")
+            code = 0
+        except SystemExit as e:
+            if e.code is None:
+                code = 0
+            elif isinstance(e.code, int):
+                code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except BaseException:
+            traceback.print_exc()
+        # os._exit() skips interpreter shutdown; do its visible parts by hand.
+        for thread in threading.enumerate():
+            if thread is not threading.main_thread() and not thread.daemon:
+                thread.join()
+        atexit._run_exitfuncs()
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code)
+
+
+def zygote_main(fd: int):
+    """Serve fork requests on the socket fd until the runner goes away."""
+    import importlib
+    for name in ZYGOTE_PRELOAD:
+        importlib.import_module(name)
+    sock = socket.socket(fileno=fd)
+    children = {}
+    open_ = True
+    while open_ or children:
+        readable, _, _ = select.select([sock] if open_ else [], [], [], 0.05)
+        if readable:
+            msg, fds, _, _ = socket.recv_fds(sock, 65536, 2)
+            request = json.loads(msg)
+            if request.get("exit"):
+                open_ = False
+            else:
+                pid = os.fork()
+                if pid == 0:
+                    sock.close()
+                    _zygote_child(request, fds)
+                for child_fd in fds:
+                    os.close(child_fd)
+                children[pid] = request["id"]
+                sock.send(json.dumps({"id": request["id"], "pid": pid}).encode())
+        while children:
+            try:
+                pid, status, ru = os.wait4(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            reply = {"id": children.pop(pid), "status": status,
+                     "rusage": [ru.ru_utime, ru.ru_stime, ru.ru_maxrss]}
+            sock.send(json.dumps(reply).encode())
+    sock.send(json.dumps({"bye": True}).encode())
+
+
+class _RUsage:
+    def __init__(self, utime, stime, maxrss):
+        self.ru_utime, self.ru_stime, self.ru_maxrss = utime, stime, maxrss
+
+
+class _ZygoteChild:
+    """An evaluator forked by the zygote; mirrors the _PopenChild interface."""
+
+    def __init__(self, pid, stdout, stderr, exited: Future):
+        self.pid = pid
+        self.stdout = stdout
+        self.stderr = stderr
+        self.exited = exited
+
+    def kill(self):
+        for kill in (os.killpg, os.kill):
+            try:
+                kill(self.pid, signal.SIGKILL)
+                return
+            except OSError:
+                continue
+
+    def wait(self):
+        status, ru = self.exited.result()
+        return _usage(status, _RUsage(*ru))
+
+
+class Zygote:
+    """Runner-side handle on the warm forkserver process."""
+
+    def __init__(self):
+        self.sock, child_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        runner_dir = str(Path(__file__).resolve().parent)
+        self.proc = subprocess.Popen(
+            [sys.executable, "-c", _ZYGOTE_BOOT, str(child_sock.fileno()), runner_dir],
+            pass_fds=[child_sock.fileno()], stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+        )
+        child_sock.close()
+        self.lock = threading.Lock()
+        self.next_id = 0
+        self.pending = {}
+        self.reader = threading.Thread(target=self._read_replies, daemon=True)
+        self.reader.start()
+
+    def _read_replies(self):
+        while True:
+            readable, _, _ = select.select([self.sock], [], [], 0.5)
+            if not readable:
+                if self.proc.poll() is not None:
+                    break
+                continue
+            reply = json.loads(self.sock.recv(65536))
+            if reply.get("bye"):
+                break
+            with self.lock:
+                started, exited = self.pending[reply["id"]]
+                if "status" in reply:
+                    del self.pending[reply["id"]]
+            if "pid" in reply:
+                started.set_result(reply["pid"])
+            else:
+                exited.set_result((reply["status"], reply["rusage"]))
+        # The zygote died: fail everything still waiting on it.
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        for started, exited in pending.values():
+            for future in (started, exited):
+                if not future.done():
+                    future.set_exception(RuntimeError("forkserver exited unexpectedly"))
+
+    def spawn(self, eval_file: Path, env: dict = None, limits: ResourceLimits = None):
+        """Fork an evaluator from the zygote and return a _ZygoteChild.
+
+        env holds variables to set in the child on top of the zygote's own
+        environment; limits are applied in the child before the evaluator runs.
+        """
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        started, exited = Future(), Future()
+        with self.lock:
+            request_id = self.next_id
+            self.next_id += 1
+            self.pending[request_id] = (started, exited)
+        request = {"id": request_id, "path": str(eval_file.resolve()),
+                   "cwd": str(eval_file.parent.resolve()), "env": env or {},
+                   "limits": asdict(limits or ResourceLimits())}
+        try:
+            socket.send_fds(self.sock, [json.dumps(request).encode()], [out_w, err_w])
+        finally:
+            os.close(out_w)
+            os.close(err_w)
+        pid = started.result()
+        return _ZygoteChild(pid, os.fdopen(out_r, "rb"), os.fdopen(err_r, "rb"), exited)
+
+    def close(self):
+        self.sock.send(json.dumps({"exit": True}).encode())
+        self.reader.join()
+        self.proc.wait()
+        self.sock.close()
+
+
+def run_evaluator(eval_file: Path, options: RunOptions = None, on_progress=None,
+                  env: dict = None):
+    """Run an evaluator script and return its EvalResult.
+
+    Output is read line by line as the evaluator produces it.  [PASS]/[FAIL]
+    lines are parsed on arrival and reported through on_progress(passed,
+    failed); with options.max_failures set, the evaluator is killed as soon
+    as that many tests have failed.  env holds extra environment variables
+    for the evaluator.
+    """
+    options = options or RunOptions()
     ext = eval_file.suffix
     if ext == ".py":
         cmd = [sys.executable, str(eval_file)]
@@ -45,18 +632,100 @@ def run_evaluator(eval_file: Path):
     elif ext == ".sh":
         cmd = ["bash", str(eval_file)]
     else:
-        return "", f"Unknown evaluator extension: {ext}", 2
+        return EvalResult("", f"Unknown evaluator extension: {ext}", 2)
 
+    t0 = time.monotonic()
     try:
-        proc = subprocess.run(
-            cmd, capture_output=True, text=True,
-            cwd=str(eval_file.parent), timeout=60
-        )
-        return proc.stdout, proc.stderr, proc.returncode
+        if ext == ".py" and options.zygote is not None:
+            proc = options.zygote.spawn(eval_file, env, options.limits)
+        else:
+            if options.limits:
+                # The wrapper would only fail after starting; keep the error.
+                if shutil.which(cmd[0]) is None:
+                    raise FileNotFoundError(f"No such file or directory: {cmd[0]!r}")
+                cmd = limited_command(cmd, options.limits)
+            proc = _PopenChild(subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                cwd=str(eval_file.parent), start_new_session=True,
+                env={**os.environ, **env} if env else None,
+            ))
     except FileNotFoundError as e:
-        return "", f"Runtime not found: {e}", 2
-    except subprocess.TimeoutExpired:
-        return "", "Evaluator timed out after 60s", 2
+        return EvalResult("", f"Runtime not found: {e}", 2, time.monotonic() - t0)
+    except RuntimeError as e:
+        return EvalResult("", str(e), 2, time.monotonic() - t0)
+
+    timed_out = threading.Event()
+
+    def on_timeout():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(EVALUATOR_TIMEOUT, on_timeout)
+    timer.start()
+    stderr_lines = []
+    stderr_reader = threading.Thread(
+        target=_drain, args=(proc.stderr, stderr_lines, options.max_output), daemon=True)
+    stderr_reader.start()
+
+    kept, passed, failed = [], [], []
+    dropped = passed_dropped = failed_dropped = 0
+    stopped_early = timing_dependent = False
+    try:
+        for line in _iter_lines(proc.stdout):
+            stripped = line.strip()
+            is_result = stripped.startswith(("[PASS]", "[FAIL]"))
+            if is_result and len(passed) + len(failed) >= MAX_RESULT_LINES:
+                if stripped.startswith("[PASS]"):
+                    passed_dropped += 1
+                else:
+                    failed_dropped += 1
+            else:
+                if stripped.startswith("[PASS]"):
+                    passed.append(stripped[7:])
+                elif stripped.startswith("[FAIL]"):
+                    failed.append(stripped[7:])
+                elif stripped.startswith(TIMING_MARKER):
+                    timing_dependent = True
+                elif len(kept) >= options.max_output:
+                    dropped += 1
+                    continue
+                kept.append(line)
+            n_failed = len(failed) + failed_dropped
+            if is_result and on_progress:
+                on_progress(len(passed) + passed_dropped, n_failed)
+            if options.max_failures and n_failed >= options.max_failures:
+                stopped_early = True
+                proc.kill()
+                break
+    finally:
+        proc.stdout.close()
+        returncode, user_time, sys_time, max_rss = proc.wait()
+        timer.cancel()
+        stderr_reader.join()
+        proc.stderr.close()
+    duration = time.monotonic() - t0
+
+    if dropped:
+        kept.append(f"... {dropped} line(s) of output discarded")
+    if passed_dropped or failed_dropped:
+        kept.append(f"... {passed_dropped} passed and {failed_dropped} failed result(s) "
+                    f"past the first {MAX_RESULT_LINES} counted but not kept")
+    if stopped_early:
+        kept.append(f"... stopped after {len(failed) + failed_dropped} failure(s) "
+                    "(--max-failures)")
+    stdout = "\n".join(kept) + "\n" if kept else ""
+    stderr = "\n".join(stderr_lines)
+    usage = dict(user_time=user_time, sys_time=sys_time, max_rss=max_rss)
+    if options.limits:
+        usage["limit"] = limit_exceeded(options.limits, returncode,
+                                        "\n".join(stderr_lines + failed))
+    if timed_out.is_set():
+        return EvalResult(stdout, f"Evaluator timed out after {EVALUATOR_TIMEOUT}s", 2,
+                          duration, **usage)
+    return EvalResult(stdout, stderr, returncode, duration, passed, failed,
+                      passed_dropped=passed_dropped, failed_dropped=failed_dropped,
+                      stopped_early=stopped_early, timing_dependent=timing_dependent,
+                      **usage)
 
 
 def parse_results(output: str):
@@ -71,65 +740,1333 @@ def parse_results(output: str):
     return passed, failed
 
 
+def _hash_tree(h, root: Path):
+    """Feed every file under root (relative path and contents) into h."""
+    if not root.is_dir():
+        h.update(b"<missing>")
+        return
+    for path in sorted(root.rglob("*")):
+        if "__pycache__" in path.parts or not path.is_file():
+            continue
+        h.update(path.relative_to(root).as_posix().encode() + b"\0")
+        h.update(path.read_bytes() + b"\0")
+
+
+@functools.lru_cache(maxsize=None)
+def toolchain_fingerprint():
+    """Describe the interpreters/compilers visible to evaluators.
+
+    Binaries are identified by resolved path, size and mtime rather than by
+    running them, which keeps this cheap enough to compute on every run.
+    """
+    parts = [sys.executable, sys.version]
+    for name in TOOLCHAIN_BINARIES:
+        found = shutil.which(name)
+        if not found:
+            parts.append(f"{name}=-")
+            continue
+        real = os.path.realpath(found)
+        st = os.stat(real)
+        parts.append(f"{name}={real}:{st.st_size}:{st.st_mtime_ns}")
+    return "\n".join(parts)
+
+
+def probe_toolchain():
+    """Locate the toolchain binaries and list the installed .NET SDKs."""
+    binaries = {name: shutil.which(name) for name in TOOLCHAIN_BINARIES}
+    sdks = None
+    if binaries["dotnet"]:
+        try:
+            proc = subprocess.run([binaries["dotnet"], "--list-sdks"],
+                                  capture_output=True, text=True, timeout=15)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        else:
+            if proc.returncode == 0:
+                # Lines look like: "8.0.100 [/usr/share/dotnet/sdk]"
+                sdks = [line.split()[0] for line in proc.stdout.splitlines() if line.strip()]
+    return {"binaries": binaries, "dotnet_sdks": sdks}
+
+
+def load_toolchain(cache_dir: Path, use_cache: bool = True):
+    """Return probe_toolchain(), reusing the last result while PATH and the binaries are unchanged."""
+    parts = [os.environ.get("PATH", ""), toolchain_fingerprint()]
+    dotnet = shutil.which("dotnet")
+    if dotnet:
+        # Installing an SDK adds to the sdk/ directory without touching dotnet.
+        sdk_dir = Path(os.path.realpath(dotnet)).parent / "sdk"
+        parts.append(str(sdk_dir.stat().st_mtime_ns) if sdk_dir.is_dir() else "-")
+    key = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+    path = cache_dir / "toolchain.json"
+    if use_cache:
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        if data.get("key") == key:
+            return data["toolchain"]
+    toolchain = probe_toolchain()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = cache_dir / f"toolchain.{os.getpid()}.tmp"
+    tmp.write_text(json.dumps({"key": key, "toolchain": toolchain}))
+    os.replace(tmp, path)
+    return toolchain
+
+
+def load_calibration(bench_dir: Path, use_cache: bool = True):
+    """Return the harness's host calibration: {"seconds": ..., "factor": ...}.
+
+    Runs before any evaluator starts, so the reference workload is timed on
+    an otherwise idle host rather than racing the first batch of evaluators.
+    """
+    path = bench_dir / "evaluators" / HARNESS_DIR_NAME / "calibration.py"
+    spec = importlib.util.spec_from_file_location("bench_calibration", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.calibrate(str(bench_dir / CACHE_DIR_NAME / "calibration.json"), use_cache)
+
+
+def cache_key(tasks_dir: Path, task_name: str, eval_file: Path,
+              limits: ResourceLimits = None, test_filter: str = None,
+              speed_factor: float = None, isolate: bool = False):
+    """Content hash of everything that can influence an evaluator's result."""
+    h = hashlib.sha256()
+    h.update(f"runner={RUNNER_VERSION}\n{toolchain_fingerprint()}\n".encode())
+    if limits:
+        h.update(f"limits={json.dumps(asdict(limits), sort_keys=True)}\n".encode())
+    if test_filter:
+        h.update(f"test_filter={test_filter}\n".encode())
+    if speed_factor is not None:
+        h.update(f"speed_factor={speed_factor}\n".encode())
+    if isolate:
+        h.update(b"isolate\n")
+    h.update(f"evaluator={eval_file.name}\n".encode())
+    _hash_tree(h, eval_file.parent)
+    h.update(b"harness\n")
+    _hash_tree(h, eval_file.parent.parent / HARNESS_DIR_NAME)
+    h.update(b"tasks\n")
+    _hash_tree(h, tasks_dir / task_name)
+    return h.hexdigest()
+
+
+def load_cached(cache_dir: Path, key: str):
+    """Return the cached EvalResult for key, or None."""
+    path = cache_dir / "results" / f"{key}.json"
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    data["cached"] = True
+    return EvalResult(**data)
+
+
+def store_cached(cache_dir: Path, key: str, result: EvalResult):
+    """Persist result under key.  Writes are atomic so parallel runs can share a cache."""
+    results_dir = cache_dir / "results"
+    results_dir.mkdir(parents=True, exist_ok=True)
+    tmp = results_dir / f"{key}.{os.getpid()}.tmp"
+    data = asdict(result)
+    del data["cached"]
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, results_dir / f"{key}.json")
+
+
+def evaluate_task(bench_dir: Path, task_name: str, eval_file: Path,
+                  options: RunOptions, progress: Progress = None,
+                  tasks_dir: Path = None, label: str = None):
+    """Run one evaluator, replaying a cached result when its inputs are unchanged.
+
+    tasks_dir points the evaluator at another tasks/ tree (a submission);
+    label names the run in the progress line and defaults to task_name.
+    """
+    cache_dir = bench_dir / CACHE_DIR_NAME
+    label = label or task_name
+    env = {}
+    if options.toolchain is not None:
+        env[TOOLCHAIN_ENV] = json.dumps(options.toolchain)
+    if options.test_filter:
+        env[TEST_FILTER_ENV] = options.test_filter
+    if options.speed_factor is not None:
+        env[SPEED_FACTOR_ENV] = str(options.speed_factor)
+    if options.profile_dir is not None:
+        env[PROFILE_DIR_ENV] = str(options.profile_dir.resolve())
+    if options.isolate:
+        env[ISOLATE_ENV] = "1"
+    if tasks_dir is None:
+        tasks_dir = bench_dir / "tasks"
+    else:
+        env[TASKS_DIR_ENV] = str(tasks_dir.resolve())
+    key = cache_key(tasks_dir, task_name, eval_file, options.limits, options.test_filter,
+                    options.speed_factor, options.isolate)
+    result = load_cached(cache_dir, key) if options.use_cache else None
+    if result is None:
+        on_progress = None
+        if progress is not None:
+            on_progress = functools.partial(progress.update, label)
+        result = run_evaluator(eval_file, options, on_progress, env)
+        # Exit code 2 covers missing runtimes and timeouts; both are transient,
+        # and a run cut short by --max-failures is incomplete.  A perf check
+        # failed by a small margin may be host noise, and profiled runs are
+        # slowed down by the profiler, so neither is replayed.
+        if (options.store_cache and result.returncode != 2 and not result.stopped_early
+                and not result.timing_dependent and options.profile_dir is None):
+            store_cached(cache_dir, key, result)
+    if progress is not None:
+        progress.finish(label)
+    return result
+
+
+def _fmt_seconds(seconds: float):
+    return f"{seconds:.2f}s"
+
+
+def _fmt_bytes(n: int):
+    return f"{n / 2**20:.1f}M" if n else "-"
+
+
+def report_result(task_name: str, result: EvalResult, verbose: bool):
+    """Print one task's section of the report and return its summary row."""
+    stdout, stderr, returncode = result.stdout, result.stderr, result.returncode
+    print(f"  {task_name}" + (" (cached)" if result.cached else ""))
+
+    if returncode == 2:
+        # Runtime unavailable or hard error
+        msg = stderr.strip().splitlines()[0] if stderr.strip() else "could not run"
+        print(f"    [SKIP] {msg}")
+        return (task_name, 0, 0, "SKIP")
+
+    if result.limit:
+        print(f"    [{result.limit}] resource limit exceeded "
+              f"({result.n_passed} passed, {result.n_failed} failed)")
+
+    # A non-zero exit with no failed test (a crash, or a runtime that could
+    # not start) must not read as OK.
+    errored = returncode != 0 and not result.n_failed
+    if verbose or result.n_failed or errored:
+        for line in stdout.strip().splitlines():
+            print(f"    {display_test_line(line)}")
+        if stderr.strip() and (verbose or returncode != 0):
+            for line in stderr.strip().splitlines()[:5]:
+                print(f"    STDERR: {line}")
+    else:
+        print(f"    {result.n_passed} passed, {result.n_failed} failed")
+
+    status = result.limit or ("FAIL" if result.n_failed else "ERROR" if errored else "OK")
+    return (task_name, result.n_passed, result.n_failed, status)
+
+
+# ── Batch grading ────────────────────────────────────────────────────────────
+
+def _task_column(task_name: str):
+    """Short matrix column heading for a task: "task_07_csv_analysis" -> "07"."""
+    m = re.match(r"task_(\d+)", task_name)
+    return m.group(1) if m else task_name[:6]
+
+
+def find_submissions(submissions_dir: Path):
+    """Return the submission directories (each laid out like tasks/), sorted by name."""
+    return sorted(d for d in submissions_dir.iterdir()
+                  if d.is_dir() and not d.name.startswith("."))
+
+
+def run_batch(args, bench_dir: Path, evaluators, options: RunOptions):
+    """Grade every submission against every evaluator; print a results matrix.
+
+    Each subdirectory of args.submissions is treated as its own tasks/ tree.
+    All (submission, task) pairs share one worker pool, so a slow evaluator
+    in one submission does not hold up the others.
+    """
+    submissions_dir = Path(args.submissions)
+    if not submissions_dir.is_dir():
+        print(f"Submissions directory not found: {submissions_dir}")
+        return 1
+    submissions = find_submissions(submissions_dir)
+    if not submissions:
+        print(f"No submissions found in {submissions_dir}.")
+        return 1
+
+    pairs = [(sub, task_name, eval_file)
+             for sub in submissions for task_name, eval_file in evaluators]
+    print(f"Grading {len(submissions)} submission(s) x {len(evaluators)} task(s)...\n")
+
+    estimates = load_duration_estimates(history_path(args, bench_dir))
+    rank = {name: i for i, name in
+            enumerate(longest_first([t for t, _ in evaluators], estimates))}
+    cells = {}
+    progress = Progress(len(pairs))
+    t0 = time.monotonic()
+    with open_pool(args, bench_dir) as pool:
+        futures = {}
+        for sub, task_name, eval_file in sorted(pairs, key=lambda p: rank[p[1]]):
+            futures[sub, task_name] = pool.submit(
+                evaluate_task, bench_dir, task_name, eval_file, options, progress,
+                sub, f"{sub.name}/{task_name}")
+        for sub, task_name, _ in pairs:
+            result = futures[sub, task_name].result()
+            if args.verbose:
+                with progress.suspended():
+                    report_result(f"{sub.name}/{task_name}", result, True)
+            cells[sub.name, task_name] = result
+    wall = time.monotonic() - t0
+    progress.close()
+
+    columns = [task_name for task_name, _ in evaluators]
+    width = 24 + 7 * len(columns) + 14
+    print("\n" + "=" * width)
+    print("RESULTS MATRIX (passed/total per task)")
+    print("=" * width)
+    print(f"{'Submission':<24}" + "".join(f"{_task_column(t):>7}" for t in columns)
+          + f"{'Pass':>7}{'Fail':>7}")
+    print("-" * width)
+    any_failed = False
+    for sub in submissions:
+        line = f"{sub.name[:23]:<24}"
+        sub_passed = sub_failed = 0
+        for task_name in columns:
+            r = cells[sub.name, task_name]
+            if r.returncode == 2:
+                cell = "SKIP"
+            elif r.limit:
+                cell = r.limit
+                any_failed = True
+            elif r.returncode != 0 and not r.n_failed:
+                cell = "ERROR"
+                any_failed = True
+            else:
+                cell = f"{r.n_passed}/{r.n_passed + r.n_failed}"
+                sub_passed += r.n_passed
+                sub_failed += r.n_failed
+            line += f"{cell:>7}"
+        print(line + f"{sub_passed:>7}{sub_failed:>7}")
+        any_failed = any_failed or sub_failed > 0
+    print("-" * width)
+    for task_name in columns:
+        print(f"  {_task_column(task_name)} = {task_name}")
+    print()
+    print(packing_report(cells.values(), pool.slots if args.serve else args.jobs, wall))
+    print()
+    return 1 if any_failed else 0
+
+
+# ── Repeat mode ──────────────────────────────────────────────────────────────
+
+def _percentile(values, q: float):
+    """Linear-interpolated q-th percentile (0-100) of values."""
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def _timing_columns(values):
+    if not values:
+        return f"{'-':>10} {'-':>10} {'-':>10}"
+    return (f"{min(values):>8.1f}ms {statistics.median(values):>8.1f}ms "
+            f"{_percentile(values, 95):>8.1f}ms")
+
+
+def run_repeat(args, bench_dir: Path, evaluators, options: RunOptions):
+    """Run every evaluator args.repeat times and report how stable the results are.
+
+    All runs share the worker pool, so with --jobs the repeats of one
+    evaluator overlap.  Results are never replayed from or written to the
+    cache.  Tests passing in some runs but not others are flagged FLAKY;
+    timed tests get the min/median/p95 of the timings they print.
+    """
+    k = args.repeat
+    options = replace(options, use_cache=False, store_cache=False)
+    print(f"Running {len(evaluators)} task(s) x {k} repeat(s)...\n")
+
+    estimates = load_duration_estimates(history_path(args, bench_dir))
+    eval_files = dict(evaluators)
+    runs = {}
+    progress = Progress(len(evaluators) * k)
+    with open_pool(args, bench_dir) as pool:
+        futures = {
+            (task_name, i): pool.submit(evaluate_task, bench_dir, task_name,
+                                        eval_files[task_name], options, progress,
+                                        label=f"{task_name}#{i + 1}")
+            for task_name in longest_first(eval_files, estimates) for i in range(k)
+        }
+        for task_name, _ in evaluators:
+            runs[task_name] = [futures[task_name, i].result() for i in range(k)]
+    progress.close()
+
+    width = 103
+    print("=" * width)
+    print(f"REPEAT SUMMARY ({k} runs per evaluator)")
+    print("=" * width)
+    print(f"{'Task / test':<58} {'Passed':>8} {'Min':>10} {'Median':>10} {'P95':>10}")
+    print("-" * width)
+    flaky = unstable_tasks = always_failing = 0
+    for task_name, results in runs.items():
+        ran = [r for r in results if r.returncode != 2]
+        skipped = len(results) - len(ran)
+        note = f"  ({skipped} skipped)" if skipped else ""
+        durations = [r.duration * 1000 for r in ran]
+        print(f"{task_name[:58]:<58} {len(ran):>3}/{k:<4} {_timing_columns(durations)}{note}")
+        tests = {}
+        known = known_test_names(ran)
+        for r in ran:
+            for status, lines in (("PASS", r.passed), ("FAIL", r.failed)):
+                for text in lines:
+                    name, ms = split_test_line(status, text, known)
+                    entry = tests.setdefault(name, {"passes": 0, "times": []})
+                    entry["passes"] += status == "PASS"
+                    if ms is not None:
+                        entry["times"].append(ms)
+        stable_pass = stable_fail = 0
+        for name, entry in tests.items():
+            # A test missing from some runs (a crash, --max-failures) did not pass there.
+            passes = entry["passes"]
+            is_flaky = 0 < passes < len(ran)
+            flaky += is_flaky
+            always_failing += passes == 0
+            if is_flaky or entry["times"] or args.verbose:
+                marker = "  FLAKY" if is_flaky else ""
+                label = ("  " + name)[:58]
+                print(f"{label:<58} {passes:>3}/{len(ran):<4} "
+                      f"{_timing_columns(entry['times'])}{marker}")
+            elif passes:
+                stable_pass += 1
+            else:
+                stable_fail += 1
+        if stable_pass or stable_fail:
+            print(f"  ... {stable_pass} other test(s) passed every run, "
+                  f"{stable_fail} failed every run")
+        unstable_tasks += len({r.returncode for r in results}) > 1
+    print("-" * width)
+    print(f"{flaky} flaky test(s), {always_failing} failing in every run, "
+          f"{unstable_tasks} evaluator(s) with varying exit status")
+    print()
+    return 1 if flaky or always_failing or unstable_tasks else 0
+
+
+# ── Distributed mode ─────────────────────────────────────────────────────────
+
+# With --serve the runner becomes a coordinator: instead of running
+# evaluate_task() calls on local threads it queues them as jobs and serves
+# them over HTTP to workers (`run_benchmarks.py worker URL`) on any number of
+# hosts.  A job carries the task directory being graded, so a worker needs
+# only a checkout with the same evaluators; its EvalResult comes back as JSON
+# and is reported exactly as a local result would be.  Workers heartbeat the
+# jobs they hold; a job whose worker stays silent for LEASE_SECONDS, or fails
+# with an exception, is handed to another worker, up to MAX_ATTEMPTS times.
+HEARTBEAT_SECONDS = 5
+LEASE_SECONDS = 30
+MAX_ATTEMPTS = 3
+POLL_SECONDS = 1.0
+DEFAULT_WORKER_WAIT = 60
+
+
+def evaluators_digest(bench_dir: Path):
+    """Hash of the runner version and the evaluators/ tree.
+
+    A worker whose digest differs from the coordinator's would grade with
+    different tests, so the coordinator turns it away.
+    """
+    h = hashlib.sha256(f"runner={RUNNER_VERSION}\n".encode())
+    _hash_tree(h, bench_dir / "evaluators")
+    return h.hexdigest()
+
+
+def pack_task(task_dir: Path):
+    """Return task_dir as a base64 tar.gz for a job (empty if it does not exist)."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        if task_dir.is_dir():
+            tar.add(task_dir, arcname=".",
+                    filter=lambda info: None if "__pycache__" in info.name else info)
+    return base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def unpack_task(data: str, dest: Path):
+    """Extract a pack_task() archive into dest."""
+    dest.mkdir(parents=True)
+    with tarfile.open(fileobj=io.BytesIO(base64.b64decode(data)), mode="r:gz") as tar:
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(dest, filter="data")
+        else:
+            tar.extractall(dest)
+
+
+@dataclass
+class _Job:
+    """One evaluate_task() call waiting for, or leased to, a worker."""
+    label: str
+    spec: dict  # what the worker needs: task name, task files, run options
+    future: Future
+    progress: Progress = None
+    attempts: int = 0
+    worker: str = None
+    deadline: float = 0.0
+
+
+class Coordinator:
+    """Executor stand-in that runs evaluate_task() calls on remote workers.
+
+    submit() takes the same arguments as ThreadPoolExecutor.submit(
+    evaluate_task, ...) and returns a Future, so the run modes do not care
+    whether they grade locally or on a fleet.  Per-host settings (toolchain,
+    speed factor, forkserver, cache) are the worker's own.
+    """
+
+    def __init__(self, bench_dir: Path, host: str, port: int):
+        self.digest = evaluators_digest(bench_dir)
+        self.lock = threading.Lock()
+        self.pending = deque()
+        self.leased = {}   # lease token -> _Job
+        self.workers = set()
+        self.next_lease = 0
+        self.server = ThreadingHTTPServer((host, port), _CoordinatorHandler)
+        self.server.daemon_threads = True
+        self.server.coordinator = self
+        self.stopped = threading.Event()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        threading.Thread(target=self._reap, daemon=True).start()
+        print(f"Serving jobs on {self.url}; start workers with: "
+              f"python run_benchmarks.py worker {self.url}", file=sys.stderr)
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        if host in ("", "0.0.0.0", "::"):
+            host = socket.gethostname()
+        return f"http://{host}:{port}"
+
+    @property
+    def slots(self):
+        """Number of worker threads that have taken a job so far."""
+        return len(self.workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def shutdown(self, wait: bool = True):
+        self.stopped.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def submit(self, fn, bench_dir: Path, task_name: str, eval_file: Path,
+               options: RunOptions, progress: Progress = None,
+               tasks_dir: Path = None, label: str = None):
+        if fn is not evaluate_task:
+            raise TypeError("a Coordinator only runs evaluate_task")
+        if tasks_dir is None:
+            tasks_dir = bench_dir / "tasks"
+        spec = {
+            "task": task_name,
+            "label": label or task_name,
+            "files": pack_task(tasks_dir / task_name),
+            "options": {
+                "use_cache": options.use_cache,
+                "store_cache": options.store_cache,
+                "max_output": options.max_output,
+                "max_failures": options.max_failures,
+                "limits": asdict(options.limits),
+                "test_filter": options.test_filter,
+                "isolate": options.isolate,
+            },
+        }
+        job = _Job(label or task_name, spec, Future(), progress)
+        with self.lock:
+            self.pending.append(job)
+        return job.future
+
+    def handle(self, path: str, body: dict):
+        """Serve one request; returns (HTTP status, JSON reply)."""
+        if path == "/lease":
+            if body.get("digest") != self.digest:
+                return 409, {"error": "this worker's runner or evaluators differ from "
+                                      "the coordinator's; update its checkout"}
+            return 200, {"job": self.lease(str(body.get("worker")))}
+        if path == "/heartbeat":
+            self.heartbeat(body.get("leases", {}))
+            return 200, {}
+        if path == "/result":
+            return 200, {"accepted": self.complete(body.get("lease"), body.get("result"),
+                                                   body.get("error"))}
+        return 404, {"error": f"unknown endpoint {path}"}
+
+    def lease(self, worker: str):
+        """Hand the next pending job to worker, or return None if there is none."""
+        with self.lock:
+            if not self.pending:
+                return None
+            job = self.pending.popleft()
+            job.attempts += 1
+            job.worker = worker
+            job.deadline = time.monotonic() + LEASE_SECONDS
+            self.next_lease += 1
+            token = str(self.next_lease)
+            self.leased[token] = job
+            self.workers.add(worker)
+            return dict(job.spec, lease=token)
+
+    def heartbeat(self, leases: dict):
+        """Extend the given leases; values are the jobs' (passed, failed) counts so far."""
+        now = time.monotonic()
+        with self.lock:
+            for token, (passed, failed) in leases.items():
+                job = self.leased.get(token)
+                if job is None:
+                    continue
+                job.deadline = now + LEASE_SECONDS
+                if job.progress is not None:
+                    job.progress.update(job.label, passed, failed)
+
+    def complete(self, token: str, result: dict = None, error: str = None):
+        """Record a worker's result; False if the lease was already given up on."""
+        with self.lock:
+            job = self.leased.pop(token, None)
+            if job is None:
+                return False
+            if error is not None:
+                reason = error.strip().splitlines()[-1] if error.strip() else "unknown error"
+                self._retry(job, f"worker {job.worker} failed: {reason}")
+                return True
+        self._resolve(job, EvalResult(**result))
+        return True
+
+    def _reap(self):
+        """Requeue jobs whose workers have stopped heartbeating."""
+        while not self.stopped.wait(POLL_SECONDS):
+            now = time.monotonic()
+            with self.lock:
+                for token, job in list(self.leased.items()):
+                    if job.deadline < now:
+                        del self.leased[token]
+                        self._retry(job, f"lost worker {job.worker}")
+
+    def _retry(self, job: _Job, reason: str):
+        """Requeue a job at the front of the queue, or fail it after MAX_ATTEMPTS."""
+        if job.attempts >= MAX_ATTEMPTS:
+            self._resolve(job, EvalResult(
+                stdout="", returncode=2,
+                stderr=f"gave up after {job.attempts} attempts: {reason}"))
+            return
+        self._warn(job, f"warning: {job.label}: {reason}; retrying")
+        self.pending.appendleft(job)
+
+    def _warn(self, job: _Job, message: str):
+        if job.progress is None:
+            print(message, file=sys.stderr)
+            return
+        with job.progress.suspended():
+            print(message, file=sys.stderr)
+
+    def _resolve(self, job: _Job, result: EvalResult):
+        if job.progress is not None:
+            job.progress.finish(job.label)
+        job.future.set_result(result)
+
+
+class _CoordinatorHandler(BaseHTTPRequestHandler):
+    """JSON-over-HTTP front end of a Coordinator: POST /lease, /heartbeat, /result."""
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            status, reply = 400, {"error": "request body is not JSON"}
+        else:
+            status, reply = self.server.coordinator.handle(self.path, body)
+        data = json.dumps(reply).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # one line per poll would drown the report
+
+
+def serve_address(value: str):
+    """argparse type for --serve: "[HOST:]PORT" -> (host, port)."""
+    host, _, port = value.rpartition(":")
+    try:
+        return host or "0.0.0.0", int(port)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected [HOST:]PORT, got {value!r}") from None
+
+
+def open_pool(args, bench_dir: Path):
+    """Where evaluate_task() calls go: local threads, or workers with --serve."""
+    if args.serve:
+        return Coordinator(bench_dir, *args.serve)
+    return ThreadPoolExecutor(max_workers=args.jobs)
+
+
+def _post(url: str, path: str, data: dict):
+    """POST data as JSON to the coordinator and return its decoded reply."""
+    request = urllib.request.Request(url.rstrip("/") + path, data=json.dumps(data).encode(),
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return json.loads(response.read())
+
+
+def run_worker(args, bench_dir: Path):
+    """Run jobs from the coordinator at args.url until it has been gone for args.wait seconds."""
+    use_cache = not args.no_cache
+    cache_dir = bench_dir / CACHE_DIR_NAME
+    base = RunOptions(use_cache=use_cache,
+                      toolchain=load_toolchain(cache_dir, use_cache),
+                      speed_factor=load_calibration(bench_dir, not args.recalibrate)["factor"])
+    if args.forkserver:
+        if forkserver_supported():
+            base.zygote = Zygote()
+        else:
+            print("warning: --forkserver is not supported on this platform; "
+                  "starting evaluators normally", file=sys.stderr)
+    digest = evaluators_digest(bench_dir)
+    eval_files = dict(find_evaluators(bench_dir))
+    name = f"{socket.gethostname()}:{os.getpid()}"
+    print(f"Worker {name}: {args.jobs} slot(s), host speed factor "
+          f"{base.speed_factor:.2f}, coordinator {args.url}")
+
+    # evaluate_task() reports per-test counts to a Progress keyed by label;
+    # jobs run under their lease token, so the heartbeat can relay them.
+    progress = Progress(0, enabled=False)
+    running = set()
+    stop = threading.Event()
+    failures = []
+
+    def heartbeat():
+        while not stop.wait(HEARTBEAT_SECONDS):
+            with progress.lock:
+                leases = {token: progress.running.get(token, (0, 0)) for token in running}
+            if leases:
+                try:
+                    _post(args.url, "/heartbeat", {"leases": leases})
+                except OSError:
+                    pass  # the coordinator retries the job if this keeps failing
+
+    def run_job(job: dict):
+        token, opts = job["lease"], job["options"]
+        options = replace(base, use_cache=use_cache and opts["use_cache"],
+                          store_cache=opts["store_cache"],
+                          max_output=opts["max_output"], max_failures=opts["max_failures"],
+                          limits=ResourceLimits(**opts["limits"]),
+                          test_filter=opts["test_filter"], isolate=opts["isolate"])
+        if options.limits and resource is None:
+            options.limits = ResourceLimits()
+        with progress.lock:
+            running.add(token)
+        try:
+            with tempfile.TemporaryDirectory(prefix="bench_job_") as tmp:
+                tasks_dir = Path(tmp) / "tasks"
+                unpack_task(job["files"], tasks_dir / job["task"])
+                result = evaluate_task(bench_dir, job["task"], eval_files[job["task"]],
+                                       options, progress, tasks_dir, token)
+            body = {"lease": token, "result": asdict(result)}
+            summary = (f"{result.n_passed} passed, {result.n_failed} failed "
+                       f"({_fmt_seconds(result.duration)}"
+                       + (", cached)" if result.cached else ")"))
+        except Exception:
+            body = {"lease": token, "error": traceback.format_exc()}
+            summary = "error: " + body["error"].strip().splitlines()[-1]
+        finally:
+            with progress.lock:
+                running.discard(token)
+        try:
+            _post(args.url, "/result", body)
+        except OSError as e:
+            summary += f"; result not delivered ({e})"
+        print(f"  {job['label']}: {summary}", flush=True)
+
+    def slot(i: int):
+        gone_since = None
+        while not stop.is_set():
+            try:
+                job = _post(args.url, "/lease", {"worker": f"{name}/{i}", "digest": digest})["job"]
+            except urllib.error.HTTPError as e:
+                try:
+                    reason = json.loads(e.read())["error"]
+                except (ValueError, KeyError):
+                    reason = str(e)
+                failures.append(f"coordinator refused this worker: {reason}")
+                stop.set()
+                return
+            except OSError:
+                # Not started yet, or finished: wait for (another) coordinator.
+                now = time.monotonic()
+                gone_since = gone_since or now
+                if args.wait and now - gone_since > args.wait:
+                    return
+                stop.wait(POLL_SECONDS)
+                continue
+            gone_since = None
+            if job is None:
+                stop.wait(POLL_SECONDS)
+            else:
+                run_job(job)
+
+    threading.Thread(target=heartbeat, daemon=True).start()
+    slots = [threading.Thread(target=slot, args=(i,), daemon=True) for i in range(args.jobs)]
+    for t in slots:
+        t.start()
+    try:
+        for t in slots:
+            t.join()
+    finally:
+        stop.set()
+        if base.zygote is not None:
+            base.zygote.close()
+    for message in failures[:1]:
+        print(message, file=sys.stderr)
+    return 1 if failures else 0
+
+
+# ── Profiling ────────────────────────────────────────────────────────────────
+
+def profile_hotspots(profile_dir: Path, task_name: str, scope: Path, top: int = 3):
+    """The `top` functions under scope by cumulative time in a task's .pstats file.
+
+    Returns [(label, cumulative_seconds)] plus the total profiled time, or
+    None when the evaluator wrote no profile (not a Python/harness evaluator).
+    """
+    path = profile_dir / f"{task_name}.pstats"
+    if not path.exists():
+        return None
+    stats = pstats.Stats(str(path)).stats
+    prefix = os.path.realpath(scope) + os.sep
+    in_scope = [(func, ct) for func, (_, _, _, ct, _) in stats.items()
+                if os.path.realpath(func[0]).startswith(prefix)]
+    in_scope.sort(key=lambda item: -item[1])
+    total = max((ct for _, (_, _, _, ct, _) in stats.items()), default=0.0)
+    hot = [(f"{name} ({os.path.basename(filename)}:{lineno})", ct)
+           for (filename, lineno, name), ct in in_scope[:top]]
+    return hot, total
+
+
+def report_profiles(profile_dir: Path, tasks_dir: Path, task_names):
+    """Print where each profiled evaluator spent its time in solution code."""
+    print(f"Profiles in {profile_dir}/ (<task>.pstats, <task>.collapsed):")
+    for task_name in task_names:
+        found = profile_hotspots(profile_dir, task_name, tasks_dir / task_name)
+        if found is None:
+            continue
+        hot, total = found
+        print(f"  {task_name} ({_fmt_seconds(total)} profiled)")
+        if not hot:
+            print("    no time in solution code")
+        for label, seconds in hot:
+            print(f"    {seconds * 1000:>9.1f}ms  {label}")
+
+
+# ── Results history ──────────────────────────────────────────────────────────
+
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id             INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at     TEXT NOT NULL,
+    git_revision   TEXT,
+    hostname       TEXT,
+    runner_version TEXT,
+    speed_factor   REAL
+);
+CREATE TABLE IF NOT EXISTS task_results (
+    run_id    INTEGER NOT NULL REFERENCES runs(id),
+    task      TEXT    NOT NULL,
+    status    TEXT    NOT NULL,
+    passed    INTEGER NOT NULL,
+    failed    INTEGER NOT NULL,
+    duration  REAL,
+    user_time REAL,
+    sys_time  REAL,
+    max_rss   INTEGER,
+    cached    INTEGER NOT NULL,
+    PRIMARY KEY (run_id, task)
+);
+CREATE TABLE IF NOT EXISTS test_results (
+    run_id  INTEGER NOT NULL REFERENCES runs(id),
+    task    TEXT    NOT NULL,
+    test    TEXT    NOT NULL,
+    status  TEXT    NOT NULL,
+    time_ms REAL,
+    norm_ms REAL
+);
+CREATE INDEX IF NOT EXISTS test_results_by_test ON test_results (task, test, run_id);
+"""
+
+# Timings evaluators print: "[PASS] name (12.3ms)" and "[FAIL] name: took 2.50s (...)".
+_PASS_TIMING = re.compile(r"\s*\((\d+(?:\.\d+)?)ms[^)]*\)\s*$")
+_FAIL_TIMING = re.compile(r"took (\d+(?:\.\d+)?)s\b")
+
+
+def split_test_line(status: str, text: str, known=()):
+    """Return (test_name, time_ms or None) for the text after [PASS]/[FAIL].
+
+    Harness-based evaluators end the name with a tab (TEST_DETAIL_SEP), so
+    the name never includes the pass detail or failure message.  For other
+    evaluators a trailing "(12.3ms...)" is stripped from passes, and a
+    failure is matched against the known test names (those seen passing)
+    before falling back to the text up to the first ": ".
+    """
+    if TEST_DETAIL_SEP in text:
+        name, _, detail = text.partition(TEST_DETAIL_SEP)
+        if status == "PASS":
+            m = _PASS_TIMING.match(" " + detail)
+            return name, float(m.group(1)) if m else None
+        name = name[:-1] if name.endswith(":") else name
+        m = _FAIL_TIMING.search(detail)
+        return name, float(m.group(1)) * 1000 if m else None
+    if status == "PASS":
+        m = _PASS_TIMING.search(text)
+        if m:
+            return text[:m.start()], float(m.group(1))
+        return text, None
+    name = max((n for n in known if text.startswith(n + ": ")), key=len, default=None)
+    if name is None:
+        name = text.partition(": ")[0]
+    m = _FAIL_TIMING.search(text[len(name):])
+    return name, float(m.group(1)) * 1000 if m else None
+
+
+def known_test_names(results):
+    """Names of the tests that passed in any of results, for split_test_line()."""
+    return {split_test_line("PASS", text)[0] for r in results for text in r.passed}
+
+
+def display_test_line(line: str):
+    """An evaluator output line with the name/detail separator shown as a space."""
+    return line.replace(":" + TEST_DETAIL_SEP, ": ").replace(TEST_DETAIL_SEP, " ")
+
+
+def history_path(args, bench_dir: Path):
+    return Path(args.history) if args.history else bench_dir / HISTORY_FILE_NAME
+
+
+# Columns added after the first release of the schema: (table, column, type).
+HISTORY_COLUMNS = [
+    ("runs", "speed_factor", "REAL"),
+    ("test_results", "norm_ms", "REAL"),
+]
+
+
+def open_history(path: Path):
+    con = sqlite3.connect(str(path), timeout=30)
+    con.executescript(HISTORY_SCHEMA)
+    for table, column, kind in HISTORY_COLUMNS:
+        existing = {row[1] for row in con.execute(f"PRAGMA table_info({table})")}
+        if column not in existing:
+            con.execute(f"ALTER TABLE {table} ADD COLUMN {column} {kind}")
+    return con
+
+
+def git_revision(bench_dir: Path):
+    try:
+        proc = subprocess.run(["git", "rev-parse", "HEAD"], cwd=str(bench_dir),
+                              capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return proc.stdout.strip() or None
+
+
+def record_run(path: Path, bench_dir: Path, summary_rows, speed_factor: float = None):
+    """Store one run's task and test results; returns the new run id.
+
+    Cached results are recorded at task level only, so replayed timings do
+    not masquerade as fresh measurements in the trends.  Test timings are
+    stored raw and, given the host's speed_factor, normalised to the
+    reference machine.
+    """
+    con = open_history(path)
+    with con:
+        cur = con.execute(
+            "INSERT INTO runs (started_at, git_revision, hostname, runner_version, "
+            "speed_factor) VALUES (?, ?, ?, ?, ?)",
+            (time.strftime("%Y-%m-%dT%H:%M:%S"), git_revision(bench_dir),
+             socket.gethostname(), RUNNER_VERSION, speed_factor))
+        run_id = cur.lastrowid
+        for task, p, f, status, r in summary_rows:
+            con.execute(
+                "INSERT INTO task_results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, task, status, p, f, r.duration, r.user_time, r.sys_time,
+                 r.max_rss, int(r.cached)))
+            if r.cached:
+                continue
+            known = known_test_names([r]) | {name for name, in con.execute(
+                "SELECT DISTINCT test FROM test_results WHERE task = ?", (task,))}
+            for test_status, lines in (("PASS", r.passed), ("FAIL", r.failed)):
+                for text in lines:
+                    name, ms = split_test_line(test_status, text, known)
+                    norm = ms / speed_factor if ms is not None and speed_factor else None
+                    con.execute("INSERT INTO test_results VALUES (?, ?, ?, ?, ?, ?)",
+                                (run_id, task, name, test_status, ms, norm))
+    con.close()
+    return run_id
+
+
+def load_duration_estimates(path: Path, window: int = 5):
+    """Expected wall time of each task: the median of its last `window` fresh runs."""
+    if not path.exists():
+        return {}
+    con = open_history(path)
+    rows = con.execute(
+        "SELECT task, duration FROM task_results "
+        "WHERE cached = 0 AND duration IS NOT NULL ORDER BY run_id")
+    samples = {}
+    for task, seconds in rows:
+        samples.setdefault(task, []).append(seconds)
+    con.close()
+    return {task: statistics.median(values[-window:]) for task, values in samples.items()}
+
+
+def longest_first(task_names, estimates: dict):
+    """Order task names for longest-processing-time-first scheduling.
+
+    Tasks with no recorded duration are assumed to be as slow as the slowest
+    known one, so a new and possibly expensive evaluator starts early rather
+    than becoming the tail of the run.  Ties keep name order.
+    """
+    default = max(estimates.values(), default=0.0)
+    return sorted(task_names, key=lambda name: -estimates.get(name, default))
+
+
+def packing_report(results, jobs: int, wall: float):
+    """Describe how well a run's evaluators were packed onto the worker pool."""
+    durations = [r.duration for r in results if not r.cached]
+    if not durations or wall <= 0:
+        return "Schedule: every result replayed from the cache"
+    total, longest = sum(durations), max(durations)
+    bound = max(longest, total / jobs)
+    useful = math.ceil(total / longest) if longest else 1
+    return (f"Schedule: {jobs} worker(s), longest first: wall {_fmt_seconds(wall)}, "
+            f"lower bound {_fmt_seconds(bound)} ({bound / wall:.0%} efficient)\n"
+            f"  evaluator time {_fmt_seconds(total)}, critical path {_fmt_seconds(longest)}; "
+            f"more than {useful} worker(s) cannot shorten this run")
+
+
+def detect_regression(samples, threshold: float, min_change: float):
+    """Compare the newest sample with the ones before it.
+
+    Returns (baseline_mean, change_ratio, flagged).  The latest value is
+    flagged when it lies more than `threshold` standard errors of prediction
+    above the baseline mean and is at least `min_change` slower in relative
+    terms; the second condition keeps very stable timings from flagging
+    sub-millisecond jitter.
+    """
+    *baseline, latest = samples
+    mean = statistics.mean(baseline)
+    change = (latest - mean) / mean if mean else 0.0
+    if len(baseline) < 3:
+        return mean, change, False
+    sd = statistics.stdev(baseline)
+    if sd == 0:
+        return mean, change, change >= min_change
+    t = (latest - mean) / (sd * math.sqrt(1 + 1 / len(baseline)))
+    return mean, change, t > threshold and change >= min_change
+
+
+def _sparkline(values):
+    ticks = "▁▂▃▄▅▆▇█"
+    lo, hi = min(values), max(values)
+    span = (hi - lo) or 1.0
+    return "".join(ticks[int((v - lo) / span * (len(ticks) - 1))] for v in values)
+
+
+def report_history(args, bench_dir: Path):
+    """The `report` subcommand: per-test timing trends and regression flags."""
+    path = history_path(args, bench_dir)
+    if not path.exists():
+        print(f"No history recorded yet ({path}).")
+        return 1
+    con = open_history(path)
+
+    # Normalised test timings stay comparable when the history mixes hosts;
+    # runs recorded before calibration existed only have the raw time.
+    series = {}
+    rows = con.execute(
+        "SELECT task, test, COALESCE(norm_ms, time_ms) FROM test_results "
+        "WHERE time_ms IS NOT NULL ORDER BY run_id")
+    for task, test, ms in rows:
+        series.setdefault((task, test), []).append(ms)
+    # Whole-evaluator wall time catches machine-level slowdowns too.
+    rows = con.execute(
+        "SELECT task, duration FROM task_results "
+        "WHERE cached = 0 AND duration IS NOT NULL ORDER BY run_id")
+    for task, seconds in rows:
+        series.setdefault((task, "(evaluator wall time)"), []).append(seconds * 1000)
+    n_runs = con.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+    con.close()
+
+    if args.task:
+        series = {k: v for k, v in series.items() if args.task in k[0]}
+    if not series:
+        print("No timings recorded" + (f" for '{args.task}'" if args.task else "") + ".")
+        return 1
+
+    width = 110
+    print(f"Timing trends over {n_runs} run(s), baseline = previous {args.window} samples; "
+          f"test times normalised to the reference machine\n")
+    print(f"{'Task / test':<58} {'Runs':>5} {'Latest':>10} {'Baseline':>10} "
+          f"{'Change':>8}  Trend")
+    print("-" * width)
+    regressions = 0
+    current_task = None
+    for (task, test), values in sorted(series.items()):
+        if task != current_task:
+            print(task)
+            current_task = task
+        recent = values[-(args.window + 1):]
+        latest = recent[-1]
+        if len(recent) > 1:
+            mean, change, flagged = detect_regression(recent, args.threshold, args.min_change)
+            baseline, change_text = f"{mean:.1f}ms", f"{change:+.0%}"
+        else:
+            flagged, baseline, change_text = False, "-", "-"
+        regressions += flagged
+        marker = "  SLOWER" if flagged else ""
+        label = ("  " + test)[:58]
+        print(f"{label:<58} {len(values):>5} {latest:>8.1f}ms {baseline:>10} "
+              f"{change_text:>8}  {_sparkline(recent)}{marker}")
+    print("-" * width)
+    print(f"{regressions} significant slowdown(s) "
+          f"(>{args.threshold} std. errors and >{args.min_change:.0%} slower)")
+    return 1 if regressions else 0
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run CodeAgentBench evaluations")
     parser.add_argument("--task", help="Filter to tasks whose name contains this string")
+    parser.add_argument("--test", metavar="PATTERN",
+                        help="Run only tests whose name contains PATTERN (shell wildcards "
+                             "allowed); honoured by evaluators built on evaluators/harness")
     parser.add_argument("--verbose", "-v", action="store_true",
                         help="Show every [PASS]/[FAIL] line")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Number of evaluators to run in parallel (default: 1)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-run every evaluator instead of replaying cached results")
+    parser.add_argument("--recalibrate", action="store_true",
+                        help="Re-measure this host's speed factor instead of using the "
+                             "cached one")
+    parser.add_argument("--max-failures", type=int, metavar="N",
+                        help="Stop an evaluator once N of its tests have failed")
+    parser.add_argument("--max-output", type=int, metavar="LINES", default=DEFAULT_MAX_OUTPUT,
+                        help="Lines of evaluator output to keep besides [PASS]/[FAIL] "
+                             f"lines (default: {DEFAULT_MAX_OUTPUT})")
+    parser.add_argument("--forkserver", action="store_true",
+                        help="Fork Python evaluators from a warm preloaded process "
+                             "instead of starting a fresh interpreter for each")
+    parser.add_argument("--isolate", action="store_true",
+                        help="Run the timed checks of every harness-based evaluator in "
+                             "forked children that are killed at their deadline (some "
+                             "evaluators always do)")
+    parser.add_argument("--repeat", type=int, metavar="K", default=1,
+                        help="Run every evaluator K times and report per-test pass "
+                             "rates, flaky tests and timing spread (not cached or "
+                             "recorded in the history)")
+    parser.add_argument("--profile", metavar="DIR", nargs="?", const=DEFAULT_PROFILE_DIR,
+                        help="Run Python evaluators under cProfile and write "
+                             "<task>.pstats and <task>.collapsed (flamegraph input) "
+                             f"to DIR (default: {DEFAULT_PROFILE_DIR}); results are "
+                             "not cached or recorded in the history")
+    parser.add_argument("--submissions", metavar="DIR",
+                        help="Grade each subdirectory of DIR as its own tasks/ tree and "
+                             "print a submission x task results matrix (not recorded "
+                             "in the history)")
+    parser.add_argument("--serve", metavar="[HOST:]PORT", type=serve_address,
+                        help="Coordinate instead of running evaluators: serve them as "
+                             "jobs to `run_benchmarks.py worker` processes and report "
+                             "their results (--jobs and --forkserver are per worker)")
+    limits = parser.add_argument_group(
+        "resource limits", "Per-evaluator rlimits; an evaluator that exceeds one is "
+        "reported as OOM, CPU, FILES, PROCS or FSIZE instead of FAIL")
+    limits.add_argument("--limit-cpu", type=int, metavar="SECONDS",
+                        help="CPU time per evaluator")
+    limits.add_argument("--limit-memory", type=int, metavar="MB",
+                        help="Address space per evaluator process (the JVM, .NET and "
+                             "Node reserve far more than they use)")
+    limits.add_argument("--limit-files", type=int, metavar="N",
+                        help="Open file descriptors per evaluator process")
+    limits.add_argument("--limit-procs", type=int, metavar="N",
+                        help="Processes for the user running the evaluator "
+                             "(RLIMIT_NPROC; has no effect as root)")
+    limits.add_argument("--limit-fsize", type=int, metavar="MB",
+                        help="Size of any file an evaluator writes")
+    parser.add_argument("--history", metavar="PATH",
+                        help=f"SQLite results history (default: {HISTORY_FILE_NAME})")
+    parser.add_argument("--no-history", action="store_true",
+                        help="Do not record this run in the results history")
+
+    subparsers = parser.add_subparsers(dest="command", metavar="{report,worker}")
+    report_parser = subparsers.add_parser(
+        "report", help="Show per-test timing trends and flag slowdowns")
+    report_parser.add_argument("--task", help="Filter to tasks whose name contains this string")
+    report_parser.add_argument("--history", metavar="PATH",
+                               help=f"SQLite results history (default: {HISTORY_FILE_NAME})")
+    report_parser.add_argument("--window", type=int, default=10,
+                               help="Number of earlier samples in the rolling baseline "
+                                    "(default: 10)")
+    report_parser.add_argument("--threshold", type=float, default=3.0,
+                               help="Standard errors above baseline that count as a "
+                                    "slowdown (default: 3.0)")
+    report_parser.add_argument("--min-change", type=float, default=0.10,
+                               help="Minimum relative slowdown to flag (default: 0.10)")
+    worker_parser = subparsers.add_parser(
+        "worker", help="Run evaluators for a coordinator started with --serve")
+    worker_parser.add_argument("url", help="Coordinator URL, e.g. http://grader-1:8765")
+    worker_parser.add_argument("--jobs", "-j", type=int, default=1,
+                               help="Number of jobs to run at once (default: 1)")
+    worker_parser.add_argument("--no-cache", action="store_true",
+                               help="Re-run every job instead of replaying cached results")
+    worker_parser.add_argument("--recalibrate", action="store_true",
+                               help="Re-measure this host's speed factor instead of using "
+                                    "the cached one")
+    worker_parser.add_argument("--forkserver", action="store_true",
+                               help="Fork Python evaluators from a warm preloaded process")
+    worker_parser.add_argument("--wait", type=int, metavar="SECONDS",
+                               default=DEFAULT_WORKER_WAIT,
+                               help="Exit once the coordinator has been unreachable this "
+                                    f"long; 0 waits forever (default: {DEFAULT_WORKER_WAIT})")
     args = parser.parse_args()
 
     bench_dir = Path(__file__).parent
+    if args.command == "report":
+        sys.exit(report_history(args, bench_dir))
+    if args.command == "worker":
+        if args.jobs < 1:
+            parser.error("--jobs must be at least 1")
+        sys.exit(run_worker(args, bench_dir))
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.max_failures is not None and args.max_failures < 1:
+        parser.error("--max-failures must be at least 1")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.repeat > 1 and args.submissions:
+        parser.error("--repeat cannot be combined with --submissions")
+    if args.profile and (args.repeat > 1 or args.submissions):
+        parser.error("--profile cannot be combined with --repeat or --submissions")
+    if args.serve and (args.profile or args.forkserver):
+        parser.error("--serve cannot be combined with --profile or --forkserver")
+    if args.profile:
+        args.no_history = True
+    options = RunOptions(use_cache=not args.no_cache, max_output=args.max_output,
+                         max_failures=args.max_failures, test_filter=args.test,
+                         isolate=args.isolate)
+    mb = 2**20
+    options.limits = ResourceLimits(
+        cpu=args.limit_cpu,
+        memory=args.limit_memory * mb if args.limit_memory else None,
+        files=args.limit_files, procs=args.limit_procs,
+        fsize=args.limit_fsize * mb if args.limit_fsize else None)
+    if any(v is not None and v < 1 for v in asdict(options.limits).values()):
+        parser.error("resource limits must be at least 1")
+    if not args.serve:
+        # Workers probe and calibrate their own hosts.
+        options.toolchain = load_toolchain(bench_dir / CACHE_DIR_NAME, options.use_cache)
+        calibration = load_calibration(bench_dir, not args.recalibrate)
+        options.speed_factor = calibration["factor"]
+    if args.profile:
+        options.profile_dir = Path(args.profile)
+        options.use_cache = False
+    if options.limits and resource is None:
+        print("warning: resource limits are not supported on this platform; "
+              "running evaluators without them", file=sys.stderr)
+        options.limits = ResourceLimits()
+
     evaluators = find_evaluators(bench_dir, args.task)
 
     if not evaluators:
         print("No evaluators found" + (f" matching '{args.task}'" if args.task else "") + ".")
         sys.exit(1)
 
-    print(f"Running {len(evaluators)} task(s)...\n")
-
-    summary_rows = []
-    total_passed = total_failed = 0
-
-    for task_name, eval_file in evaluators:
-        print(f"  {task_name}")
-        stdout, stderr, returncode = run_evaluator(eval_file)
+    if args.forkserver:
+        if forkserver_supported():
+            options.zygote = Zygote()
+        else:
+            print("warning: --forkserver is not supported on this platform; "
+                  "starting evaluators normally", file=sys.stderr)
 
-        if returncode == 2:
-            # Runtime unavailable or hard error
-            msg = stderr.strip().splitlines()[0] if stderr.strip() else "could not run"
-            print(f"    [SKIP] {msg}")
-            summary_rows.append((task_name, 0, 0, "SKIP"))
-            continue
+    if args.submissions or args.repeat > 1:
+        run_mode = run_batch if args.submissions else run_repeat
+        try:
+            code = run_mode(args, bench_dir, evaluators, options)
+        finally:
+            if options.zygote is not None:
+                options.zygote.close()
+        sys.exit(code)
 
-        passed, failed = parse_results(stdout)
+    print(f"Running {len(evaluators)} task(s)...")
+    if args.serve:
+        print("Perf limits are scaled by each worker's own host speed factor\n")
+    else:
+        print(f"Host speed factor {options.speed_factor:.2f} (reference workload "
+              f"{calibration['seconds'] * 1000:.1f}ms); perf limits are scaled by it\n")
 
-        if args.verbose or failed:
-            for line in stdout.strip().splitlines():
-                print(f"    {line}")
-            if stderr.strip() and (args.verbose or returncode != 0):
-                for line in stderr.strip().splitlines()[:5]:
-                    print(f"    STDERR: {line}")
-        else:
-            print(f"    {len(passed)} passed, {len(failed)} failed")
+    summary_rows = []
+    total_passed = total_failed = limit_hits = errors = 0
+    progress = Progress(len(evaluators))
 
-        total_passed += len(passed)
-        total_failed += len(failed)
-        status = "OK" if not failed else "FAIL"
-        summary_rows.append((task_name, len(passed), len(failed), status))
+    # Evaluators are independent subprocesses, so a thread pool (or, with
+    # --serve, a Coordinator feeding remote workers) is enough to overlap
+    # them.  They are submitted longest-first (by their durations in the
+    # history) so slow evaluators do not end up as the tail of the run, but
+    # results are consumed in name order so the report is identical to a
+    # sequential run whatever the completion order.
+    estimates = load_duration_estimates(history_path(args, bench_dir))
+    eval_files = dict(evaluators)
+    t0 = time.monotonic()
+    with open_pool(args, bench_dir) as pool:
+        futures = {
+            task_name: pool.submit(evaluate_task, bench_dir, task_name,
+                                   eval_files[task_name], options, progress)
+            for task_name in longest_first(eval_files, estimates)
+        }
+        for task_name, _ in evaluators:
+            result = futures[task_name].result()
+            with progress.suspended():
+                row = report_result(task_name, result, args.verbose)
+            summary_rows.append(row + (result,))
+            limit_hits += bool(result.limit)
+            errors += row[3] == "ERROR"
+            total_passed += row[1]
+            total_failed += row[2]
+    wall = time.monotonic() - t0
+    progress.close()
+    if options.zygote is not None:
+        options.zygote.close()
 
     # Summary table
-    print("\n" + "=" * 65)
+    width = 103
+    print("\n" + "=" * width)
     print("SUMMARY")
-    print("=" * 65)
-    print(f"{'Task':<38} {'Pass':>6} {'Fail':>6} {'Status':>8}")
-    print("-" * 65)
-    for name, p, f, status in summary_rows:
-        print(f"{name:<38} {p:>6} {f:>6} {status:>8}")
-    print("-" * 65)
-    print(f"{'TOTAL':<38} {total_passed:>6} {total_failed:>6}")
+    print("=" * width)
+    print(f"{'Task':<38} {'Pass':>6} {'Fail':>6} {'Status':>8} "
+          f"{'Wall':>9} {'User':>9} {'Sys':>9} {'MaxRSS':>9}")
+    print("-" * width)
+    for name, p, f, status, r in summary_rows:
+        print(f"{name:<38} {p:>6} {f:>6} {status:>8} "
+              f"{_fmt_seconds(r.duration):>9} {_fmt_seconds(r.user_time):>9} "
+              f"{_fmt_seconds(r.sys_time):>9} {_fmt_bytes(r.max_rss):>9}")
+    print("-" * width)
+    results = [r for *_, r in summary_rows]
+    print(f"{'TOTAL':<38} {total_passed:>6} {total_failed:>6} {'':>8} "
+          f"{_fmt_seconds(sum(r.duration for r in results)):>9} "
+          f"{_fmt_seconds(sum(r.user_time for r in results)):>9} "
+          f"{_fmt_seconds(sum(r.sys_time for r in results)):>9} "
+          f"{_fmt_bytes(max(r.max_rss for r in results)):>9}")
     print()
+    print(packing_report(results, pool.slots if args.serve else args.jobs, wall))
+    print()
+    if options.profile_dir is not None:
+        report_profiles(options.profile_dir, bench_dir / "tasks", [name for name, _ in evaluators])
+        print()
+
+    if not args.no_history:
+        record_run(history_path(args, bench_dir), bench_dir, summary_rows, options.speed_factor)
 
-    sys.exit(0 if total_failed == 0 else 1)
+    sys.exit(0 if total_failed == 0 and not limit_hits and not errors else 1)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,29 @@
 import csv
-from typing import List, Dict
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Union
+
+
+@dataclass
+class SalesColumns:
+    """The sales data stored column by column rather than as a dict per row.
+
+    quantity and unit_price hold one number per row.  category, customer_id
+    and month hold one integer code per row, indexing the matching list of
+    names: row i's category is categories[category[i]], and its month is a
+    "YYYY-MM" string.  Codes may use any integer array typecode.
+    """
+    quantity: array = field(default_factory=lambda: array('q'))
+    unit_price: array = field(default_factory=lambda: array('d'))
+    category: array = field(default_factory=lambda: array('B'))
+    customer_id: array = field(default_factory=lambda: array('I'))
+    month: array = field(default_factory=lambda: array('H'))
+    categories: List[str] = field(default_factory=list)
+    customer_ids: List[str] = field(default_factory=list)
+    months: List[str] = field(default_factory=list)
+
+
+Rows = Union[Iterable[Dict], SalesColumns]
 
 
 def load_data(filepath: str) -> List[Dict]:
@@ -20,11 +44,39 @@ def load_data(filepath: str) -> List[Dict]:
     raise NotImplementedError
 
 
-def total_revenue_by_category(data: List[Dict]) -> Dict[str, float]:
+def iter_rows(filepath: str) -> Iterator[Dict]:
+    """Yield the rows of the CSV one at a time, converted as in load_data().
+
+    Only the current row may be held in memory, so files far larger than
+    RAM can be processed.
+
+    Args:
+        filepath: Absolute or relative path to the CSV file.
+
+    Yields:
+        One dict per CSV row.
+    """
+    raise NotImplementedError
+
+
+def load_columns(filepath: str) -> SalesColumns:
+    """Load the CSV into a SalesColumns table in a single pass.
+
+    Args:
+        filepath: Absolute or relative path to the CSV file.
+
+    Returns:
+        The table, with rows in file order.
+    """
+    raise NotImplementedError
+
+
+def total_revenue_by_category(data: Rows) -> Dict[str, float]:
     """Return total revenue (quantity * unit_price) grouped by category.
 
     Args:
-        data: List of row dicts from load_data().
+        data: Row dicts from load_data() or iter_rows(), read in one pass,
+              or a SalesColumns table from load_columns().
 
     Returns:
         Dict mapping category name → total revenue.
@@ -32,11 +84,12 @@ def total_revenue_by_category(data: List[Dict]) -> Dict[str, float]:
     raise NotImplementedError
 
 
-def top_customers(data: List[Dict], n: int) -> List[str]:
+def top_customers(data: Rows, n: int) -> List[str]:
     """Return the IDs of the top n customers ranked by total spend (desc).
 
     Args:
-        data: List of row dicts from load_data().
+        data: Row dicts from load_data() or iter_rows(), read in one pass,
+              or a SalesColumns table from load_columns().
         n:    Number of customers to return.
 
     Returns:
@@ -45,11 +98,12 @@ def top_customers(data: List[Dict], n: int) -> List[str]:
     raise NotImplementedError
 
 
-def monthly_sales_trend(data: List[Dict]) -> Dict[str, float]:
+def monthly_sales_trend(data: Rows) -> Dict[str, float]:
     """Return total revenue per calendar month, sorted by month ascending.
 
     Args:
-        data: List of row dicts from load_data().
+        data: Row dicts from load_data() or iter_rows(), read in one pass,
+              or a SalesColumns table from load_columns().
 
     Returns:
         Dict mapping "YYYY-MM" strings → total revenue, sorted by key.
@@ -57,11 +111,12 @@ def monthly_sales_trend(data: List[Dict]) -> Dict[str, float]:
     raise NotImplementedError
 
 
-def average_order_value(data: List[Dict]) -> float:
+def average_order_value(data: Rows) -> float:
     """Return the mean revenue per order row, rounded to 2 decimal places.
 
     Args:
-        data: List of row dicts from load_data().
+        data: Row dicts from load_data() or iter_rows(), read in one pass,
+              or a SalesColumns table from load_columns().
 
     Returns:
         Average order value rounded to 2 dp, or 0.0 if data is empty.
@@ -0,0 +1,16 @@
+"""Tests for the evaluator harness."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "evaluators"))
+from harness import NEAR_LIMIT_FACTOR, Failure, TimingFailure, timing_failure  # noqa: E402
+
+
+def test_near_miss_is_timing_dependent():
+    assert isinstance(timing_failure("slow", 1.5, 1.0), TimingFailure)
+    assert isinstance(timing_failure("slow", NEAR_LIMIT_FACTOR, 1.0), TimingFailure)
+
+
+def test_clear_miss_is_a_plain_failure():
+    failure = timing_failure("slow", NEAR_LIMIT_FACTOR * 1.01, 1.0)
+    assert type(failure) is Failure
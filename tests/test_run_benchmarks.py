@@ -0,0 +1,42 @@
+"""Tests for the runner's resource-limit handling."""
+import signal
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import run_benchmarks as rb  # noqa: E402
+
+resource = pytest.importorskip("resource")
+
+DIED = "test process died without a result"
+
+
+@pytest.mark.parametrize("limits, returncode, text, status", [
+    (rb.ResourceLimits(cpu=2), -signal.SIGXCPU, "", "CPU"),
+    (rb.ResourceLimits(cpu=2), 1, f"fibonacci(40) fast:\t{DIED} (killed by SIGXCPU)", "CPU"),
+    (rb.ResourceLimits(fsize=1), 1, f"big write:\t{DIED} (killed by SIGXFSZ)", "FSIZE"),
+    (rb.ResourceLimits(memory=8 << 20), 127,
+     "python3: error while loading shared libraries: libc.so.6: failed to map segment",
+     "OOM"),
+    # Only limits that were set count.
+    (rb.ResourceLimits(memory=8 << 20), 1, f"x:\t{DIED} (killed by SIGXCPU)", None),
+    (rb.ResourceLimits(cpu=2), 0, "killed by SIGXCPU", None),
+])
+def test_limit_exceeded(limits, returncode, text, status):
+    assert rb.limit_exceeded(limits, returncode, text) == status
+
+
+def test_crash_without_results_is_an_error():
+    result = rb.EvalResult("", "Traceback (most recent call last):", 1)
+    assert rb.report_result("task_x", result, False)[3] == "ERROR"
+
+
+def test_limits_applied_through_exec_wrapper(tmp_path):
+    script = tmp_path / "evaluate.py"
+    script.write_text("import resource\n"
+                      "print(resource.getrlimit(resource.RLIMIT_NOFILE)[0])\n")
+    result = rb.run_evaluator(script, rb.RunOptions(limits=rb.ResourceLimits(files=64)))
+    assert result.returncode == 0
+    assert result.stdout.strip() == "64"